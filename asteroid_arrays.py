@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import numpy as np
+
+
+# Dieses Modul speichert die Bewegungsdaten vieler Asteroiden als Struct-of-Arrays in NumPy-Arrays. Statt für jeden Asteroiden
+# einzeln einen neuen Vektor zu konstruieren und jede Polarkoordinate einzeln zu drehen, werden alle Mitten und Winkel mit
+# wenigen vektorisierten Operationen pro Tick aktualisiert. Die Zeilen sind lückenlos: Zeile i gehört zum i-ten Asteroiden.
+
+
+# Klassen
+
+# Diese Klasse enthält die Mitten, Bewegungen, Rotationen und Polarkoordinaten von Asteroiden in NumPy-Arrays:
+class AsteroidArrays:
+
+    def __init__(self, capacity: int = 64, corners: int = 11) -> None:
+        self.count = 0 # die Anzahl der belegten Zeilen
+        self.centers = np.zeros((capacity, 2)) # die Mitten (x, y)
+        self.mots = np.zeros((capacity, 2)) # die Bewegungen (x, y)
+        self.rots = np.zeros(capacity) # die Rotationen pro Tick
+        self.thetas = np.zeros((capacity, corners)) # die Winkel der Polarkoordinaten (aufgefüllt bis zur breitesten Zeile)
+        self.radii = np.zeros((capacity, corners)) # die Radien der Polarkoordinaten
+        self.corners = np.zeros(capacity, dtype=np.int64) # wie viele Polarkoordinaten in jeder Zeile gültig sind
+        self.bounds = np.zeros(capacity) # der größte Radius jeder Zeile (der Radius des umschließenden Kreises)
+        self.__vertices: np.ndarray | None = None # die zwischengespeicherten kartesischen Ecken (None, wenn veraltet)
+
+
+    # Diese Methode fügt einen Asteroiden hinzu und gibt seine Zeile zurück:
+    def add(self, center: tuple[float, float], mot: tuple[float, float], rot: float, thetas: list[float],
+            radii: list[float]) -> int:
+        if self.count == len(self.rots):
+            self.__grow_rows() # die Kapazität verdoppeln
+        if len(thetas) > self.thetas.shape[1]:
+            self.__grow_columns(len(thetas))
+        row = self.count
+        k = len(thetas)
+        self.centers[row] = center
+        self.mots[row] = mot
+        self.rots[row] = rot
+        self.thetas[row, :k] = thetas
+        self.thetas[row, k:] = 0.0
+        self.radii[row, :k] = radii
+        self.radii[row, k:] = 0.0
+        self.corners[row] = k
+        self.bounds[row] = max(radii)
+        self.count += 1
+        self.__vertices = None
+        return row
+
+
+    # Diese Methode wird einmal pro Tick aufgerufen und bewegt und dreht alle Asteroiden auf einmal:
+    def update(self) -> None:
+        n = self.count
+        self.centers[:n] += self.mots[:n]
+        self.thetas[:n] += self.rots[:n, None] # auch die aufgefüllten Spalten werden gedreht, sie werden aber nie gelesen
+        self.__vertices = None
+
+
+    # Diese Methode bewegt einen einzelnen Asteroiden:
+    def move(self, row: int, x: float, y: float) -> None:
+        self.centers[row, 0] += x
+        self.centers[row, 1] += y
+        self.__vertices = None
+
+
+    # Diese Methode dreht einen einzelnen Asteroiden:
+    def rotate(self, row: int, angle: float) -> None:
+        self.thetas[row] += angle
+        self.__vertices = None
+
+
+    # Diese Methode setzt die Mitte eines einzelnen Asteroiden:
+    def set_center(self, row: int, x: float, y: float) -> None:
+        self.centers[row] = (x, y)
+        self.__vertices = None
+
+
+    # Diese Methode behält nur die übergebenen Zeilen (in dieser Reihenfolge) und schiebt sie lückenlos nach vorne:
+    def keep(self, rows: list[int]) -> None:
+        if len(rows) == self.count and rows == list(range(self.count)):
+            return # es wurde nichts entfernt
+        index = np.array(rows, dtype=np.int64)
+        n = len(rows)
+        for a in (self.centers, self.mots, self.rots, self.thetas, self.radii, self.corners, self.bounds):
+            a[:n] = a[index] # Fancy-Indexing kopiert, daher überschreibt die Zuweisung keine noch benötigten Zeilen
+        self.count = n
+        self.__vertices = None
+
+
+    # Diese Methode entfernt alle Asteroiden:
+    def clear(self) -> None:
+        self.count = 0
+        self.__vertices = None
+
+
+    # Diese Methode gibt die kartesischen Ecken aller Asteroiden als Array der Form (Anzahl, Ecken, 2) zurück. Sie werden pro
+    # Tick nur einmal für alle Asteroiden gemeinsam berechnet:
+    def vertices(self) -> np.ndarray:
+        if self.__vertices is None:
+            n = self.count
+            thetas = self.thetas[:n]
+            radii = self.radii[:n]
+            vertices = np.empty((n, thetas.shape[1], 2))
+            vertices[:, :, 0] = radii * np.cos(thetas) + self.centers[:n, 0, None]
+            vertices[:, :, 1] = radii * np.sin(thetas) + self.centers[:n, 1, None]
+            self.__vertices = vertices
+        return self.__vertices
+
+
+    # Diese Methode gibt die Umrisse aller Asteroiden zurück: pro Zeile eine Liste von (x, y)-Listen. Alle Umrisse werden mit einem
+    # einzigen tolist() aus dem Array geholt, statt für jeden Asteroiden einzeln:
+    def outlines(self) -> list[list[list[float]]]:
+        return [v[:k] for (v, k) in zip(self.vertices().tolist(), self.corners[:self.count].tolist())]
+
+
+    # Diese Methode gibt für jede Zeile die Mitte und den Winkel der ersten Ecke als Liste [x, y, Winkel] zurück:
+    def poses(self) -> list[list[float]]:
+        n = self.count
+        return np.column_stack((self.centers[:n], self.thetas[:n, 0])).tolist()
+
+
+    # Diese Methode gibt die kartesischen Ecken eines Asteroiden als Liste von (x, y)-Listen zurück:
+    def cartesian(self, row: int) -> list[list[float]]:
+        return self.vertices()[row, :self.corners[row]].tolist()
+
+
+    # Diese Methode verdoppelt die Anzahl der Zeilen:
+    def __grow_rows(self) -> None:
+        capacity = max(1, 2 * len(self.rots))
+        self.centers = self.__resized(self.centers, capacity)
+        self.mots = self.__resized(self.mots, capacity)
+        self.rots = self.__resized(self.rots, capacity)
+        self.thetas = self.__resized(self.thetas, capacity)
+        self.radii = self.__resized(self.radii, capacity)
+        self.corners = self.__resized(self.corners, capacity)
+        self.bounds = self.__resized(self.bounds, capacity)
+
+
+    # Diese Methode verbreitert die Arrays der Polarkoordinaten:
+    def __grow_columns(self, corners: int) -> None:
+        for name in ('thetas', 'radii'):
+            old = getattr(self, name)
+            new = np.zeros((old.shape[0], corners))
+            new[:, :old.shape[1]] = old
+            setattr(self, name, new)
+
+
+    # Diese Methode gibt eine vergrößerte Kopie eines Arrays zurück:
+    @staticmethod
+    def __resized(a: np.ndarray, capacity: int) -> np.ndarray:
+        new = np.zeros((capacity,) + a.shape[1:], dtype=a.dtype)
+        new[:len(a)] = a
+        return new
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 # Fremde Imports
 
+import itertools
 import json
 import math
 import pygame
@@ -16,21 +17,65 @@ from typing import Callable
 
 import sounds
 
+from autosave import Autosaver, write_atomic
+from collision import (SpatialHash, any_point_in_circle, convex_decomposition, hash_positions, inner_radius, point_in_polygon,
+                       polygons_intersect, segment_crosses_polygon, segment_distance_squared)
+from dirty_rects import DirtyRects, circle_rect, present
+from hud import Hud
+from pools import Pool, compact
+from profiler import FrameProfiler
+from recording import BANK_POINTS_BIT, FIRE_BIT, LEFT_BIT, RIGHT_BIT, THRUST_BIT, Recording, save_recording
+from snapshot import SnapshotError, SnapshotReader, SnapshotWriter
+from sprites import SpriteCache
+from startup import StartupTimer
+
+try:
+    from asteroid_arrays import AsteroidArrays # optional, braucht NumPy
+except ImportError:
+    AsteroidArrays = None
+
+try:
+    from hit_kernel import first_hit # optional, braucht NumPy
+except ImportError:
+    first_hit = None
+
 
 # Klassen
 
-# Diese Klasse repräsentiert einen Vektor aus zwei Koordinaten:
+# Diese Klasse repräsentiert einen Vektor aus zwei Koordinaten. Wie alle Klassen, von denen es viele Objekte gibt, hat sie
+# __slots__ statt eines __dict__ pro Objekt, was Speicher und Zeit beim Zugriff auf die Attribute spart. Die Methoden ohne „i“
+# geben neue Vektoren zurück; die Methoden mit „i“ (wie „+=“) verändern den Vektor selbst und dürfen deshalb nur auf Vektoren
+# angewendet werden, die kein anderes Objekt mitbenutzt:
 class Vector:
 
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: float, y: float) -> None:
         self.x = x
         self.y = y
-        self.tup = (x, y) # ein Tupel aus beiden Koordinaten
+
+
+    # ein Tupel aus beiden Koordinaten:
+    @property
+    def tup(self) -> tuple[float, float]:
+        return (self.x, self.y)
+
+
+    # Diese Methode setzt beide Koordinaten dieses Vektors selbst (z. B. für ein Objekt aus einem Pool):
+    def set(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
 
     
     # Diese Methode addiert einen Vektor zu diesem und gibt das Ergebnis als neuen Vektor zurück:
     def add(self, v: Vector) -> Vector:
         return Vector(self.x + v.x, self.y + v.y)
+
+
+    # Diese Methode addiert einen Vektor zu diesem Vektor selbst:
+    def iadd(self, v: Vector) -> None:
+        self.x += v.x
+        self.y += v.y
     
 
     # Diese Methode subtrahiert einen Vektor von diesem Vektor und gibt das Ergebnis als neuen Vektor zurück:
@@ -43,6 +88,12 @@ class Vector:
         return Vector(self.x * f, self.y * f)
 
 
+    # Diese Methode multipliziert diesen Vektor selbst mit einem Faktor:
+    def imult(self, f: float) -> None:
+        self.x *= f
+        self.y *= f
+
+
     # Diese Methode setzt die Magnitüde dieses Vektors und gibt das Ergebnis als neuen Vektor zurück:
     def set_mag(self, mag: float) -> Vector:
         prev_mag = self.mag()
@@ -59,6 +110,15 @@ class Vector:
             return self.set_mag(max_mag)
         else:
             return Vector(self.x, self.y)
+
+
+    # Diese Methode reduziert die Magnitüde dieses Vektors selbst auf einen Maximalwert, wenn sie diesen überschreitet (mit
+    # denselben Rechenschritten wie limit() und set_mag(), also mit genau denselben Werten):
+    def ilimit(self, max_mag: float) -> None:
+        mag = self.mag()
+        if mag > max_mag:
+            self.x = self.x * max_mag / mag
+            self.y = self.y * max_mag / mag
     
 
     # Diese Methode gibt die Magnitüde dieses Vektors zurück:
@@ -82,10 +142,18 @@ class Vector:
 # Diese Klasse repräsentiert eine Polarkoordinate aus einem Winkel (Theta) und einem Radius:
 class PolarCoordinate:
 
+    __slots__ = ('theta', 'radius')
+
     def __init__(self, theta: float, radius: float) -> None:
         self.theta = theta
         self.radius = radius
 
+
+    # Diese Methode setzt den Winkel und den Radius dieser Polarkoordinate selbst:
+    def set(self, theta: float, radius: float) -> None:
+        self.theta = theta
+        self.radius = radius
+
     
     # Diese Methode gibt den dieser Polarkoordinate entsprechenden kartesischen Vektor zurück:
     def cartesian(self) -> Vector:
@@ -104,51 +172,113 @@ class PolarCoordinate:
 
 # Diese Klasse repräsentiert ein Polygon mit eine Mitte und Polarkoordinaten:
 class Polygon:
+
+    __slots__ = ('__center', 'polar_coordinates', 'stroke_weight', 'visible', 'shape', '__bounding_radius', 'pieces', 'inner',
+                 '__cartesian', '__points')
     
     def __init__(self, center: Vector, polar_coordinates: tuple[PolarCoordinate], stroke_weight: int, visible: bool) -> None:
         self.center = center # die Mitte des Polygons
         self.polar_coordinates = polar_coordinates # die Polarkoordinaten des Polygons
         self.stroke_weight = stroke_weight # die Dicke der Umrandung
         self.visible = visible # ob das Polygon sichtbar ist
+        self.shape = next(SHAPES) # eine eindeutige Nummer für die Form (s. SpriteCache)
+        # der Radius des umschließenden Kreises (er ändert sich nicht, weil beim Drehen nur die Winkel verändert werden):
+        self.__bounding_radius = max(c.radius for c in polar_coordinates)
+        self.pieces: tuple[tuple[int, ...], ...] | None = None # die konvexe Zerlegung (wird bei Bedarf berechnet)
+        self.inner = 0.0 # der Radius des Inkreises (wird zusammen mit der Zerlegung berechnet)
+
+
+    # die Mitte des Polygons. Wenn sie neu gesetzt wird, sind die zwischengespeicherten kartesischen Koordinaten veraltet:
+    @property
+    def center(self) -> Vector:
+        return self.__center
+
+
+    @center.setter
+    def center(self, center: Vector) -> None:
+        self.__center = center
+        self.__cartesian = None
+        self.__points = None
 
 
-    # Diese Methode gibt ein Tupel aus den kartesischen Koordinaten dieses Polygons zurück:
+    # Diese Methode gibt ein Tupel aus den kartesischen Koordinaten dieses Polygons zurück. Sie werden nur einmal berechnet und
+    # dann zwischengespeichert, bis das Polygon bewegt oder gedreht wird. Die Vektoren dürfen deshalb nicht verändert werden:
     def cartesian(self) -> tuple[Vector]:
-        # jede Koordinate in eine kartesische Koordinate umrechnen, in einem Tupel speichern und zurückgeben:
-        return tuple(c.cartesian().add(self.center) for c in self.polar_coordinates)
+        if self.__cartesian is None:
+            # jede Koordinate in eine kartesische Koordinate umrechnen und in einem Tupel speichern:
+            self.__cartesian = tuple(c.cartesian().add(self.center) for c in self.polar_coordinates)
+        return self.__cartesian
 
 
-    # Diese Methode gibt zurück, ob ein Vektor in diesem Polygon liegt:
-    def vector_in(self, vector: Vector) -> bool:
-        cartesian = self.cartesian()
-        if len(cartesian) < 3:
+    # Diese Methode gibt den Radius des kleinsten Kreises um die Mitte zurück, der das ganze Polygon enthält:
+    def bounding_radius(self) -> float:
+        return self.__bounding_radius
+
+
+    # Diese Methode gibt zurück, ob die Strecke von (x0, y0) nach (x1, y1) dieses Polygon berührt, ob also ein Punkt, der sich
+    # in einem Tick entlang der Strecke bewegt hat, dabei irgendwann im Polygon war. Dass sich das Polygon währenddessen auch
+    # gedreht hat, wird vernachlässigt:
+    def segment_in(self, x0: float, y0: float, x1: float, y1: float) -> bool:
+        # Verfehlt die Strecke den umschließenden Kreis, kann sie das Polygon nicht berühren:
+        center = self.center
+        radius = self.bounding_radius()
+        if segment_distance_squared(center.x, center.y, x0, y0, x1, y1) > radius * radius:
             return False
-        count = 0
-        for i in range(len(cartesian)):
-            v1 = cartesian[i]
-            v2 = cartesian[(i + 1) % len(cartesian)]
-            if ((v1.y > vector.y) != (v2.y > vector.y)) and (vector.x < (v2.x - v1.x) * (vector.y - v1.y) / (v2.y - v1.y) + v1.x):
-                count += 1
-        return count % 2 == 1
+        points = self.points()
+        # Liegt der Endpunkt im Polygon oder schneidet die Strecke eine Kante, ist es getroffen (liegt nur der Anfangspunkt im
+        # Polygon, schneidet die Strecke zwangsläufig eine Kante):
+        return point_in_polygon(points, x1, y1) or segment_crosses_polygon(points, x0, y0, x1, y1)
+
+
+    # Diese Methode gibt die Ecken und als letzten Punkt die Mitte dieses Polygons als Tupel zurück. Wie die kartesischen
+    # Koordinaten werden sie zwischengespeichert. Die Tupel werden direkt berechnet, ohne für jede Ecke Vektoren zu konstruieren
+    # (mit denselben Rechenschritten wie PolarCoordinate.cartesian() und Vector.add(), also mit genau denselben Werten):
+    def points(self) -> list[tuple[float, float]]:
+        if self.__points is None:
+            (cx, cy) = self.center.tup
+            self.__points = [(c.radius * math.cos(c.theta) + cx, c.radius * math.sin(c.theta) + cy) for c in self.polar_coordinates]
+            self.__points.append((cx, cy))
+        return self.__points
+
 
+    # Diese Methode gibt die konvexe Zerlegung dieses Polygons zurück. Sie wird nur einmal berechnet, weil sich die Form beim
+    # Bewegen und Drehen nicht verändert:
+    def convex_pieces(self) -> tuple[tuple[int, ...], ...]:
+        if self.pieces is None:
+            points = self.points()
+            self.pieces = convex_decomposition(points)
+            self.inner = inner_radius(points)
+        return self.pieces
 
-    # Diese Methode gibt zurück, ob dieses Polygon mit einem anderen Polygon kollidiert:
+
+    # Diese Methode gibt den Radius des größten Kreises um die Mitte zurück, der ganz in diesem Polygon liegt:
+    def inner_radius(self) -> float:
+        self.convex_pieces() # der Radius wird zusammen mit der konvexen Zerlegung berechnet
+        return self.inner
+
+
+    # Diese Methode gibt zurück, ob dieses Polygon mit einem anderen Polygon kollidiert. Es werden auch Überschneidungen erkannt,
+    # bei denen sich nur Kanten kreuzen:
     def collides_with_polygon(self, polygon: Polygon) -> bool:
-        # prüfen, ob ein Vektor des anderen Polygons in diesem Polygon liegt:
-        for v in polygon.cartesian():
-            if self.vector_in(v):
-                return True
-        # prüfen, ob ein Vektor dieses Polygons im anderen Polygon liegt:
-        for v in self.cartesian():
-            if polygon.vector_in(v):
-                return True
-        return False # Wenn keine Kollision erkannt wurde, „falsch“ zurückgeben
+        # Wenn sich die umschließenden Kreise nicht überschneiden, können sich auch die Polygone nicht überschneiden:
+        if self.center.distance(polygon.center) > self.bounding_radius() + polygon.bounding_radius():
+            return False
+        (a, b) = (self.points(), polygon.points())
+        # Liegt eine Ecke im Inkreis des anderen Polygons, überschneiden sie sich sicher (der häufige Fall bei einem Treffer):
+        if any_point_in_circle(a, b[-1][0], b[-1][1], polygon.inner_radius()) or \
+                any_point_in_circle(b, a[-1][0], a[-1][1], self.inner_radius()):
+            return True
+        # sonst die konvexen Teile beider Polygone mit dem Trennachsensatz gegeneinander prüfen:
+        return polygons_intersect(a, self.convex_pieces(), b, polygon.convex_pieces())
     
 
     # Diese Methode rotiert dieses Polygon:
     def rotate(self, angle: float) -> None:
         for c in self.polar_coordinates: # den Winkel zu den Winkeln aller Polarkoordinaten addieren
             c.theta += angle
+        # die zwischengespeicherten kartesischen Koordinaten sind jetzt veraltet:
+        self.__cartesian = None
+        self.__points = None
 
     
     # Diese Methode bewegt dieses Polygon:
@@ -156,12 +286,19 @@ class Polygon:
         self.center = self.center.add(vector) # den Vektor zur Mitte dieses Polygons addieren
 
     
-    # Diese Methode rendert dieses Polygon:
-    def render(self, screen: pygame.Surface) -> None:
+    # Diese Methode gibt die Ecken dieses Polygons (ohne die Mitte) als Punkte zurück:
+    def outline(self) -> list[tuple[float, float]]:
+        return self.points()[:-1]
+
+
+    # Diese Methode rendert dieses Polygon, auf Wunsch um (dx, dy) verschoben (s. GameWorld.render()). Der ganze Umriss wird mit
+    # einem einzigen Aufruf von pygame.draw.lines() gezeichnet statt mit einem Aufruf pro Kante:
+    def render(self, screen: pygame.Surface, dx: float = 0.0, dy: float = 0.0) -> None:
         if self.visible: # wenn dieses Polygon sichtbar ist
-            vectors = self.cartesian()
-            for i in range(len(vectors)):
-                pygame.draw.line(screen, Color.WHITE, vectors[i].tup, vectors[(i + 1) % len(vectors)].tup, self.stroke_weight)
+            points = self.outline()
+            if dx != 0.0 or dy != 0.0:
+                points = [(x + dx, y + dy) for (x, y) in points]
+            pygame.draw.lines(screen, Color.WHITE, True, points, self.stroke_weight)
 
 
     # Diese Methode gibt ein Dictionary mit den Werten dieses Polygons zurück:
@@ -174,11 +311,83 @@ class Polygon:
         }
 
 
+# Diese Klasse repräsentiert ein Polygon, dessen Mitte und Polarkoordinaten in einer Zeile von AsteroidArrays liegen. Es
+# verhält sich wie ein normales Polygon, aber Bewegen und Drehen verändern nur die Arrays:
+class ArrayPolygon(Polygon):
+
+    __slots__ = ('arrays', 'row')
+
+    def __init__(self, arrays: AsteroidArrays, row: int, stroke_weight: int, visible: bool, shape: int) -> None:
+        self.arrays = arrays
+        self.row = row # die Zeile in den Arrays
+        self.stroke_weight = stroke_weight # die Dicke der Umrandung
+        self.visible = visible # ob das Polygon sichtbar ist
+        self.shape = shape # die Nummer der Form des Polygons, aus dem dieses entstanden ist
+        self.pieces: tuple[tuple[int, ...], ...] | None = None # die konvexe Zerlegung (wird bei Bedarf berechnet)
+        self.inner = 0.0 # der Radius des Inkreises (wird zusammen mit der Zerlegung berechnet)
+
+
+    # die Mitte des Polygons als neuer Vektor:
+    @property
+    def center(self) -> Vector:
+        (x, y) = self.arrays.centers[self.row].tolist()
+        return Vector(x, y)
+
+
+    @center.setter
+    def center(self, center: Vector) -> None:
+        self.arrays.set_center(self.row, center.x, center.y)
+
+
+    # die Polarkoordinaten des Polygons als neue Objekte (Änderungen an ihnen wirken sich nicht auf die Arrays aus):
+    @property
+    def polar_coordinates(self) -> tuple[PolarCoordinate]:
+        k = self.arrays.corners[self.row]
+        thetas = self.arrays.thetas[self.row, :k].tolist()
+        radii = self.arrays.radii[self.row, :k].tolist()
+        return tuple(PolarCoordinate(t, r) for (t, r) in zip(thetas, radii))
+
+
+    # Diese Methode gibt den Radius des kleinsten Kreises um die Mitte zurück, der das ganze Polygon enthält:
+    def bounding_radius(self) -> float:
+        return float(self.arrays.bounds[self.row])
+
+
+    # Diese Methode gibt ein Tupel aus den kartesischen Koordinaten dieses Polygons zurück. Sie werden einmal pro Tick für alle
+    # Polygone in den Arrays gemeinsam berechnet:
+    def cartesian(self) -> tuple[Vector]:
+        return tuple(Vector(x, y) for (x, y) in self.arrays.cartesian(self.row))
+
+
+    # Diese Methode gibt die Ecken dieses Polygons (ohne die Mitte) als Punkte zurück:
+    def outline(self) -> list[list[float]]:
+        return self.arrays.cartesian(self.row)
+
+
+    # Diese Methode gibt die Ecken und als letzten Punkt die Mitte dieses Polygons als Tupel zurück:
+    def points(self) -> list[tuple[float, float]]:
+        points = [(x, y) for (x, y) in self.arrays.cartesian(self.row)]
+        points.append(tuple(self.arrays.centers[self.row].tolist()))
+        return points
+
+
+    # Diese Methode rotiert dieses Polygon:
+    def rotate(self, angle: float) -> None:
+        self.arrays.rotate(self.row, angle)
+
+
+    # Diese Methode bewegt dieses Polygon:
+    def move(self, vector: Vector) -> None:
+        self.arrays.move(self.row, vector.x, vector.y)
+
+
 # TODO kommentieren
 
 # Diese Klasse repräsentiert das Raumschiff des Spielers:
 class Player:
 
+    __slots__ = ('body', 'thrust', 'turning_angle', 'mot', 'ticks')
+
     def __init__(self, body: Polygon | None, thrust: Polygon | None, turning_angle: float, mot: Vector | None, ticks: int) -> None:
         # der Körper des Spielers:
         self.body = body
@@ -216,54 +425,54 @@ class Player:
         self.turning_angle = min(self.turning_angle + 0.01, MAX_TURNING_SPEED)
 
 
-    # Diese Methode aktualisiert die Bewegung dieses Spielers:
+    # Diese Methode aktualisiert die Bewegung dieses Spielers (ohne neue Vektoren zu konstruieren):
     def foreward(self) -> None:
-        acc = PolarCoordinate(self.body.polar_coordinates[0].theta, 0.5).cartesian() # das, was zur Bewegung hinzukommt
-        self.mot = self.mot.add(acc)
-        self.mot = self.mot.limit(MAX_SPEED) # die Bewegung begrenzen
+        theta = self.body.polar_coordinates[0].theta
+        mot = self.mot
+        mot.x += 0.5 * math.cos(theta) # das, was zur Bewegung hinzukommt
+        mot.y += 0.5 * math.sin(theta)
+        mot.ilimit(MAX_SPEED) # die Bewegung begrenzen
 
 
     # Diese Methode kümmert sich um die Ränder. Wenn der Spieler an den Seiten das Fenster verlässt, wird er auf die andere Seite
     # teleportiert:
     def edges(self) -> None:
-        if self.body.center.x < -30:
-            new_x = self.body.center.x + WIDTH + 60
-            self.body.center.x = new_x
-            self.thrust.center.x = new_x
-        elif self.body.center.x > WIDTH + 30:
-            new_x = self.body.center.x - WIDTH - 60
-            self.body.center.x = new_x
-            self.thrust.center.x = new_x
-        if self.body.center.y < -30:
-            new_y = self.body.center.y + HEIGHT + 60
-            self.body.center.y = new_y
-            self.thrust.center.y = new_y
-        elif self.body.center.y > HEIGHT + 30:
-            new_y = self.body.center.y - HEIGHT - 60
-            self.body.center.y = new_y
-            self.thrust.center.y = new_y
-
-
-    # Diese Methode wird einmal pro Tick aufgerufen und aktualisiert die Position und die Drehung des Spielers:
-    def update(self) -> None:
+        center = self.body.center
+        x = center.x
+        y = center.y
+        if x < -30:
+            x = x + WIDTH + 60
+        elif x > WIDTH + 30:
+            x = x - WIDTH - 60
+        if y < -30:
+            y = y + HEIGHT + 60
+        elif y > HEIGHT + 30:
+            y = y - HEIGHT - 60
+        if x != center.x or y != center.y:
+            # neue Vektoren setzen (statt die alten zu verändern), damit die zwischengespeicherten Koordinaten erneuert werden:
+            self.body.center = Vector(x, y)
+            self.thrust.center = Vector(x, y)
+
+
+    # Diese Methode wird einmal pro Tick aufgerufen und aktualisiert die Position und die Drehung des Spielers. Die Eingabe wird
+    # übergeben, damit der Spieler auch ohne Tastatur (z. B. in der Headless-Simulation) gesteuert werden kann:
+    def update(self, player_input: PlayerInput) -> None:
         self.turning_angle *= TURNING_FRICTION # die Drehung mit Reibung abbremsen
-        self.mot = self.mot.limit(self.mot.mag() * FRICTION) # die Bewegung abbremsen
+        self.mot.ilimit(self.mot.mag() * FRICTION) # die Bewegung abbremsen
 
-        # wenn der Spieler die Taste W oder die Pfeiltaste nach oben drückt:
-        if pygame.key.get_pressed()[pygame.K_w] or pygame.key.get_pressed()[pygame.K_UP]:
+        # wenn der Spieler Schub gibt:
+        if player_input.thrust:
             self.foreward() # Vorwärts!
             self.thrust.visible = True # den Schub sichtbar machen
         else:
             self.thrust.visible = False # den Schub unsichtbar machen
         
-        # wenn die Taste A oder die Pfeiltaste nach links gedrückt sind:
-        if pygame.key.get_pressed()[pygame.K_a] or pygame.key.get_pressed()[pygame.K_LEFT]:
-            # wenn weder die Taste D noch die Pfeiltaste nach rechts gedrückt ist:
-            if not (pygame.key.get_pressed()[pygame.K_d] or pygame.key.get_pressed()[pygame.K_RIGHT]):
+        # wenn der Spieler nach links, aber nicht gleichzeitig nach rechts lenkt:
+        if player_input.left:
+            if not player_input.right:
                 self.turn_left()
-        # wenn weder die Taste A noch die Pfeiltaste nach links gedrückt ist, dafür aber die Taste D oder die
-        # Pfeiltaste nach rechts:
-        elif pygame.key.get_pressed()[pygame.K_d] or pygame.key.get_pressed()[pygame.K_RIGHT]:
+        # wenn der Spieler nur nach rechts lenkt:
+        elif player_input.right:
             self.turn_right()
 
         # den Körper und den Schub des Raumschiffs drehen:
@@ -279,12 +488,13 @@ class Player:
 
 
     # Diese Methode rendert diesen Spieler:
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface, alpha: float = 0.0) -> None:
         # Wenn der Spieler erst kürzer als die Unbesiegbarkeitszeit existiert, wird er blinkend angezeigt:
         if self.ticks >= INVINCIBILITY_TIME or self.ticks % (FPS // 3) in range(FPS // 6):
-            self.body.render(screen)
+            (dx, dy) = (self.mot.x * alpha, self.mot.y * alpha)
+            self.body.render(screen, dx, dy)
             if self.ticks % (FPS // 10) in range(FPS // 20): # auch der Schub wird (schneller) blinkend angezeigt
-                self.thrust.render(screen)
+                self.thrust.render(screen, dx, dy)
 
     
     # Diese Funktion gibt ein Dictionary mit den Werten dieses Spielers zurück:
@@ -313,6 +523,8 @@ class AsteroidSize:
 # Diese Klasse repräsentiert einen Asteroiden:
 class Asteroid:
 
+    __slots__ = ('size', 'body', 'mot_angle', 'mot', 'rot', 'hit_by')
+
     def __init__(self, size: AsteroidSize, body: Polygon, mot_angle: float, mot: Vector, rot: float, hit_by: int) -> None:
         self.size = size
         self.body = body
@@ -328,23 +540,40 @@ class Asteroid:
         self.body.rotate(self.rot)
 
     
-    # Diese Methode prüft, ob dieser Asteroid von einer Kugel getroffen wird:
-    def check_hit(self, bullets: list[Bullet], by: int) -> None:
-        for b in bullets:
-            if self.body.vector_in(b.pos): # wenn dieser Asteroid von der Kugel getroffen wird
-                self.hit_by = by 
-                bullets.remove(b) # die Kugel aus der Liste entfernen
-                break # Es ist nicht weiter nötig zu prüfen, ob dieser Asteroid getroffen wird
+    # Diese Methode prüft, ob dieser Asteroid von einer Kugel getroffen wird (entlang des ganzen Wegs der Kugel im letzten Tick,
+    # s. Bullet.hits()). Wenn ein räumlicher Hash der Kugeln übergeben wird, werden nur die Kugeln exakt geprüft, die im Umkreis
+    # des Asteroiden liegen (vergrößert um die Strecke, die Kugel und Asteroid in einem Tick zusammen zurücklegen können). Die
+    # treffende Kugel wird als „dead“ markiert und am Ende des Ticks aus ihrer Liste entfernt (s. GameWorld.step()):
+    def check_hit(self, bullets: list[Bullet], by: int, grid: SpatialHash | None = None) -> None:
+        if len(bullets) == 0:
+            return # Ohne Kugeln kann der Asteroid nicht getroffen werden
+        if grid is None:
+            candidates = bullets
+        else:
+            center = self.body.center
+            reach = grid.reach + math.sqrt(self.mot.x * self.mot.x + self.mot.y * self.mot.y)
+            candidates = grid.query(center.x, center.y, self.body.bounding_radius() + reach)
+        b = find_hit(candidates, self.body, self.mot)
+        if b is not None: # wenn dieser Asteroid von der Kugel getroffen wird
+            self.hit_by = by
+            b.dead = True
+            if grid is not None:
+                grid.remove(b) # die Kugel aus dem räumlichen Hash entfernen, damit sie keinen weiteren Asteroiden trifft
 
 
     # Diese Methode rendert diesen Asteroiden:
-    def render(self, screen: pygame.Surface) -> None:
-        self.body.render(screen)
+    def render(self, screen: pygame.Surface, alpha: float = 0.0) -> None:
+        self.body.render(screen, self.mot.x * alpha, self.mot.y * alpha)
 
     
     # Diese Methode prüft, ob dieser Asteroid aus dem Fenster verschwunden ist:
     def offscreen(self) -> bool:
         return self.body.center.distance(CENTER) > ASTEROID_DESPAWN_DISTANCE
+
+
+    # Diese Methode gibt zurück, ob dieser Asteroid zu entfernen ist (weil er getroffen worden ist oder zu weit weg ist):
+    def to_remove(self) -> bool:
+        return self.hit_by != 0 or self.offscreen()
     
 
     # Diese Methode gibt ein Dictionary aus den Werten dieses Asteroiden zurück:
@@ -380,6 +609,8 @@ class SaucerSize:
 # Diese Klasse repräsentiert eine fliegende Untertasse
 class Saucer:
 
+    __slots__ = ('size', 'body', 'mot', 'speed', 'steps', 'ticks', 'hit_by')
+
     def __init__(self, size: SaucerSize, body: Polygon, mot: Vector, speed: float, steps: int, ticks: int, hit_by: int) -> None:
         self.size = size
         self.body = body
@@ -403,34 +634,36 @@ class Saucer:
         return True
 
     
-    # Diese Methode wird bei jedem Tick aufgerufen und aktualisiert diese fliegende Untertasse:
-    def update(self) -> None:
+    # Diese Methode wird bei jedem Tick aufgerufen und aktualisiert diese fliegende Untertasse. Das neue Ziel wird mit dem
+    # Zufallsgenerator der Spielwelt bestimmt:
+    def update(self, rng: random.Random) -> None:
         self.body.move(self.mot)
         if self.ticks == self.steps: # Wenn die fliegende Untertasse an ihrem Ziel angekommen ist, neues Ziel anvisieren
             self.ticks = -1
-            self.steps = random.randint(SAUCER_MIN_STEPS, SAUCER_MAX_STEPS)
-            self.mot = PolarCoordinate(random.random() * 2 * math.pi, self.speed).cartesian()
+            self.steps = rng.randint(SAUCER_MIN_STEPS, SAUCER_MAX_STEPS)
+            self.mot = PolarCoordinate(rng.random() * 2 * math.pi, self.speed).cartesian()
         self.ticks += 1
 
     
-    # Diese Methode prüft, ob diese fliegende Untertasse von einer Kugel getroffen worden ist:
+    # Diese Methode prüft, ob diese fliegende Untertasse von einer Kugel getroffen worden ist (s. Asteroid.check_hit()):
     def check_hit(self, bullets: list[Bullet], by: int) -> None:
-        for b in bullets:
-            if self.body.vector_in(b.pos):
-                self.hit_by = by
-                bullets.remove(b)
-                break
+        b = find_hit(bullets, self.body, self.mot)
+        if b is not None:
+            self.hit_by = by
+            b.dead = True
     
 
     # Diese Methode rendert diese fliegende Untertasse:
-    def render(self, screen: pygame.Surface) -> None:
-        self.body.render(screen) # die Umrandung anzeigen
+    def render(self, screen: pygame.Surface, alpha: float = 0.0) -> None:
+        (dx, dy) = (self.mot.x * alpha, self.mot.y * alpha)
+        self.body.render(screen, dx, dy) # die Umrandung anzeigen
         
         # die zwei Linien, die von links nach rechts gezeichnet werden:
-        l1a = self.body.polar_coordinates[1].cartesian().add(self.body.center).tup
-        l1b = self.body.polar_coordinates[6].cartesian().add(self.body.center).tup
-        l2a = self.body.polar_coordinates[2].cartesian().add(self.body.center).tup
-        l2b = self.body.polar_coordinates[5].cartesian().add(self.body.center).tup
+        vectors = self.body.cartesian()
+        l1a = (vectors[1].x + dx, vectors[1].y + dy)
+        l1b = (vectors[6].x + dx, vectors[6].y + dy)
+        l2a = (vectors[2].x + dx, vectors[2].y + dy)
+        l2b = (vectors[5].x + dx, vectors[5].y + dy)
         
         # die zwei Linien zeichnen:
         pygame.draw.line(screen, Color.WHITE, l1a, l1b, self.size.stroke_weight)
@@ -454,23 +687,37 @@ class Saucer:
 # die von einer fliegenden Untertasse abgeschossen wurde, erbt von dieser Klasse:
 class Bullet:
 
+    __slots__ = ('pos', 'mot', 'dead')
+
     def __init__(self, pos: Vector, mot: Vector) -> None:
-        self.pos = pos # Position
+        self.pos = pos # Position (gehört nur dieser Kugel, weil sie beim Aktualisieren verändert wird)
         self.mot = mot # Bewegung (motion)
+        self.dead = False # ob die Kugel in diesem Tick etwas getroffen hat (dann wird sie am Ende des Ticks entfernt)
 
     
     # Diese Methode wird einmal pro Tick aufgerufen und aktualisiert diese Kugel:
     def update(self) -> None:
-        self.pos = self.pos.add(self.mot) # die Bewegung zur Position addieren
+        self.pos.iadd(self.mot) # die Bewegung zur Position addieren
 
     
     # Diese Methode rendert diese Kugel:
-    def render(self, screen: pygame.Surface) -> None:
-        pygame.draw.circle(screen, Color.WHITE, self.pos.tup, BULLET_RADIUS) # die Kugel auf das Fenster zeichnen
+    def render(self, screen: pygame.Surface, alpha: float = 0.0) -> None:
+        # die Kugel auf das Fenster zeichnen:
+        pygame.draw.circle(screen, Color.WHITE, (self.pos.x + self.mot.x * alpha, self.pos.y + self.mot.y * alpha), BULLET_RADIUS)
          
 
+    # Diese Methode gibt zurück, ob diese Kugel im letzten Tick ein Polygon getroffen hat, das sich dabei um „mot“ bewegt hat.
+    # Geprüft wird die ganze Strecke, die die Kugel relativ zum Polygon zurückgelegt hat, nicht nur ihre neue Position, damit
+    # auch schnelle Kugeln nicht durch kleine Asteroiden hindurchfliegen:
+    def hits(self, polygon: Polygon, mot: Vector) -> bool:
+        (x, y) = (self.pos.x, self.pos.y)
+        return polygon.segment_in(x - self.mot.x + mot.x, y - self.mot.y + mot.y, x, y)
+
+
     # Diese Methode gibt zurück, ob diese Kugel zu entfernen ist:
     def to_remove(self) -> bool:
+        if self.dead: # hat etwas getroffen
+            return True
         if self.pos.x < -30: # über den linken Fensterrand hinaus
             return True
         if self.pos.x > WIDTH + 30: # über den rechten Fensterrand hinaus
@@ -493,6 +740,8 @@ class Bullet:
 # Diese Klasse repräsentiert eine Kugel, die von einer fliegenden Untertasse abgeschossen wurde:
 class SaucerBullet(Bullet):
 
+    __slots__ = ('lifetime', 'ticks')
+
     def __init__(self, pos: Vector, mot: Vector, lifetime: int, ticks: int) -> None:
         super().__init__(pos, mot)
         self.lifetime = lifetime # wie viele Ticks die Kugel existiert
@@ -524,6 +773,8 @@ class SaucerBullet(Bullet):
 # Diese Klasse repräsentiert ein Fragment. Ein Fragment entsteht, wenn ein Spieler oder eine fliegende Untertasse zerstört wird:
 class Fragment:
 
+    __slots__ = ('lines', 'ticks')
+
     def __init__(self, lines: list[Line], ticks: int) -> str:
         self.lines = lines
         self.ticks = ticks
@@ -537,9 +788,14 @@ class Fragment:
 
 
     # Diese Methode rendert dieses Fragment:
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface, alpha: float = 0.0) -> None:
         for l in self.lines: # alle Linien rendern
-            l.render(screen)
+            l.render(screen, alpha)
+
+
+    # Diese Methode gibt zurück, ob dieses Fragment zu entfernen ist (nachdem es eine Sekunde angezeigt wurde):
+    def to_remove(self) -> bool:
+        return self.ticks >= FPS
 
     
     # Diese Methode gibt ein Dictionary mit den Werten dieses Fragments zurück:
@@ -553,6 +809,8 @@ class Fragment:
 # Diese Klasse repräsentiert eine Linie mit einem Mittelpunkt, zwei Polarkoordinaten, einer Bewegung und einer Rotation:
 class Line:
 
+    __slots__ = ('center', 'center_to_a', 'center_to_b', 'mot', 'rot', 'stroke_weight')
+
     def __init__(self, center: Vector, center_to_a: PolarCoordinate, center_to_b: PolarCoordinate, mot: Vector, rot: float,
                  stroke_weight: int) -> None:
         self.center = center # der Mittelpunkt
@@ -569,17 +827,20 @@ class Line:
         self.center_to_a.theta += self.rot
         self.center_to_b.theta += self.rot
 
-        self.center = self.center.add(self.mot) # bewegen
+        self.center.iadd(self.mot) # bewegen
         
         self.rot *= FRICTION # die Rotation abbremsen
-        self.mot = self.mot.mult(FRICTION) # die Bewegung abbremsen
+        self.mot.imult(FRICTION) # die Bewegung abbremsen
 
     
     # Diese Methode rendert diese Linie:
-    def render(self, screen: pygame.Surface) -> None:
-        a = self.center_to_a.cartesian().add(self.center).tup # der Punkt A als Tupel
-        b = self.center_to_b.cartesian().add(self.center).tup # der Punkt B als Tupel
-        pygame.draw.line(screen, Color.WHITE, a, b, self.stroke_weight)
+    def render(self, screen: pygame.Surface, alpha: float = 0.0) -> None:
+        # die Punkte direkt als Tupel berechnen, ohne dafür Vektoren und Polarkoordinaten zu konstruieren:
+        cx = self.center.x + self.mot.x * alpha
+        cy = self.center.y + self.mot.y * alpha
+        (a, b) = (self.center_to_a, self.center_to_b)
+        pygame.draw.line(screen, Color.WHITE, (a.radius * math.cos(a.theta) + cx, a.radius * math.sin(a.theta) + cy),
+                         (b.radius * math.cos(b.theta) + cx, b.radius * math.sin(b.theta) + cy), self.stroke_weight)
 
 
     # Diese Methode gibt ein Dictionary mit den Werten dieser Linie zurück:
@@ -597,6 +858,8 @@ class Line:
 # Diese Klasse repräsentiert eine Explosion aus mehreren Partikeln, die beim Sprengen eines kleinen Asteroiden entsteht:
 class Explosion:
 
+    __slots__ = ('particles',)
+
     def __init__(self, particles: list[Particle]) -> None:
         self.particles = particles
 
@@ -608,9 +871,9 @@ class Explosion:
     
 
     # Diese Methode rendert diese Explosion:
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface, alpha: float = 0.0) -> None:
         for p in self.particles:
-            p.render(screen) # alle Partikel rendern
+            p.render(screen, alpha) # alle Partikel rendern
 
     
     # Diese Methode gibt zurück, ob diese Explosion zu entfernen ist:
@@ -628,6 +891,8 @@ class Explosion:
 # Diese Klasse repräsentiert ein Partikel, aus dem Explosionen bestehen
 class Particle:
 
+    __slots__ = ('pos', 'mot', 'ticks', 'lifetime')
+
     def __init__(self, pos: Vector, mot: Vector, ticks: int, lifetime: int) -> None:
         self.pos = pos
         self.mot = mot
@@ -637,14 +902,16 @@ class Particle:
     
     # Diese Funktion wird einmal pro Tick aufgerufen und aktualisiert dieses Partikel:
     def update(self) -> None:
-        self.pos = self.pos.add(self.mot) # bewegen
+        self.pos.iadd(self.mot) # bewegen
         self.ticks += 1
 
     
     # Diese Funktion rendert dieses Partikel:
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface, alpha: float = 0.0) -> None:
         if self.ticks < self.lifetime: # wenn dieses Partikel noch angezeigt werden soll
-            pygame.draw.circle(screen, Color.WHITE, self.pos.tup, 2) # dieses Partikel als kleinen Kreis auf das Fenster zeichnen
+            # dieses Partikel als kleinen Kreis auf das Fenster zeichnen:
+            pygame.draw.circle(screen, Color.WHITE, (self.pos.x + self.mot.x * alpha, self.pos.y + self.mot.y * alpha),
+                               PARTICLE_RADIUS)
 
     
     # Diese Methode gibt zurück, ob dieses Partikel zu entfernen ist:
@@ -662,42 +929,517 @@ class Particle:
         }
 
 
-# Diese Klasse repräsentiert ein Menü, durch das der Spieler navigieren kann:
+# Diese Klasse repräsentiert eine Spielwelt mit allen Objekten und Werten, die sich während eines Spiels verändern. Weil der
+# Zustand nicht in globalen Variablen liegt, können in einem Prozess beliebig viele Spielwelten unabhängig voneinander laufen:
+class GameWorld:
+
+    def __init__(self, high_score: int = 0, on_game_over: Callable | None = None, asteroid_arrays: bool = False,
+                 seed: int | None = None) -> None:
+        # Alle zufälligen Entscheidungen in dieser Spielwelt werden mit diesem Zufallsgenerator getroffen. Mit demselben Startwert
+        # („seed“) und derselben Eingabe verläuft ein Spiel deshalb jedes Mal genau gleich:
+        self.rng = random.Random(seed)
+        self.high_score = high_score # der beste Highscore, der übertroffen werden muss, um einen neuen Highscore aufzustellen
+        self.on_game_over = on_game_over # was geschehen soll, wenn der Spieler sein letztes Leben verliert
+        # optional: die Asteroiden werden in NumPy-Arrays gespeichert und alle auf einmal bewegt und gedreht:
+        if asteroid_arrays and AsteroidArrays is None:
+            raise ImportError('asteroid_arrays requires NumPy')
+        self.asteroid_arrays = AsteroidArrays() if asteroid_arrays else None
+        self.last_sound_tick = 0 # der letzte Tick, bei dem das Geräusch abgespielt wurde
+        self.play_beat_1 = True # ob als Nächstes der erste Beat gespielt werden soll
+        self.profiler: FrameProfiler | None = None # optional: misst die Dauer der einzelnen Phasen von step() und render()
+        self.sprite_cache: SpriteCache | None = None # optional: Asteroiden werden aus vorgerenderten Sprites gezeichnet
+        # die Pools für kurzlebige Objekte (sie bleiben über mehrere Spiele hinweg erhalten):
+        self.bullet_pool = Pool(empty_bullet)
+        self.saucer_bullet_pool = Pool(empty_saucer_bullet)
+        self.explosion_pool = Pool(empty_explosion)
+        self.particle_pool = Pool(empty_particle)
+        self.fragment_pool = Pool(empty_fragment)
+        self.line_pool = Pool(empty_line)
+        self.reset()
+
+
+    # Diese Methode setzt den Spielstand zurück:
+    def reset(self) -> None:
+        self.game_over = True # speichert, ob das Spiel aus ist
+        self.player: Player | None = None # der Spieler
+        self.fragment: Fragment | None = None # eventuell das Fragment des Spielers
+        self.asteroids: list[Asteroid] = [] # die Liste der Asteroiden
+        if self.asteroid_arrays is not None:
+            self.asteroid_arrays.clear()
+        self.saucer: Saucer | None = None # die fliegende Untertasse
+        self.saucer_on_screen = False # wenn es keine fliegende Untertasse gibt, ist auch keine im Fenster
+        self.saucer_fragments: list[Fragment] = [] # die Fragmente fliegender Untertassen
+        self.fire_bullet = False # ob der Spieler schießen will
+        self.bullets: list[Bullet] = [] # die Liste der Kugeln
+        self.saucer_bullets: list[SaucerBullet] = [] # die Liste der von fliegenden Untertassen abgefeuerten Kugeln
+        self.explosions: list[Explosion] = [] # die Liste der Explosionen
+        self.score = 0
+        self.add_points = 0 # wie viele Punkte der Punktzahl hinzugefügt werden
+        self.ticks_since_last_points = 0 # die Anzahl von Ticks, die seit dem letzten Erhalten von Punkten vergangen sind
+        self.new_high_score = False
+        self.lives = 0
+        self.playing_ticks = 0 # 0 Ticks gespielt
+        self.asteroids_destroyed = 0 # wie viele Asteroiden in diesem Spiel zerstört wurden (egal wodurch, für Statistiken)
+        self.difficulty: Difficulty | None = None # keine Schwierigkeit
+
+
+    # Diese Methode startet ein neues Spiel in dieser Spielwelt:
+    def new_game(self) -> None:
+        self.reset()
+        self.game_over = False
+        self.player = new_player(start_invincible=False)
+        self.add_asteroids([new_asteroid_no_args(self.rng) for _ in range(3)]) # drei neue Asteroiden der Liste hinzufügen
+        self.lives = 3
+        self.last_sound_tick = 0
+        self.play_beat_1 = True
+        self.get_and_set_difficulty() # die Schwierigkeit anhand der bereits gespielten Ticks einstellen
+
+
+    # Diese Methode gibt zurück, ob in dieser Spielwelt gerade gespielt wird (und nicht nur das Spiel-ist-aus-Menü darüber liegt):
+    def playing(self) -> bool:
+        return not self.game_over
+
+
+    # Diese Methode wird einmal pro Tick aufgerufen und aktualisiert alles zu Aktualisierende:
+    def step(self, player_input: PlayerInput) -> None:
+        profiler = self.profiler
+        if player_input.bank_points:
+            self.bank_points()
+        if player_input.fire and self.playing() and self.player is not None:
+            self.fire_bullet = True # eine vorgegebene Kugel wird wie ein Druck auf die Leertaste behandelt
+
+        if self.saucer is None:
+            # mit einer Wahrscheinlichkeit, die 15-mal geringer ist als die Wahrscheinlichkeit, dass ein Asteroid spawnt,
+            # eine neue fliegende Untertasse spawnen:
+            if self.rng.random() < self.difficulty.asteroid_spawn_chance / 15:
+                self.saucer = new_saucer(self.rng)
+        else:
+            self.saucer.update(self.rng)
+            if self.saucer_on_screen:
+                self.saucer_on_screen = self.saucer.on_screen()
+                if not self.saucer_on_screen: # wenn die fliegende Untertasse aus dem Fenster verschwindet
+                    (sounds.SAUCERSMALL if self.saucer.size.sound == 0 else sounds.SAUCERBIG).stop() # ihr Geräusch beenden
+                    self.saucer = None # die fliegende Untertasse despawnen
+            else:
+                self.saucer_on_screen = self.saucer.on_screen()
+                # wenn der Spieler gerade spielt und eine fligende Untertasse im Fenster erscheint:
+                if self.playing() and self.saucer_on_screen:
+                    (sounds.SAUCERSMALL if self.saucer.size.sound == 0 else sounds.SAUCERBIG).play(-1) # ihr Geräusch abspielen
+        if profiler is not None:
+            profiler.lap('saucer')
+
+        for ls in (self.saucer_fragments, self.bullets, self.saucer_bullets, self.explosions):
+            for obj in ls:
+                obj.update() # alle Objekte in mehreren Listen aktualisieren
+        if profiler is not None:
+            profiler.lap('list updates')
+
+        # die Kugeln in räumliche Hashes einsortieren, damit jeder Asteroid nur die Kugeln in seiner Nähe prüfen muss:
+        saucer_bullet_grid = hash_positions(self.saucer_bullets)
+        bullet_grid = hash_positions(self.bullets)
+
+        # eine Liste von Asteroiden, die evtl. gleich durch Zerteilungen entstehen und die bald zur Asteroidenliste addiert wird
+        asteroid_splits = []
+        if self.asteroid_arrays is not None:
+            self.asteroid_arrays.update() # alle Asteroiden auf einmal bewegen und drehen
+        for a in self.asteroids:
+            if self.asteroid_arrays is None:
+                a.update() # jeden Asteroiden aktualisieren
+            # prüfen, ob der Astroid von einer von einer fliegenden Untertasse abgeschossenen Kugel getroffen worden ist:
+            a.check_hit(self.saucer_bullets, 2, saucer_bullet_grid)
+            # prüfen, ob der Asteroid von einer vom Spieler abgeschossenen Kugel getroffen worden ist:
+            a.check_hit(self.bullets, 1, bullet_grid)
+            if a.hit_by != 0: # wenn der Asteroid getroffen worden ist
+                if a.hit_by == 1: # wenn der Asteroid vom Spieler getroffen worden ist
+                    if self.add_points > 0:
+                        self.score += self.add_points # zu addierende Punkte addieren
+                    self.add_points = a.size.points # zu addierende Punkte auf die dazubekommenen Punkte setzen
+                    # Wenn ein neuer Highscore erreicht worden ist:
+                    if self.score + self.add_points > self.high_score:
+                        self.new_high_score = True 
+                if self.playing(): # Es könnte auch das Spiel-ist-aus-Menü geöffnet sein
+                    play_bang_sound(a.size)
+                asteroid_splits += split_asteroid(a, self.rng) # den Asteroiden zerteilen
+                self.asteroids_destroyed += 1
+                self.explosions.append(self.new_explosion(a.body.center.x, a.body.center.y, a.mot)) # eine neue Explosion erscheinen lassen
+        if profiler is not None:
+            profiler.lap('asteroid hits')
+
+        if self.fragment is None:
+            self.player.update(player_input) # wenn es kein Fragment gibt, gibt es einen Spieler, und dieser wird aktualisiert
+            if self.fire_bullet:
+                # die Kugel erscheint vorne am Raumschiff:
+                bullet_pos = self.player.body.cartesian()[0]
+                
+                bullet_angle = self.player.body.polar_coordinates[0].theta # die Richtung, in die die Kugel geschossen werden soll
+                # eine neue Kugel aus dem Pool nehmen und der Kugelliste hinzufügen:
+                self.bullets.append(new_bullet(bullet_pos, bullet_angle, self.bullet_pool))
+                sounds.FIRE.play()
+                self.fire_bullet = False # nicht noch eine zweite Kugel schießen
+        else:
+            self.fragment.update() # das Fragment aktualisieren
+            # wenn nicht das Spiel-ist-aus-Menü angezeigt wird und das Fragment eine Sekunde angezeigt wurde:
+            if self.playing() and self.fragment.ticks == FPS:
+                self.player = new_player(start_invincible=True) # neuen (anfangs unbesiegbaren) Spieler konstruieren
+                self.release_fragment(self.fragment)
+                self.fragment = None # das Fragment despawnen
+                # Wenn der Spieler noch Schub gibt, das Geräusch des Schubs fortsetzen:
+                if player_input.thrust:
+                    sounds.THRUST.play(-1)
+            self.fire_bullet = False # wenn es keinen Spieler gibt, kann nicht geschossen werden
+        if profiler is not None:
+            profiler.lap('player')
+
+        if self.saucer is not None:
+            for a in self.asteroids:
+                if self.saucer.body.collides_with_polygon(a.body): # wenn die fliegende Untertasse mit einem Asteroiden kollidiert:
+                    self.saucer_die()
+                    asteroid_splits += split_asteroid(a, self.rng) # den Asteroiden sprengen
+                    self.asteroids_destroyed += 1
+                    a.hit_by = 2
+                    self.explosions.append(self.new_explosion(a.body.center.x, a.body.center.y, a.mot)) # eine neue Explosion erscheinen lassen
+                    break # es müssen keine weiteren Kollisionen mit Asteroiden geprüft werden
+            if self.saucer is not None: # wenn es immer noch einen fliegende Untertasse gibt
+                self.saucer.check_hit(self.bullets, by=1)
+                self.saucer.check_hit(self.saucer_bullets, by=2)
+                if self.saucer.hit_by != 0: # wenn die fliegende Untertasse getroffen wurde
+                    if self.saucer.hit_by == 1: # wenn die fliegende Untertasse vom Spieler getroffen wurde
+                        if self.add_points > 0:
+                            self.score += self.add_points # die zu addierenden Punkte zur Punktzahl addieren
+                        # die nächsten zu addierenden Punkte anhand der Größe der fliegenden Untertasse setzen:
+                        self.add_points = self.saucer.size.points 
+                    self.saucer_die()
+                if self.saucer is not None: # wenn es immer noch eine fliegende Untertasse gibt
+                    # wenn es einen Spieler gibt und dieser nicht (mehr) unverwundbar ist und mit der fliegenden Untertasse
+                    # kollidiert:
+                    if self.player is not None and self.player.ticks >= INVINCIBILITY_TIME and self.player.body.collides_with_polygon(self.saucer.body):
+                        self.player_die()
+                        self.saucer_die()
+                    # sonst: mit der Wahrscheinlichkeit, dass die fliegende Untertasse eine Kugel abschießt, die fliegende
+                    # Untertasse eine Kugel abschießen lassen:
+                    elif self.rng.random() < self.saucer.size.shoot_probability:
+                        # eine neue Fliegende-Untertasse-Kugel konstruieren und der Liste hinzufügen:
+                        self.saucer_bullets.append(new_saucer_bullet(self.saucer, self.player, self.rng, self.saucer_bullet_pool))
+                        if self.playing(): # es könnte auch das Spiel-ist-aus-Menü angezeigt werden
+                            sounds.FIRE.play()
+        if profiler is not None:
+            profiler.lap('saucer collisions')
+
+        # wenn der Spieler noch lebt er länger als die Unverwundbarkeitszeit lebt:
+        if self.player is not None and self.player.ticks >= INVINCIBILITY_TIME:
+            colliding_asteroid = self.player_collides_with_asteroid()
+            if colliding_asteroid is not None: # wenn der Spieler mit einem Asteroiden kollidiert
+                self.player_die()
+                asteroid_splits += split_asteroid(colliding_asteroid, self.rng)
+                self.asteroids_destroyed += 1
+                colliding_asteroid.hit_by = 2
+                # eine neue Explosion erscheinen lassen:
+                self.explosions.append(self.new_explosion(colliding_asteroid.body.center.x, colliding_asteroid.body.center.y,
+                                                          colliding_asteroid.mot))
+                play_bang_sound(colliding_asteroid.size)
+            else: # sonst: der Spieler lebt noch
+                for b in self.saucer_bullets:
+                    if not b.dead and b.hits(self.player.body, self.player.mot): # wenn der Spieler von einer Kugel von einer f. Untertasse getroffen wird
+                        self.player_die()
+                        sounds.BANGMEDIUM.play()
+                        break # es muss nicht geprüft werden, ob der Spieler noch von weiteren Kugel getroffen wird
+        if profiler is not None:
+            profiler.lap('player collision')
+
+        self.add_asteroids(asteroid_splits) # die Stücke des zerbrochenen Asteroiden der Asteroidenliste hinzufügen
+
+        # mit der Wahrscheinlichkeit, dass bei der aktuellen Schwierigkeit ein Asteroid spawnt, einen Asteroiden spawnen:
+        if self.rng.random() < self.difficulty.asteroid_spawn_chance:
+            self.add_asteroids([new_asteroid_no_args(self.rng)]) # einen neuen Asteroiden konstruieren und der Asteroidenliste hinzufügen
+
+        # die getroffenen Asteroiden und die außerhalb des Fensters aus der Liste selbst entfernen (wie die Kugeln unten):
+        removed = compact(self.asteroids, Asteroid.to_remove)
+        if removed > 0 and self.asteroid_arrays is not None:
+            # die Arrays genauso filtern und die Zeilen der übrigen Asteroiden neu zuweisen (die Zeilen stimmen immer mit den
+            # Stellen in der Liste überein, daher nur, wenn Asteroiden entfernt wurden):
+            self.asteroid_arrays.keep([a.body.row for a in self.asteroids])
+            for (i, a) in enumerate(self.asteroids):
+                a.body.row = i
+        # alle zu entfernenden (auch die treffenden) Kugeln, Explosionen und Fragmente in den Listen selbst entfernen und an ihre
+        # Pools zurückgeben:
+        compact(self.bullets, Bullet.to_remove, self.bullet_pool.release)
+        compact(self.saucer_bullets, SaucerBullet.to_remove, self.saucer_bullet_pool.release)
+        compact(self.explosions, Explosion.to_remove, self.release_explosion)
+        compact(self.saucer_fragments, Fragment.to_remove, self.release_fragment)
+        if profiler is not None:
+            profiler.lap('spawn and filter')
+
+        if self.playing():
+            if self.add_points > 0: # wenn es Punkte gibt, die zur Punktzahl hinzukommen werden
+                if self.ticks_since_last_points == FPS: # wenn seit dem Erzielen der Punkte eine Sekunde vergangen ist
+                    self.score += self.add_points # die zu addierenden Punkte zur Punktzahl addieren
+                    self.add_points = 0 # die zu addierenden Punkte auf 0 setzen
+                    # die Anzahl von Ticks, die seit dem Erzielen der letzten Punkte vergangen sind, auf 0 setzen:
+                    self.ticks_since_last_points = 0
+                # die Anzahl von Tiks, die seit dem Erzielen der letzten Punkte vergangen sind, um eins erhöhen:
+                self.ticks_since_last_points += 1
+            self.beat()
+            self.playing_ticks += 1 # die Anzahl von Ticks, wie lange das Spiel schon dauert, um eins erhöhen
+            self.get_and_set_difficulty() # die Schwierigkeit ermitteln und setzen
+        if profiler is not None:
+            profiler.lap('score')
+
+
+    # Diese Methode rendert alle Objekte dieser Spielwelt. „alpha“ gibt an, welcher Bruchteil des nächsten Ticks seit dem letzten
+    # Tick schon vergangen ist; bewegte Objekte werden um diesen Bruchteil ihrer Bewegung weiter gezeichnet, damit die Bewegung
+    # flüssig bleibt, auch wenn öfter (oder zu anderen Zeitpunkten) gerendert als simuliert wird. Mit „clear=False“ wird das
+    # Fenster vorher nicht gelöscht (s. DirtyRects):
+    def render(self, screen: pygame.Surface, alpha: float = 0.0, clear: bool = True) -> None:
+        profiler = self.profiler
+        if clear:
+            screen.fill(Color.BLACK)
+        if profiler is not None:
+            profiler.lap('render clear')
+        if self.fragment is None:
+            self.player.render(screen, alpha) # wenn es kein Fragment gibt, gibt es einen Spieler; diesen rendern
+        else:
+            self.fragment.render(screen, alpha)
+        if profiler is not None:
+            profiler.lap('render player')
+        # alle Asteroiden rendern:
+        if self.sprite_cache is not None:
+            render_sprites(screen, self.asteroids, self.sprite_cache, alpha, self.asteroid_arrays)
+        elif self.asteroid_arrays is not None and alpha == 0.0:
+            # die Umrisse aller Asteroiden mit einem einzigen tolist() aus den Arrays holen:
+            outlines = self.asteroid_arrays.outlines()
+            for a in self.asteroids:
+                if a.body.visible:
+                    pygame.draw.lines(screen, Color.WHITE, True, outlines[a.body.row], a.body.stroke_weight)
+        else:
+            for a in self.asteroids:
+                a.render(screen, alpha)
+        if profiler is not None:
+            profiler.lap('render asteroids')
+        # alle Kugeln und alle Partikel mit jeweils einem einzigen Aufruf von blits() rendern:
+        render_dots(screen, self.bullets, BULLET_RADIUS, alpha)
+        render_dots(screen, self.saucer_bullets, BULLET_RADIUS, alpha)
+        if profiler is not None:
+            profiler.lap('render bullets')
+        render_dots(screen, [p for e in self.explosions for p in e.particles if p.ticks < p.lifetime], PARTICLE_RADIUS, alpha)
+        if profiler is not None:
+            profiler.lap('render explosions')
+        for f in self.saucer_fragments:
+            f.render(screen, alpha)
+        if profiler is not None:
+            profiler.lap('render fragments')
+        if self.saucer is not None:
+            self.saucer.render(screen, alpha) # wenn es eine fliegende Untertasse gibt, diese rendern
+        if profiler is not None:
+            profiler.lap('render saucer')
+
+
+    # Diese Methode gibt Rechtecke zurück, die alles enthalten, was render() mit demselben „alpha“ zeichnet:
+    def covered_rects(self, alpha: float = 0.0) -> list[pygame.Rect]:
+        rects = []
+        if self.fragment is None:
+            player = self.player
+            center = player.body.center
+            radius = max(player.body.bounding_radius(), player.thrust.bounding_radius())
+            rects.append(circle_rect(center.x + player.mot.x * alpha, center.y + player.mot.y * alpha, radius,
+                                     player.body.stroke_weight))
+        else:
+            rects += fragment_rects(self.fragment, alpha)
+        if self.asteroid_arrays is not None:
+            # die Mitten und Radien aller Asteroiden mit einem einzigen tolist() aus den Arrays holen:
+            n = self.asteroid_arrays.count
+            centers = self.asteroid_arrays.centers[:n].tolist()
+            bounds = self.asteroid_arrays.bounds[:n].tolist()
+            for a in self.asteroids:
+                (x, y) = centers[a.body.row]
+                rects.append(circle_rect(x + a.mot.x * alpha, y + a.mot.y * alpha, bounds[a.body.row], a.body.stroke_weight))
+        else:
+            for a in self.asteroids:
+                center = a.body.center
+                rects.append(circle_rect(center.x + a.mot.x * alpha, center.y + a.mot.y * alpha, a.body.bounding_radius(),
+                                         a.body.stroke_weight))
+        for b in self.bullets + self.saucer_bullets:
+            rects.append(circle_rect(b.pos.x + b.mot.x * alpha, b.pos.y + b.mot.y * alpha, BULLET_RADIUS))
+        for e in self.explosions:
+            for p in e.particles:
+                if p.ticks < p.lifetime:
+                    rects.append(circle_rect(p.pos.x + p.mot.x * alpha, p.pos.y + p.mot.y * alpha, PARTICLE_RADIUS))
+        for f in self.saucer_fragments:
+            rects += fragment_rects(f, alpha)
+        if self.saucer is not None:
+            center = self.saucer.body.center
+            rects.append(circle_rect(center.x + self.saucer.mot.x * alpha, center.y + self.saucer.mot.y * alpha,
+                                     self.saucer.body.bounding_radius(), self.saucer.body.stroke_weight))
+        return rects
+
+
+    # Diese Methode fügt Asteroiden der Asteroidenliste hinzu. Wenn die Spielwelt NumPy-Arrays benutzt, werden die Körper der
+    # Asteroiden in die Arrays verschoben:
+    def add_asteroids(self, asteroids: list[Asteroid]) -> None:
+        if self.asteroid_arrays is not None:
+            for a in asteroids:
+                body = a.body
+                row = self.asteroid_arrays.add(body.center.tup, a.mot.tup, a.rot, [c.theta for c in body.polar_coordinates],
+                                               [c.radius for c in body.polar_coordinates])
+                a.body = ArrayPolygon(self.asteroid_arrays, row, body.stroke_weight, body.visible, body.shape)
+        self.asteroids += asteroids
+
+
+    # Diese Methode wird aufgerufen, wenn der Spieler sterben soll:
+    def player_die(self) -> None:
+        self.lives -= 1 # ein Leben abziehen
+        if self.lives == 0:
+            self.bank_points()
+            self.game_over = True
+            sounds.SAUCERSMALL.stop()
+            sounds.SAUCERBIG.stop()
+            if self.on_game_over is not None:
+                self.on_game_over() # z. B. das Spiel-ist-aus-Menü anzeigen
+        # ein neues Fragment aus dem Pool nehmen und spawnen:
+        self.fragment = new_fragment(self.player, self.rng, self.fragment_pool, self.line_pool)
+        sounds.THRUST.stop()
+        self.player = None # den Spieler despawnen
+
+
+    # Diese Methode addiert die Punkte, die gerade hinzukommen, sofort zur Punktzahl und setzt sie auf 0:
+    def bank_points(self) -> None:
+        if self.add_points > 0:
+            self.score += self.add_points
+            self.add_points = 0
+
+
+    # Diese Methode konstruiert eine neue Explosion (mit Objekten aus den Pools) und gibt sie zurück:
+    def new_explosion(self, x: float, y: float, mot: Vector) -> Explosion:
+        return new_explosion(x, y, mot, self.rng, self.explosion_pool, self.particle_pool)
+
+
+    # Diese Methode gibt eine entfernte Explosion samt ihren Partikeln an die Pools zurück:
+    def release_explosion(self, explosion: Explosion) -> None:
+        self.particle_pool.release_all(explosion.particles)
+        explosion.particles.clear()
+        self.explosion_pool.release(explosion)
+
+
+    # Diese Methode gibt ein entferntes Fragment samt seinen Linien an die Pools zurück:
+    def release_fragment(self, fragment: Fragment) -> None:
+        self.line_pool.release_all(fragment.lines)
+        fragment.lines.clear()
+        self.fragment_pool.release(fragment)
+
+
+    # Diese Methode wird aufgerufen, wenn die fliegende Untertasse sterben soll:
+    def saucer_die(self) -> None:
+        if self.playing(): # Es könnte auch das Spiel-ist-aus-Menü angezeigt werden
+            play_bang_sound(self.saucer.size) # je nach der Größe der fliegenden Untertasse ein Knallgeräusch abspielen
+        # das Fragment der fliegenden Untertasse der Liste hinzufügen:
+        self.saucer_fragments.append(new_saucer_fragment(self.saucer, self.rng, self.fragment_pool, self.line_pool))
+        self.saucer = None
+        self.saucer_on_screen = False
+        # beide Fliegende-Untertasse-Geräusche stoppen:
+        sounds.SAUCERSMALL.stop()
+        sounds.SAUCERBIG.stop()
+
+
+    # Wenn der Spieler mit einem Asteroiden kollidiert, gibt diese Methode diesen zurück (andernfalls None):
+    def player_collides_with_asteroid(self) -> Asteroid | None:
+        for a in self.asteroids:
+            if self.player.body.collides_with_polygon(a.body): # den ersten Asteroiden finden, der mit dem Spieler kollidiert
+                return a
+        return None # wenn kein Asteroid gefunden wurde, der mit dem Spieler kollidiert
+
+
+    # Diese Methode kümmert sich darum, dass zu den richtigen Zeitpunkten der Beat abgespielt wird:
+    def beat(self) -> None:
+        # das Intervall anhand der Spielzeit bestimmen:
+        if self.playing_ticks <= FPS * 30:
+            interval = (-2 / (FPS * 1.5)) * self.playing_ticks + FPS # in den ersten 30 Sekunden immer schneller
+        else:
+            interval = FPS / 3 # nach 30 Sekunden immer dreimal pro Sekunde
+
+        # prüfen, ob es Zeit ist, das Geräusch abzuspielen:
+        if self.playing_ticks - self.last_sound_tick >= interval:
+            (sounds.BEAT1 if self.play_beat_1 else sounds.BEAT2).play() # den Beat abspielen
+            self.play_beat_1 = not self.play_beat_1
+            self.last_sound_tick = self.playing_ticks # den letzten Abspielzeitpunkt aktualisieren
+
+
+    # Diese Methode ermittelt die aktuelle Schwierigkeit und setzt sie:
+    def get_and_set_difficulty(self) -> None:
+        for d in reversed(DIFFICULTIES): # die Schwierigkeiten rückwärts durchlaufen
+            # wenn mindestens so viele Ticks vergangen sind wie die Ticks, bei denen die Schwierigkeit beginnt:
+            if self.playing_ticks >= d.starts_at_ticks:
+                self.difficulty = d # die Schwierigkeit setzen
+                return # aus der Methode springen, da die Schwierigkeit jetzt ermittelt wurde
+
+
+    # Diese Methode gibt ein Dictionary mit den Werten dieser Spielwelt zurück:
+    def to_dict(self) -> dict[str, object]:
+        return {
+            'game_over': self.game_over,
+            'player': None if self.player is None else self.player.to_dict(),
+            'fragment': None if self.fragment is None else self.fragment.to_dict(),
+            'asteroids': [a.to_dict() for a in self.asteroids],
+            'saucer': None if self.saucer is None else self.saucer.to_dict(),
+            'saucer_on_screen': self.saucer_on_screen,
+            'saucer_fragments': [f.to_dict() for f in self.saucer_fragments],
+            'bullets': [b.to_dict() for b in self.bullets],
+            'saucer_bullets': [b.to_dict() for b in self.saucer_bullets],
+            'explosions': [e.to_dict() for e in self.explosions],
+            'score': self.score,
+            'new_high_score': self.new_high_score,
+            'lives': self.lives,
+            'playing_ticks': self.playing_ticks
+        }
+
+
+# Diese Klasse repräsentiert ein Menü, durch das der Spieler navigieren kann. Die Textoberflächen werden erst gerendert, wenn
+# das Menü zum ersten Mal angezeigt wird (s. prepare()), damit beim Programmstart nur das Hauptmenü gerendert werden muss:
 class Menu:
 
     def __init__(self, title: str, text: str | None, transparent: bool, parent: Menu | None, button_data: tuple[ButtonData, ...]) -> None:
-        self.title_surface = TITLE_FONT.render(title, True, Color.WHITE) # die Textoberfläche für den Titel rendern
-        self.title_pos = ((WIDTH - self.title_surface.get_width()) / 2, 100) # die Position des Titels
-        self.set_text(text)
+        self.title = title
+        self.text = text
         self.transparent = transparent
         self.parent = parent
+        self.prepared = False # ob die Textoberflächen schon gerendert sind
         
-        # den Hintergrund (der transparent ist oder nicht) erstellen
-        self.background = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(self.background, Color.BLACK_ALPHA if transparent else Color.BLACK, self.background.get_rect())
-        
-        # Die Buttons konstruieren:
-        start_y = 225 if text is None else self.text_positions[-1].y + self.text_surfaces[-1].get_height() + 50
-        self.buttons = tuple([Button(d.text, start_y + i * 50, d.active, d.on_action) for (i, d) in enumerate(button_data)])
+        # Die Buttons konstruieren (ihre y-Koordinaten werden erst in prepare() berechnet):
+        self.buttons = tuple([Button(d.text, d.active, d.on_action) for d in button_data])
         
         self.select_top_button()
 
 
-    def set_text(self, text: str | None, update_buttons_y: bool = False) -> None:
+    # Diese Methode rendert die Textoberflächen dieses Menüs und berechnet die Positionen:
+    def prepare(self) -> None:
+        self.title_surface = TITLE_FONT.render(self.title, True, Color.WHITE) # die Textoberfläche für den Titel rendern
+        self.title_pos = ((WIDTH - self.title_surface.get_width()) / 2, 100) # die Position des Titels
+        self.background = menu_background(self.transparent) # den Hintergrund (der transparent ist oder nicht) holen
+        for b in self.buttons:
+            b.prepare()
+        self.prepared = True
+        self.set_text(self.text)
+
+
+    # Diese Methode setzt den Text unter dem Titel und verschiebt die Buttons darunter. Ist das Menü noch nicht vorbereitet, wird
+    # der Text erst in prepare() gerendert:
+    def set_text(self, text: str | None) -> None:
+        self.text = text
+        if not self.prepared:
+            return
         if text is None:
             self.text_surfaces = ()
             self.text_positions = ()
+            start_y = 225
         else:
             # die Textoberflächen der Buttons:
             self.text_surfaces = tuple(TEXT_FONT.render(line, True, Color.WHITE) for line in text.split('\n'))
             # die Positionen der Buttons:
             self.text_positions = tuple(Vector((WIDTH - s.get_width()) / 2, 205 + i * s.get_height())
                                         for (i, s) in enumerate(self.text_surfaces))
+            start_y = self.text_positions[-1].y + self.text_surfaces[-1].get_height() + 50
 
-        if update_buttons_y:
-            # die y-Koordinaten aller Buttons aktualisieren:
-            for (i, b) in enumerate(self.buttons):
-                b.y = self.text_positions[-1].y + self.text_surfaces[-1].get_height() + 50 + i * 50
+        # die y-Koordinaten aller Buttons aktualisieren:
+        for (i, b) in enumerate(self.buttons):
+            b.y = start_y + i * 50
 
 
     # Diese Funktion wählt alle Buttons dieses Menüs ab:
@@ -776,6 +1518,8 @@ class Menu:
 
     # Diese Funktion rendert dieses Menü:
     def render(self, screen: pygame.Surface) -> None:
+        if not self.prepared:
+            self.prepare() # beim ersten Anzeigen die Textoberflächen rendern
         screen.blit(self.background, (0, 0)) # den Hintergrund malen
         screen.blit(self.title_surface, self.title_pos) # den Titel platzieren
         for (s, p) in zip(self.text_surfaces, self.text_positions):
@@ -787,19 +1531,29 @@ class Menu:
 # Diese Klasse repräsentiert einen Button in einem Menü, den man mit den Pfeiltasten auswählen kann:
 class Button:
 
-    def __init__(self, text: str, y: int, active: bool, on_action: Callable) -> None:
-        self.text_surface = BUTTON_FONT.render(text, True, Color.WHITE) # die weiße Textoberfläche für diesen Button rendern
-        self.gray_text_surface = BUTTON_FONT.render(text, True, Color.GRAY) # die graue Textoberfläche für diesen Button rendern
-        self.x = (WIDTH - self.text_surface.get_width()) / 2 # die x-Koordinate berechnen, sodass der Button mittig angezeigt wird
-        self.y = y # die y-Koordinate des Buttons zuweisen
+    def __init__(self, text: str, active: bool, on_action: Callable) -> None:
+        self.text = text
+        self.y = 0 # die y-Koordinate des Buttons (wird von seinem Menü gesetzt)
         self.active = active
         self.on_action = on_action
         self.selected = False # anfangs ist der Button nicht ausgewählt
+        self.gray_text_surface: pygame.Surface | None = None # wird erst gerendert, wenn der Button inaktiv angezeigt wird
+
+
+    # Diese Methode rendert die weiße Textoberfläche dieses Buttons (s. Menu.prepare()):
+    def prepare(self) -> None:
+        self.text_surface = BUTTON_FONT.render(self.text, True, Color.WHITE) # die weiße Textoberfläche für diesen Button rendern
+        self.x = (WIDTH - self.text_surface.get_width()) / 2 # die x-Koordinate berechnen, sodass der Button mittig angezeigt wird
 
     
     def render(self, screen: pygame.Surface) -> None:
         # Die Textoberfläche (weiß wenn ausgewählt, sonst grau) anzeigen:
-        surface = self.text_surface if self.active else self.gray_text_surface
+        if self.active:
+            surface = self.text_surface
+        else:
+            if self.gray_text_surface is None:
+                self.gray_text_surface = BUTTON_FONT.render(self.text, True, Color.GRAY) # die graue Textoberfläche rendern
+            surface = self.gray_text_surface
         screen.blit(surface, (self.x, self.y))
         
         # Wenn der Button ausgewählt ist, links und rechts zwei Pfeile anzeigen:
@@ -868,6 +1622,29 @@ class ButtonData:
     on_action: Callable # was beim Drücken der Entertaste geschehen soll, wenn dieser Button ausgewählt ist
 
 
+# Diese Datenklasse repräsentiert die Eingabe des Spielers in einem Tick. Im normalen Spiel wird sie aus der Tastatur gelesen,
+# in der Headless-Simulation wird sie von einem Skript und beim Nachspielen von einer Aufzeichnung vorgegeben:
+@dataclass
+class PlayerInput:
+
+    thrust: bool = False # ob der Spieler Schub gibt
+    left: bool = False # ob der Spieler nach links lenkt
+    right: bool = False # ob der Spieler nach rechts lenkt
+    fire: bool = False # ob der Spieler in diesem Tick eine Kugel abschießt
+    bank_points: bool = False # ob die hinzukommenden Punkte vor diesem Tick zur Punktzahl addiert werden (s. Pausenmenü)
+
+    # Diese Methode gibt diese Eingabe als Byte für eine Aufzeichnung zurück (s. recording.py):
+    def to_mask(self) -> int:
+        return ((THRUST_BIT if self.thrust else 0) | (LEFT_BIT if self.left else 0) | (RIGHT_BIT if self.right else 0)
+                | (FIRE_BIT if self.fire else 0) | (BANK_POINTS_BIT if self.bank_points else 0))
+
+    # Diese Methode konstruiert eine Eingabe aus einem Byte einer Aufzeichnung:
+    @staticmethod
+    def from_mask(mask: int) -> PlayerInput:
+        return PlayerInput(thrust=mask & THRUST_BIT != 0, left=mask & LEFT_BIT != 0, right=mask & RIGHT_BIT != 0,
+                           fire=mask & FIRE_BIT != 0, bank_points=mask & BANK_POINTS_BIT != 0)
+
+
 # Konstanten
 
 WIDTH = 800 # die Breite des Fensters
@@ -878,7 +1655,22 @@ PERIMETER = WIDTH * 2 + HEIGHT * 2 # der Umfang des Fensters
 # wie wahrscheinlich es sein soll, dass etwas an einer bestimmten Seite spawnt:
 SIDE_PROBABILITIES = [WIDTH / PERIMETER, HEIGHT / PERIMETER, WIDTH / PERIMETER, HEIGHT / PERIMETER]
 
-FPS = 60 # die Bildfrequenz
+FPS = 60 # die Bildfrequenz (genauer: die Anzahl der Ticks der Simulation pro Sekunde)
+TICK_TIME = 1 / FPS # die Dauer eines Ticks in Sekunden
+MAX_LAG = 0.25 # wie viele Sekunden Simulation nach einem langsamen Frame höchstens nachgeholt werden
+RENDER_FPS = FPS # wie oft pro Sekunde höchstens gerendert wird (0 für unbegrenzt, z. B. für Bildschirme mit mehr als 60 Hz)
+INTERPOLATE = False # ob bewegte Objekte zwischen zwei Ticks weiter gezeichnet werden (sinnvoll, wenn RENDER_FPS > FPS)
+DIRTY_RECTS = False # ob während eines Spiels nur die bemalten Rechtecke gelöscht und übertragen werden (s. dirty_rects.py)
+ASTEROID_SPRITES = False # ob Asteroiden aus vorgerenderten, gedrehten Sprites gezeichnet werden (s. sprites.py)
+SPRITE_CACHE_BYTES = 32 * 1024 * 1024 # wie viel Speicher die Sprites der Asteroiden höchstens belegen dürfen (32 MiB)
+SPRITE_ROTATION_STEPS = 32 # in wie viele Stufen die Drehung der Sprites unterteilt wird (s. sprites.ROTATION_STEPS)
+SAVE_FILE = 'data.bin' # die Datei, in der der Spielstand im Binärformat gespeichert wird (s. snapshot.py)
+RECORD_REPLAYS = True # ob die Eingabe jedes neuen Spiels aufgezeichnet wird, damit es nachgespielt werden kann (s. replay.py)
+REPLAY_FILE = 'replay.bin' # die Datei, in der die Aufzeichnung des letzten Spiels gespeichert wird
+FONT_FILE = 'hyperspace-font/HyperspaceBold.ttf' # die Schriftart aller Texte
+PRINT_STARTUP_TIMES = False # ob nach dem ersten Bild ausgegeben wird, wie lange die Phasen des Programmstarts gedauert haben
+LEGACY_SAVE_FILE = 'data.json' # die Datei, in der ältere Versionen den Spielstand als JSON gespeichert haben
+AUTOSAVE_INTERVAL = 30 * FPS # nach wie vielen gespielten Ticks der Spielstand automatisch gespeichert wird (30 Sekunden)
 INVINCIBILITY_TIME = 3 * FPS # die Anzahl von Ticks, wie lange der Spieler nach einer Kollision unbesiegbar sein soll (3 Sekunden)
 
 MAX_TURNING_SPEED = 0.1 # die maximale Drehgeschwindigkeit des Spielers
@@ -890,7 +1682,12 @@ SAUCER_MIN_STEPS = FPS * 3 # wie lange eine fliegende Untertasse sich mindestens
 SAUCER_MAX_STEPS = FPS * 5 # wie lange eine fliegende Untertasse sich höchstens in eine Richtung bewegt
 
 BULLET_SPEED = 10 # die Geschwindigkeit, mit der Kugeln sich bewegen
+# wie viele Kugeln in der Nähe eines Polygons einzeln geprüft werden, bevor die übrigen mit NumPy alle auf einmal geprüft werden
+# (s. find_hit() und hit_kernel.py; bei weniger Kugeln ist die Schleife in Python schneller):
+HIT_KERNEL_MIN_BULLETS = 64
 BULLET_RADIUS = 2 # der Radius von Kugeln
+PARTICLE_RADIUS = 2 # der Radius von Partikeln
+SHAPES = itertools.count() # vergibt die Nummern der Formen von Polygonen
 
 ASTEROID_SPAWN_DISTANCE: int # die Entfernung zur Fenstermitte, mit der Asteroiden spawnen (wird in init_constants() gesetzt)
 ASTEROID_DESPAWN_DISTANCE: int # die Entfernung zur Fenstermitte, mit der Asteroiden despawnen (wird in init_constants() gesetzt)
@@ -941,50 +1738,62 @@ HIGH_SCORES_MENU: Menu # das Highscores-Menü
 # Variablen
 
 running: bool = True # so lange „wahr“, solange das Spiel läuft
-game_over: bool = True # speichert, ob das Spiel aus ist
-player: Player | None = None # der Spieler
-fragment: Fragment | None = None # eventuell das Fragment des Spielers
-asteroids: list[Asteroid] = [] # die Liste der Asteroiden
-saucer: Saucer | None = None # die fliegende Untertasse
-saucer_on_screen: bool # ob die fliegende Untertasse im Fenster ist
-saucer_fragments: list[Fragment] = [] # die Fragmente fliegender Untertassen
-fire_bullet: bool = False # ob man die Leertaste gedrückt hat, um zu schießen
-bullets: list[Bullet] = [] # die Liste der Kugeln
-saucer_bullets: list[SaucerBullet] = [] # die Liste der von fliegenden Untertassen abgefeuerten Kugeln
-explosions: list[Explosion] = [] # die Liste der Explosionen (die beim Sprengen eines kleinen Asteroiden entstehen)
-score: int
-add_points: int = 0 # wie viele Punkte der Punktzahl hinzugefügt werden
-ticks_since_last_points: int = 0 # die Anzahl von Ticks, die seit dem letzten Erhalten von Punkten vergangen sind
+world: GameWorld # die Spielwelt mit allen Objekten des aktuellen Spiels
 high_scores: list[HighScore] = [] # die Liste der Highscores (5 Highscores)
-new_high_score: bool
-lives: int
-life_surface: pygame.Surface # 
-playing_ticks: int = 0 # wie viele Ticks das aktuelle Spiel schon anhält
-difficulty: Difficulty # die aktuelle Schwierigkeit
+life_surface: pygame.Surface # die Oberfläche mit einem Raumschiff, das ein Leben darstellt
+hud: Hud | None = None # die Anzeige der Punktzahl, des Highscores und der Leben während eines Spiels (s. init_hud())
+fonts: dict[int, pygame.font.Font] = {} # die geladenen Größen der Schriftart (Größe -> Schriftart, s. load_font())
+menu_backgrounds: dict[bool, pygame.Surface] = {} # die Hintergründe der Menüs (transparent -> Oberfläche)
 opened_menu: Menu | None # das aktuelle Menü
-last_sound_tick: int = 0 # der letzte Tick, bei dem das Geräusch abgespielt wurde
-play_beat_1: bool = True # ob als Nächstes der erste Beat gespielt werden soll
+autosaver: Autosaver # schreibt die automatischen Spielstände auf einem Hintergrund-Thread
+profiler: FrameProfiler | None = None # misst die Phasen jedes Frames, solange das Overlay eingeschaltet ist (Taste F3)
+profiler_surface: pygame.Surface | None = None # die zuletzt gerenderte Statistik des Overlays
+profiler_font: pygame.font.Font | None = None # die Schriftart des Overlays
+dot_surfaces: dict[int, pygame.Surface] = {} # vorgerenderte weiße Kreise für Kugeln und Partikel (Radius -> Oberfläche)
+dirty_rects = DirtyRects(SIZE) # die Rechtecke, die im letzten und im aktuellen Frame bemalt wurden
+ticks_since_autosave: int = 0 # die Anzahl gespielter Ticks seit dem letzten automatischen Speichern
+recording: Recording | None = None # die Aufzeichnung des laufenden Spiels (None, wenn es nicht aufgezeichnet wird)
+startup_timer: StartupTimer = StartupTimer() # misst die Phasen des Programmstarts (s. main())
 
 
 # Funktionen
 
 # Die main()-Funktion
 def main() -> None:
-    global score, add_points
+    global startup_timer
+    startup_timer = StartupTimer() # die Phasen bis zum ersten Bild messen
 
-    pygame.init() # Pygame initialisieren
+    # Pygame initialisieren (nur das Fenster und die Schrift; pygame.init() würde auch den Soundmixer öffnen, was dauern kann):
+    pygame.display.init()
     pygame.font.init() # das Rendern von Schrift in Pygame initialisieren
-    pygame.mixer.init() # den Soundmixer von Pygame initialisieren
-    sounds.init() # die Geräusche in diesem Spiel initialisieren
-    init() # dieses Spiel initialisieren
+    sounds.init() # den Soundmixer öffnen und die Geräusche auf einem Hintergrund-Thread laden
+    startup_timer.lap('pygame')
     
     screen = pygame.display.set_mode(SIZE) # das Fenster anlegen
     pygame.display.set_caption('Asteroids') # die Fensterüberschrift setzen
+    startup_timer.lap('window')
+    init() # dieses Spiel initialisieren
+
+    # das Hauptmenü sofort anzeigen:
+    render(screen)
+    present(dirty_rects)
+    startup_timer.lap('first frame')
+    if PRINT_STARTUP_TIMES:
+        print_startup_times()
 
     clock = pygame.time.Clock() # mit dieser Uhr kann die Bildfrequenz geregelt werden
 
+    # Die Simulation läuft in festen Ticks von TICK_TIME Sekunden, unabhängig davon, wie oft gerendert wird. Die seit dem letzten
+    # Frame vergangene Zeit wird gesammelt und in so vielen Ticks nachgeholt, wie hineinpassen. Dauert ein Frame zu lange, werden
+    # deshalb Frames ausgelassen, aber das Spiel (und damit die Schwierigkeit und der Beat) läuft nicht langsamer:
+    previous_time = time.perf_counter()
+    lag = 0.0 # die Zeit, die noch nicht simuliert wurde
+
     # Spielloop
     while running:
+        if profiler is not None:
+            profiler.begin_frame()
+
         # Event-Handling
         for event in pygame.event.get():
             match event.type:
@@ -994,230 +1803,144 @@ def main() -> None:
                     handle_keyup_event(event)
                 case pygame.QUIT:
                     quit_game()
-    
-        update() # die Funktion update() aktualisiert alle Objekte, die im Fenster angezeigt werden
-        render(screen) # die Funktion render() rendert alles, was angezeigt werden soll
-        pygame.display.update() # das neu gerenderte Bild im Fenster anzeigen
-
-        clock.tick(FPS) # das Programm so lange zur Ruhe legen, dass 60 FPS erreicht werden
+        if profiler is not None:
+            profiler.lap('events')
+    
+        now = time.perf_counter()
+        lag += min(now - previous_time, MAX_LAG) # nach einer langen Unterbrechung nicht endlos aufholen
+        previous_time = now
+        while lag >= TICK_TIME and running:
+            update() # die Funktion update() aktualisiert alle Objekte, die im Fenster angezeigt werden
+            lag -= TICK_TIME
+        # die Funktion render() rendert alles, was angezeigt werden soll (optional zwischen zwei Ticks interpoliert):
+        render(screen, lag / TICK_TIME if INTERPOLATE else 0.0)
+        if profiler is not None:
+            dirty_rects.add(render_profiler_overlay(screen)) # die gemessenen Perzentile über dem Spiel anzeigen
+            profiler.lap('overlay')
+        # das neu gerenderte Bild im Fenster anzeigen (mit DIRTY_RECTS während eines Spiels nur die bemalten Rechtecke):
+        present(dirty_rects)
+        if profiler is not None:
+            profiler.lap('display update')
+
+        clock.tick(RENDER_FPS) # das Programm so lange zur Ruhe legen, dass höchstens RENDER_FPS Bilder gerendert werden
+        if profiler is not None:
+            profiler.lap('idle') # die Zeit, die clock.tick() gewartet hat (ein Frame ohne Wartezeit überzieht die 16,6 ms)
+            profiler.end_frame()
         
     # Nach dem Spielloop:
 
-    if game_over: # wenn das Spiel aus ist
-        reset_game_state() # den Spielstand zurücksetzen, damit er nicht gespeichert wird
-    elif add_points > 0: # wenn das Spiel noch läuft und noch Punkte zum Punktestand hinzuzufügen sind
-        score += add_points # die Punkte hinzufügen
-        add_points = 0 # keine Punkte mehr hinzuzufügen
+    if world.game_over: # wenn das Spiel aus ist
+        world.reset() # den Spielstand zurücksetzen, damit er nicht gespeichert wird
+    else: # wenn das Spiel noch läuft, die Punkte hinzufügen, die noch zum Punktestand hinzukommen
+        world.bank_points()
+    finish_recording() # die Aufzeichnung eines noch laufenden Spiels speichern
 
     update_high_scores() # die Highscores aktualisieren
 
+    autosaver.close() # warten, bis ein laufendes automatisches Speichern fertig ist
     save_game() # das Spiel speichern
 
     pygame.font.quit() # das Rendern von Schrift in Pygame beenden
+    sounds.wait() # ein noch laufendes Laden der Geräusche abwarten
     pygame.mixer.quit() # den Soundmixer von Pygame beenden
     pygame.quit() # das Spiel beenden
 
 
-# Diese Funktion initialisiert das Spiel:
+# Diese Funktion initialisiert das Spiel. Die Anzeige während eines Spiels wird erst angelegt, wenn sie gebraucht wird (s.
+# render()), und die Menüs werden erst beim ersten Anzeigen gerendert:
 def init() -> None:
+    global autosaver
     init_constants() # alle Konstanten initalisieren
-    load_game() # das Spiel aus der Datei „data.json“ laden
-    get_and_set_difficulty() # die Schwierigkeit anhand der bereits gespielten Ticks einstellen
-    render_life_surface() # die Oberfläche mit der Lebensanzeige rendern
+    init_fonts() # die Schriftarten der Menüs laden
+    startup_timer.lap('fonts')
+    load_game() # das Spiel aus der Datei „data.bin“ (oder „data.json“) laden
+    if ASTEROID_SPRITES:
+        world.sprite_cache = SpriteCache(SPRITE_CACHE_BYTES, SPRITE_ROTATION_STEPS)
+    autosaver = Autosaver(SAVE_FILE) # den Hintergrund-Thread für das automatische Speichern starten
+    startup_timer.lap('load game')
     init_menus() # die Menüs initialisieren
+    startup_timer.lap('menus')
 
 
-# Diese Funktion wird einmal pro Tick aufgerufen und aktualisiert alles zu Aktualisierende:
-def update() -> None:
-    global game_over, player, fragment, asteroids, saucer, saucer_on_screen, saucer_fragments, fire_bullet, bullets
-    global saucer_bullets, explosions, score, add_points, ticks_since_last_points, new_high_score, lives, playing_ticks
-
-    if opened_menu in (None, GAME_OVER_MENU): # Wenn kein Menü oder das Spiel-ist-aus-Menü geöffnet ist
-        if saucer is None:
-            # mit einer Wahrscheinlichkeit, die 15-mal geringer ist als die Wahrscheinlichkeit, dass ein Asteroid spawnt,
-            # eine neue fliegende Untertasse spawnen:
-            if random.random() < difficulty.asteroid_spawn_chance / 15:
-                saucer = new_saucer()
-        else:
-            saucer.update()
-            if saucer_on_screen:
-                saucer_on_screen = saucer.on_screen()
-                if not saucer_on_screen: # wenn die fliegende Untertasse aus dem Fenster verschwindet
-                    (sounds.SAUCERSMALL if saucer.size.sound == 0 else sounds.SAUCERBIG).stop() # ihr Geräusch beenden
-                    saucer = None # die fliegende Untertasse despawnen
-            else:
-                saucer_on_screen = saucer.on_screen()
-                # wenn der Spieler gerade spielt und eine fligende Untertasse im Fenster erscheint:
-                if playing() and saucer_on_screen:
-                    (sounds.SAUCERSMALL if saucer.size.sound == 0 else sounds.SAUCERBIG).play(-1) # ihr Geräusch abspielen
-
-        for ls in (saucer_fragments, bullets, saucer_bullets, explosions):
-            for obj in ls:
-                obj.update() # alle Objekte in mehreren Listen aktualisieren
-
-        # eine Liste von Asteroiden, die evtl. gleich durch Zerteilungen entstehen und die bald zur Asteroidenliste addiert wird
-        asteroid_splits = []
-        for a in asteroids:
-            a.update() # jeden Asteroiden aktualisieren
-            # prüfen, ob der Astroid von einer von einer fliegenden Untertasse abgeschossenen Kugel getroffen worden ist:
-            a.check_hit(saucer_bullets, 2)
-            a.check_hit(bullets, 1) # prüfen, ob der Asteroid von einer vom Spieler abgeschossenen Kugel getroffen worden ist
-            if a.hit_by != 0: # wenn der Asteroid getroffen worden ist
-                if a.hit_by == 1: # wenn der Asteroid vom Spieler getroffen worden ist
-                    if add_points > 0:
-                        score += add_points # zu addierende Punkte addieren
-                    add_points = a.size.points # zu addierende Punkte auf die dazubekommenen Punkte setzen
-                    # Wenn ein neuer Highscore erreicht worden ist:
-                    if score + add_points > (high_scores[0].score if len(high_scores) > 0 else 0):
-                        new_high_score = True 
-                if playing(): # Es könnte auch das Spiel-ist-aus-Menü geöffnet sein
-                    play_bang_sound(a.size)
-                asteroid_splits += split_asteroid(a) # den Asteroiden zerteilen
-                explosions.append(new_explosion(a.body.center.x, a.body.center.y, a.mot)) # eine neue Explosion erscheinen lassen
-
-        if fragment is None:
-            player.update() # wenn es kein Fragment gibt, gibt es einen Spieler, und dieser wird aktualisiert
-            if fire_bullet:
-                # die Kugel erscheint vorne am Raumschiff:
-                bullet_pos = player.body.polar_coordinates[0].cartesian().add(player.body.center)
-                
-                bullet_angle = player.body.polar_coordinates[0].theta # die Richtung, in die die Kugel geschossen werden soll
-                bullets.append(new_bullet(bullet_pos, bullet_angle)) # eine neue Kugel konstruieren und der Kugelliste hinzufügen
-                sounds.FIRE.play()
-                fire_bullet = False # nicht noch eine zweite Kugel schießen
-        else:
-            fragment.update() # das Fragment aktualisieren
-            # wenn nicht das Spiel-ist-aus-Menü angezeigt wird und das Fragment eine Sekunde angezeigt wurde:
-            if playing() and fragment.ticks == FPS:
-                player = new_player(start_invincible=True) # neuen (anfangs unbesiegbaren) Spieler konstruieren
-                fragment = None # das Fragment despawnen
-                # Wenn der Spieler eine Vorwärts-Taste noch drückt, das Geräusch des Schubs fortsetzen:
-                if pygame.key.get_pressed()[pygame.K_w] or pygame.key.get_pressed()[pygame.K_UP]:
-                    sounds.THRUST.play(-1)
-            fire_bullet = False # wenn es keinen Spieler gibt, kann nicht geschossen werden
-
-        if saucer is not None:
-            for a in asteroids:
-                if saucer.body.collides_with_polygon(a.body): # wenn die fliegende Untertasse mit einem Asteroiden kollidiert:
-                    saucer_die()
-                    asteroid_splits += split_asteroid(a) # den Asteroiden sprengen
-                    a.hit_by = 2
-                    explosions.append(new_explosion(a.body.center.x, a.body.center.y, a.mot)) # eine neue Explosion erscheinen lassen
-                    break # es müssen keine weiteren Kollisionen mit Asteroiden geprüft werden
-            if saucer is not None: # wenn es immer noch einen fliegende Untertasse gibt
-                saucer.check_hit(bullets, by=1)
-                saucer.check_hit(saucer_bullets, by=2)
-                if saucer.hit_by != 0: # wenn die fliegende Untertasse getroffen wurde
-                    if saucer.hit_by == 1: # wenn die fliegende Untertasse vom Spieler getroffen wurde
-                        if add_points > 0:
-                            score += add_points # die zu addierenden Punkte zur Punktzahl addieren
-                        # die nächsten zu addierenden Punkte anhand der Größe der fliegenden Untertasse setzen:
-                        add_points = saucer.size.points 
-                    saucer_die()
-                if saucer is not None: # wenn es immer noch eine fliegende Untertasse gibt
-                    # wenn es einen Spieler gibt und dieser nicht (mehr) unverwundbar ist und mit der fliegenden Untertasse
-                    # kollidiert:
-                    if player is not None and player.ticks >= INVINCIBILITY_TIME and player.body.collides_with_polygon(saucer.body):
-                        player_die()
-                        saucer_die()
-                    # sonst: mit der Wahrscheinlichkeit, dass die fliegende Untertasse eine Kugel abschießt, die fliegende
-                    # Untertasse eine Kugel abschießen lassen:
-                    elif random.random() < saucer.size.shoot_probability:
-                        # eine neue Fliegende-Untertasse-Kugel konstruieren und der Liste hinzufügen:
-                        saucer_bullets.append(new_saucer_bullet())
-                        if playing(): # es könnte auch das Spiel-ist-aus-Menü angezeigt werden
-                            sounds.FIRE.play()
-
-        # wenn der Spieler noch lebt er länger als die Unverwundbarkeitszeit lebt:
-        if player is not None and player.ticks >= INVINCIBILITY_TIME:
-            colliding_asteroid = player_collides_with_asteroid()
-            if colliding_asteroid is not None: # wenn der Spieler mit einem Asteroiden kollidiert
-                player_die()
-                asteroid_splits += split_asteroid(colliding_asteroid)
-                colliding_asteroid.hit_by = 2
-                # eine neue Explosion erscheinen lassen:
-                explosions.append(new_explosion(colliding_asteroid.body.center.x, colliding_asteroid.body.center.y,
-                                                colliding_asteroid.mot))
-                play_bang_sound(colliding_asteroid.size)
-            else: # sonst: der Spieler lebt noch
-                for b in saucer_bullets:
-                    if player.body.vector_in(b.pos): # wenn der Spieler von einer Kugel von einer f. Untertasse getroffen wird
-                        player_die()
-                        sounds.BANGMEDIUM.play()
-                        break # es muss nicht geprüft werden, ob der Spieler noch von weiteren Kugel getroffen wird
-
-        asteroids += asteroid_splits # die Stücke des zerbrochenen Asteroiden der Asteroidenliste hinzufügen
+# Diese Funktion lädt die Schriftarten der Anzeige während eines Spiels, rendert die Oberfläche mit der Lebensanzeige und legt
+# die Anzeige an:
+def init_hud() -> None:
+    global hud, SCORE_FONT, HIGHSCORE_FONT
+    SCORE_FONT = load_font(36)
+    HIGHSCORE_FONT = load_font(18)
+    render_life_surface()
+    hud = Hud(SCORE_FONT, HIGHSCORE_FONT, life_surface, Color.WHITE, Color.GREEN, Color.ORANGE)
 
-        # mit der Wahrscheinlichkeit, dass bei der aktuellen Schwierigkeit ein Asteroid spawnt, einen Asteroiden spawnen:
-        if random.random() < difficulty.asteroid_spawn_chance:
-            asteroids.append(new_asteroid_no_args()) # einen neuen Asteroiden konstruieren und der Asteroidenliste hinzufügen
 
-        # Die Liste der Asteroiden filtern: Es bleiben nur diejenigen übrig, die nicht getroffen worden sind
-        # und nicht außerhalb des Fensters sind:
-        asteroids = [a for a in asteroids if a.hit_by == 0 and not a.offscreen()]
-        bullets = [b for b in bullets if not b.to_remove()] # alle zu entfernenden Kugeln vom Spieler entfernen
-        saucer_bullets = [b for b in saucer_bullets if not b.to_remove()] # alle zu entfernenden Kugeln von f. Untertassen entfernen
-        explosions = [e for e in explosions if not e.to_remove()] # alle zu entfernenden Explosionen entfernen
-        saucer_fragments = [f for f in saucer_fragments if f.ticks < FPS] # alle zu entfernenden F.-Untertasse-Fragmente entfernen
+# Diese Funktion gibt die Dauern der Phasen des Programmstarts aus (s. startup.py):
+def print_startup_times() -> None:
+    print('\n'.join(startup_timer.report_lines()))
+    if sounds.load_seconds is None:
+        print('sounds are still loading in the background')
+    else:
+        print('sounds loaded in the background in %.2f ms' % (sounds.load_seconds * 1000))
 
-        if playing():
-            if add_points > 0: # wenn es Punkte gibt, die zur Punktzahl hinzukommen werden
-                if ticks_since_last_points == FPS: # wenn seit dem Erzielen der Punkte eine Sekunde vergangen ist
-                    score += add_points # die zu addierenden Punkte zur Punktzahl addieren
-                    add_points = 0 # die zu addierenden Punkte auf 0 setzen
-                    # die Anzahl von Ticks, die seit dem Erzielen der letzten Punkte vergangen sind, auf 0 setzen:
-                    ticks_since_last_points = 0
-                # die Anzahl von Tiks, die seit dem Erzielen der letzten Punkte vergangen sind, um eins erhöhen:
-                ticks_since_last_points += 1
-            beat()
-            playing_ticks += 1 # die Anzahl von Ticks, wie lange das Spiel schon dauert, um eins erhöhen
-            get_and_set_difficulty() # die Schwierigkeit ermitteln und setzen
-
-
-# Diese Funktion kümmert sich um das Rendern von allem, was zu rendern ist:
-def render(screen: pygame.Surface) -> None:
-    if playing() or opened_menu.transparent:
-        # alles rendern, was gerendert werden soll, wenn gerade ein Spiel läuft oder das geöffnete Menü transparent ist:
-        screen.fill(Color.BLACK)
-        if fragment is None:
-            player.render(screen) # wenn es kein Fragment gibt, gibt es einen Spieler; diesen rendern
-        else:
-            fragment.render(screen)
-        # alle Asteroiden, Kugeln, Kugeln fliegender Untertassen, Explosionen und Fragmente fliegender Untertassen rendern:
-        for ls in (asteroids, bullets, saucer_bullets, explosions, saucer_fragments):
-            for obj in ls:
-                obj.render(screen)
-        if saucer is not None:
-            saucer.render(screen) # wenn es eine fliegende Untertasse gibt, diese rendern
 
+# Diese Funktion wird einmal pro Tick aufgerufen und aktualisiert die Spielwelt mit der Eingabe von der Tastatur:
+def update() -> None:
+    global ticks_since_autosave
+    sounds.next_tick() # Geräusche, die in diesem Tick mehrmals ausgelöst werden, nur einmal abspielen
+    if opened_menu in (None, GAME_OVER_MENU): # Wenn kein Menü oder das Spiel-ist-aus-Menü geöffnet ist
+        player_input = keyboard_input()
+        if recording is not None:
+            recording.append(player_input.to_mask()) # die Eingabe aufzeichnen
+        world.step(player_input)
     if playing():
-        # alles rendern, was nur dann gerendert werden soll, wenn gerade ein Spiel läuft:
-        score_surface = SCORE_FONT.render(str(score), True, Color.WHITE)
-        screen.blit(score_surface, (15, 15)) # die Punktzahl rendern
-        if add_points > 0: # wenn Punkte zur Punktzahl hinzukommen
-            add_points_surface = SCORE_FONT.render('+%d' % add_points, True, Color.GREEN)
-            # die Punkte, die zur Punktzahl hinzukommen, in Grün rendern:
-            screen.blit(add_points_surface, (15 + score_surface.get_width(), 15)) 
-        if new_high_score: # wenn der Spieler einen neuen Highscore aufgestellt hat
-            # den neuen Highscore in Orange rendern:
-            screen.blit(HIGHSCORE_FONT.render(str(score + add_points), True, Color.ORANGE), (15, 58))
-        else:
-            # den Highscore in weiß rendern:
-            high_score_text = str(high_scores[0].score if len(high_scores) > 0 else (score + add_points))
-            screen.blit(HIGHSCORE_FONT.render(high_score_text, True, Color.WHITE), (15, 58))
-        for i in range(lives):
-            screen.blit(life_surface, (15 + i * 22, 90)) # für jedes Leben ein Raumschiff auf das Fenster malen
+        ticks_since_autosave += 1
+        if ticks_since_autosave >= AUTOSAVE_INTERVAL:
+            autosave()
+    if profiler is not None:
+        profiler.lap('autosave')
+
+
+# Diese Funktion kümmert sich um das Rendern von allem, was zu rendern ist (s. GameWorld.render() für „alpha“). Mit DIRTY_RECTS
+# werden während eines Spiels nur die Rechtecke gelöscht, die im letzten Frame bemalt wurden, und die bemalten Rechtecke werden
+# in „dirty_rects“ gesammelt (s. main()):
+def render(screen: pygame.Surface, alpha: float = 0.0) -> None:
+    if hud is None and (playing() or opened_menu is PAUSE_MENU):
+        init_hud() # die Anzeige (und die Lebensanzeige des Pausenmenüs) beim ersten Spiel anlegen
+    if DIRTY_RECTS and playing():
+        dirty_rects.begin(screen, Color.BLACK) # nur die Rechtecke des letzten Frames löschen
+        world.render(screen, alpha, clear=False)
+        dirty_rects.extend(world.covered_rects(alpha))
+        if profiler is not None:
+            profiler.lap('dirty rects')
+        dirty_rects.extend(render_hud(screen))
     else:
-        # alles rendern, was nur dann gerendert werden soll, wenn gerade KEIN Spiel läuft:
-        opened_menu.render(screen)
-        if opened_menu is PAUSE_MENU:
-            for i in range(lives): # die Leben in der Mitte unter der Menüüberschrift anzeigen
-                screen.blit(life_surface, ((WIDTH - 20 * lives - 2 * (lives - 1)) / 2 + i * 22, 205))
+        if playing() or opened_menu.transparent:
+            # die Spielwelt rendern, wenn gerade ein Spiel läuft oder das geöffnete Menü transparent ist:
+            world.render(screen, alpha if playing() else 0.0) # im Pausenmenü steht die Welt still
 
-
-# Diese Funktion initialisiert alle Kontanten des Spiels, die noch nicht zugewiesen sind, außer die Menüs. (Das geschieht nur hier):
+        if playing():
+            render_hud(screen)
+        else:
+            # alles rendern, was nur dann gerendert werden soll, wenn gerade KEIN Spiel läuft:
+            opened_menu.render(screen)
+            if opened_menu is PAUSE_MENU:
+                lives = world.lives
+                for i in range(lives): # die Leben in der Mitte unter der Menüüberschrift anzeigen
+                    screen.blit(life_surface, ((WIDTH - 20 * lives - 2 * (lives - 1)) / 2 + i * 22, 205))
+    if profiler is not None:
+        profiler.lap('render hud')
+
+
+# Diese Funktion rendert alles, was nur dann gerendert werden soll, wenn gerade ein Spiel läuft (die Punktzahl, den Highscore und
+# die Leben), und gibt die bemalten Rechtecke zurück (s. hud.py):
+def render_hud(screen: pygame.Surface) -> list[pygame.Rect]:
+    score, add_points = world.score, world.add_points
+    high_score = high_scores[0].score if len(high_scores) > 0 else (score + add_points) # der beste bisherige Highscore
+    return hud.render(screen, score, add_points, high_score, world.new_high_score, world.lives)
+
+
+# Diese Funktion initialisiert alle Kontanten des Spiels, die noch nicht zugewiesen sind, außer die Schriftarten und die Menüs.
+# (Das geschieht nur hier):
 def init_constants() -> None:
-    global ASTEROID_SPAWN_DISTANCE, ASTEROID_DESPAWN_DISTANCE, SCORE_FONT, HIGHSCORE_FONT, TITLE_FONT, TEXT_FONT, BUTTON_FONT
+    global ASTEROID_SPAWN_DISTANCE, ASTEROID_DESPAWN_DISTANCE
     
     # Die Entfernung von Asteroiden von der Mitte des Fensters bei ihrem Erscheinen
     # (die Entfernung zu den Ecken plus den durchschnittlichen Radius von Asteroiden mal 1,4):
@@ -1226,13 +1949,17 @@ def init_constants() -> None:
     # der Despawn-Radius ist ein gutes Stück (25 Pixel) größer als der Spawn-Radius,
     # damit gerade erschienene Asteroiden nicht gleich wieder despawnen:
     ASTEROID_DESPAWN_DISTANCE = ASTEROID_SPAWN_DISTANCE + 25
+
+
+# Diese Funktion lädt die Schriftarten der Menüs (die der Anzeige während eines Spiels lädt init_hud()). Für die
+# Headless-Simulation werden sie nicht gebraucht:
+def init_fonts() -> None:
+    global TITLE_FONT, TEXT_FONT, BUTTON_FONT
     
-    # Die Schriftarten laden:
-    SCORE_FONT = pygame.font.Font('hyperspace-font/HyperspaceBold.ttf', 36)
-    HIGHSCORE_FONT = pygame.font.Font('hyperspace-font/HyperspaceBold.ttf', 18)
-    TITLE_FONT = pygame.font.Font('hyperspace-font/HyperspaceBold.ttf', 56)
-    TEXT_FONT = pygame.font.Font('hyperspace-font/HyperspaceBold.ttf', 28)
-    BUTTON_FONT = pygame.font.Font('hyperspace-font/HyperspaceBold.ttf', 28)
+    # Die Schriftarten laden (Texte und Buttons teilen sich eine Schriftart derselben Größe):
+    TITLE_FONT = load_font(56)
+    TEXT_FONT = load_font(28)
+    BUTTON_FONT = load_font(28)
     
     # SCORE_FONT = pygame.font.SysFont('Impact', 36)
     # HIGHSCORE_FONT = pygame.font.SysFont('Impact', 18)
@@ -1242,13 +1969,31 @@ def init_constants() -> None:
     
 
 
+# Diese Funktion gibt die Schriftart FONT_FILE in einer Größe zurück. Jede Größe wird nur einmal geladen:
+def load_font(size: int) -> pygame.font.Font:
+    font = fonts.get(size)
+    if font is None:
+        font = fonts[size] = pygame.font.Font(FONT_FILE, size)
+    return font
+
+
+# Diese Funktion gibt den Hintergrund für Menüs zurück, die transparent sind oder nicht. Alle Menüs teilen sich diese beiden
+# Hintergründe:
+def menu_background(transparent: bool) -> pygame.Surface:
+    background = menu_backgrounds.get(transparent)
+    if background is None:
+        background = menu_backgrounds[transparent] = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        pygame.draw.rect(background, Color.BLACK_ALPHA if transparent else Color.BLACK, background.get_rect())
+    return background
+
+
 # Diese Funktion initialisiert die Menüs:
 def init_menus() -> None:
     global MAIN_MENU, PAUSE_MENU, GAME_OVER_MENU, SETTINGS_MENU, RESET_ALL_CONFIRM_MENU, HIGH_SCORES_MENU
     
     # das Hauptmenü initialisieren:
     MAIN_MENU = Menu(title='Asteroids', text=None, transparent=False, parent=None, button_data=(
-        ButtonData(text='Continue', active=not game_over, on_action=continue_game),
+        ButtonData(text='Continue', active=not world.game_over, on_action=continue_game),
         ButtonData(text='New Game', active=True, on_action=lambda: (set_timestamp_for_new_highscore(), new_game())),
         ButtonData(text='High Scores', active=True, on_action=open_high_scores_menu),
         ButtonData(text='Settings', active=True, on_action=lambda: open_menu(SETTINGS_MENU)),
@@ -1289,24 +2034,6 @@ def init_menus() -> None:
     open_menu(MAIN_MENU) # das Hauptmenü als aktuelles Menü setzen
 
 
-# Diese Funktion kümmert sich darum, dass zu den richtigen Zeitpunkten der Beat abgespielt wird:
-def beat() -> None:
-    global last_sound_tick, play_beat_1
-    
-    # das Intervall anhand der Spielzeit bestimmen:
-    if playing_ticks <= FPS * 30:
-        interval = (-2 / (FPS * 1.5)) * playing_ticks + FPS # in den ersten 30 Sekunden immer schneller
-    else:
-        interval = FPS / 3 # nach 30 Sekunden immer dreimal pro Sekunde
-
-    # prüfen, ob es Zeit ist, das Geräusch abzuspielen:
-    if playing_ticks - last_sound_tick >= interval:
-        (sounds.BEAT1 if play_beat_1 else sounds.BEAT2).play() # den Beat abspielen
-        play_beat_1 = not play_beat_1
-        last_sound_tick = playing_ticks # den letzten Abspielzeitpunkt aktualisieren
-
-
-
 # Diese Funktion öffnet ein Menü und wählt dessen obersten Button aus:
 def open_menu(menu: Menu | None) -> None:
     global opened_menu
@@ -1317,78 +2044,39 @@ def open_menu(menu: Menu | None) -> None:
 
 # Diese Funktion aktualisiert und öffnet das Highscore-Menü
 def open_high_scores_menu() -> None:
-    HIGH_SCORES_MENU.set_text(high_scores_text(), update_buttons_y=True) # das Highscore-Menü aktualisieren
+    HIGH_SCORES_MENU.set_text(high_scores_text()) # das Highscore-Menü aktualisieren
     open_menu(HIGH_SCORES_MENU)
 
 
 # Diese Funktion setzt das Spiel fort:
 def continue_game() -> None:
     open_menu(None) # das geöffnete Menü schließen
-    if saucer is not None and saucer_on_screen: # wenn es eine fliegende Untertasse gibt, die sich auf dem Bildschirm befindet
+    # wenn es eine fliegende Untertasse gibt, die sich auf dem Bildschirm befindet:
+    if world.saucer is not None and world.saucer_on_screen:
         # das Geräusch der fliegenden Untertasse fortsetzen:
-        sound = sounds.SAUCERSMALL if saucer.size.sound == 0 else sounds.SAUCERBIG
+        sound = sounds.SAUCERSMALL if world.saucer.size.sound == 0 else sounds.SAUCERBIG
         sound.play(-1)
 
 
-# Diese Funktion wird aufgerufen, wenn ein neues Spiel gestartet wird:
+# Diese Funktion wird aufgerufen, wenn ein neues Spiel gestartet wird. Der Zufallsgenerator der Spielwelt bekommt dabei einen
+# neuen Startwert, damit das Spiel mit ihm und der aufgezeichneten Eingabe nachgespielt werden kann:
 def new_game() -> None:
-    global game_over, player, fragment, saucer, saucer_on_screen, fire_bullet, score, add_points, ticks_since_last_points
-    global new_high_score, lives, playing_ticks, last_sound_tick, play_beat_1
-    game_over = False
-    player = new_player(start_invincible=False)
-    fragment = None
-    asteroids.clear() # die Liste der Asteroiden leeren
-    for _ in range(3): # drei neue Asteroiden der Liste hinzufügen
-        asteroids.append(new_asteroid_no_args())
-    saucer = None
-    saucer_on_screen = False
-    saucer_fragments.clear() # die Liste der Fragmente fliegender Untertassen leeren
-    fire_bullet = False
-    bullets.clear() # die Liste der Kugeln leeren
-    saucer_bullets.clear() # die Liste der Kugeln fliegender Untertassen leeren
-    explosions.clear() # die Liste der Explosionen leeren
-    score = 0
-    add_points = 0
-    ticks_since_last_points = 0 # die Anzahl von Ticks, seitdem das letzte Mal Punkte geholt wurden, auf 0 zurücksetzen
-    new_high_score = False
-    lives = 3
-    playing_ticks = 0
-    last_sound_tick = 0
-    play_beat_1 = True
-    get_and_set_difficulty() # die Schwierigkeit anhand der bereits gespielten Ticks einstellen
+    global recording
+    finish_recording() # eine noch laufende Aufzeichnung (eines abgebrochenen Spiels) speichern
+    world.high_score = best_high_score()
+    seed = random.randrange(2 ** 63)
+    world.rng.seed(seed)
+    world.new_game()
+    if RECORD_REPLAYS:
+        recording = Recording(seed, world.high_score, world.asteroid_arrays is not None)
     open_menu(None)
     for b in (MAIN_MENU.buttons[0], SETTINGS_MENU.buttons[0], SETTINGS_MENU.buttons[1]): # Buttons in Menüs reaktivieren
         b.active = True
 
 
-# Diese Funktion setzt den Spielstand zurück:
-def reset_game_state() -> None:
-    global game_over, player, fragment, saucer, saucer_on_screen, fire_bullet, score, add_points, ticks_since_last_points
-    global new_high_score, lives, playing_ticks, difficulty
-    game_over = True
-    player = None
-    fragment = None
-    asteroids.clear() # die Liste der Asteroiden leeren
-    saucer = None
-    saucer_on_screen = False # wenn es keine fliegende Untertasse gibt, ist auch keine im Fenster
-    saucer_fragments.clear() # die Liste der Fragmente fliegender Untertassen leeren
-    saucer_bullets.clear() # die Liste der Kugeln fliegender Untertassen leeren
-    fire_bullet = False
-    bullets.clear() # die Liste der Kugeln leeren
-    saucer_bullets.clear() # die Liste der Kugeln fliegender Untertassen leeren
-    explosions.clear() # die Liste der Explosionen leeren
-    score = 0
-    add_points = 0
-    ticks_since_last_points = 0 # die Anzahl von Ticks, seitdem das letzte Mal Punkte geholt wurden, auf 0 zurücksetzen 
-    new_high_score = False
-    lives = 0
-    playing_ticks = 0 # 0 Ticks gespielt
-    difficulty = None # keine Schwierigkeit
-
-
 # Diese Menü wird aus einem Menü heraus aufgerufen und setzt den Spielstand zurück:
 def reset_game_state_from_menu() -> None:
-    reset_game_state() # den Spielstand zurücksetzen
+    world.reset() # den Spielstand zurücksetzen
     MAIN_MENU.buttons[0].active = False # den Button „Continue“ im Hauptmenü inaktiv setzen
     SETTINGS_MENU.deselect_all_buttons() # alle Buttons im Einstellungsmenü deselektieren
     SETTINGS_MENU.buttons[0].active = False # den Button „Reset Game State“ im Einstellungsmenü inaktiv setzen
@@ -1398,7 +2086,7 @@ def reset_game_state_from_menu() -> None:
 # Diese Funktion setzt alles zurück, also die Highscores und den Spielstand
 def reset_all() -> None:
     global high_scores
-    reset_game_state()
+    world.reset()
     high_scores = []
     for b in (MAIN_MENU.buttons[0], SETTINGS_MENU.buttons[0], SETTINGS_MENU.buttons[1]):
         b.active = False
@@ -1411,47 +2099,33 @@ def quit_game() -> None:
     running = False # die globale Variable, die speichert, ob das Spiel läuft, auf „falsch“ setzen
 
 
-# Diese Funktion wird aufgerufen, wenn der Spieler sterben soll:
-def player_die() -> None:
-    global player, fragment, game_over, score, add_points, lives
-    lives -= 1 # ein Leben abziehen
-    if lives == 0:
-        # Wenn Punkte zu addieren sind, diese addieren und auf 0 setzen
-        if add_points > 0:
-            score += add_points
-            add_points = 0
-
-        game_over = True
-        
-        # Das Spiel-ist-aus-Menü anpassen und anzeigen:
-        GAME_OVER_MENU.set_text('%d%s' % (score, ' (new high score)' if new_high_score else ''), update_buttons_y=True)
-        open_menu(GAME_OVER_MENU)
-        
-        MAIN_MENU.buttons[0].active = False # den Button „Continue“ im Hauptmenü deaktivieren
-        update_high_scores() # die Highscores aktualisieren
-        sounds.SAUCERSMALL.stop()
-        sounds.SAUCERBIG.stop()
-    fragment = new_fragment() # ein neues Fragment konstruieren und spawnen
-    sounds.THRUST.stop()
-    player = None # den Spieler despawnen
+# Diese Funktion wird aufgerufen, wenn der Spieler sein letztes Leben verloren hat:
+def show_game_over_menu() -> None:
+    # Das Spiel-ist-aus-Menü anpassen und anzeigen:
+    GAME_OVER_MENU.set_text('%d%s' % (world.score, ' (new high score)' if world.new_high_score else ''))
+    open_menu(GAME_OVER_MENU)
     
+    MAIN_MENU.buttons[0].active = False # den Button „Continue“ im Hauptmenü deaktivieren
+    update_high_scores() # die Highscores aktualisieren
+    autosave() # den neuen Highscore sofort sichern
+    finish_recording() # die Aufzeichnung des Spiels speichern
 
-# Diese Funktion wird aufgerufen, wenn die fliegende Untertasse sterben soll:
-def saucer_die() -> None:
-    global saucer, saucer_on_screen
-    if playing(): # Es könnte auch das Spiel-ist-aus-Menü angezeigt werden
-        play_bang_sound(saucer.size) # je nach der Größe der fliegenden Untertasse ein Knallgeräusch abspielen
-    saucer_fragments.append(new_saucer_fragment()) # das Fragment der fliegenden Untertasse der Liste hinzufügen
-    saucer = None
-    saucer_on_screen = False
-    # beide Fliegende-Untertasse-Geräusche stoppen:
-    sounds.SAUCERSMALL.stop()
-    sounds.SAUCERBIG.stop()
+
+# Diese Funktion beendet die Aufzeichnung des laufenden Spiels (falls es eine gibt) und speichert sie in REPLAY_FILE:
+def finish_recording() -> None:
+    global recording
+    if recording is not None and len(recording) > 0:
+        try:
+            save_recording(REPLAY_FILE, recording)
+        except OSError:
+            pass # Ohne Aufzeichnung kann trotzdem weitergespielt werden
+    recording = None
 
 
 # Diese Funktion aktualisiert die Highscores:
 def update_high_scores() -> None:
     global high_scores
+    score, game_over = world.score, world.game_over
     if score > 0:
         if -1 in [h.timestamp for h in high_scores]: # wenn gerade ein Spiel läuft
             for (i, h) in enumerate(high_scores):
@@ -1464,6 +2138,11 @@ def update_high_scores() -> None:
             high_scores = high_scores[:5] # nur die ersten fünf Highscores behalten
 
 
+# Diese Funktion gibt den besten Highscore zurück (oder 0, wenn es noch keinen gibt):
+def best_high_score() -> int:
+    return high_scores[0].score if len(high_scores) > 0 else 0
+
+
 # Diese Funktion setzt den Zeitstempel für einen neuen Highscore:
 def set_timestamp_for_new_highscore() -> None:
     for h in high_scores:
@@ -1472,89 +2151,97 @@ def set_timestamp_for_new_highscore() -> None:
             return # es kann nur einen Highscore im gerade laufenden Spiel geben
 
 
-# Wenn der Spieler mit einem Asteroiden kollidiert, gibt diese Funktion diesen zurück (andernfalls None):
-def player_collides_with_asteroid() -> Asteroid | None:
-    for a in asteroids:
-        if player.body.collides_with_polygon(a.body): # den ersten Asteroiden finden, der mit dem Spieler kollidiert
-            return a
-    return None # wenn kein Asteroid gefunden wurde, der mit dem Spieler kollidiert
-
-
-# Diese Funktion konstruiert eine neue Linie und gibt sie zurück:
-def new_line(a: Vector, b: Vector, mot: Vector, turning_angle: float, stroke_weight: int) -> Line:
-    a_to_b = b.sub(a)
-    center = a_to_b.mult(random.random()).add(a)
-    center_to_a = to_polar(a.sub(center))
-    center_to_b = to_polar(b.sub(center))
-    mot = mot.add(PolarCoordinate(random.random() * 2 * math.pi, random.uniform(0.3, 0.45)).cartesian())
-    rot = turning_angle + random.uniform(-0.045, 0.045)
-    return Line(center, center_to_a, center_to_b, mot, rot, stroke_weight)
+# Diese Funktion konstruiert eine neue Linie (oder nimmt sie aus einem Pool) und gibt sie zurück. Die Werte werden direkt aus
+# den Koordinaten berechnet, ohne dafür Vektoren zu konstruieren (mit denselben Rechenschritten wie mit Vektoren):
+def new_line(a: Vector, b: Vector, mot: Vector, turning_angle: float, stroke_weight: int, rng: random.Random,
+             pool: Pool[Line] | None = None) -> Line:
+    line = empty_line() if pool is None else pool.acquire()
+    f = rng.random() # an welcher Stelle zwischen A und B der Mittelpunkt liegt
+    cx = (b.x - a.x) * f + a.x
+    cy = (b.y - a.y) * f + a.y
+    line.center.set(cx, cy)
+    (dx, dy) = (a.x - cx, a.y - cy)
+    line.center_to_a.set(math.atan2(dy, dx), math.sqrt(dx ** 2 + dy ** 2))
+    (dx, dy) = (b.x - cx, b.y - cy)
+    line.center_to_b.set(math.atan2(dy, dx), math.sqrt(dx ** 2 + dy ** 2))
+    theta = rng.random() * 2 * math.pi
+    speed = rng.uniform(0.3, 0.45)
+    line.mot.set(mot.x + speed * math.cos(theta), mot.y + speed * math.sin(theta))
+    line.rot = turning_angle + rng.uniform(-0.045, 0.045)
+    line.stroke_weight = stroke_weight
+    return line
 
 
 # Diese Funktion konstruiert ein neues Fragment für den Spieler und gibt es zurück:
-def new_fragment() -> Fragment:
+def new_fragment(player: Player, rng: random.Random, pool: Pool[Fragment] | None = None,
+                 line_pool: Pool[Line] | None = None) -> Fragment:
     vectors = player.body.cartesian()
-    lines = [new_line(a=Vector(vectors[i].x, vectors[i].y),
-                      b=Vector(vectors[(i + 1) % len(vectors)].x, vectors[(i + 1) % len(vectors)].y),
-                      mot=player.mot, turning_angle=player.turning_angle, stroke_weight=2) for i in range(len(vectors))]
-    return Fragment(lines, ticks=0)
+    fragment = empty_fragment() if pool is None else pool.acquire()
+    for i in range(len(vectors)):
+        fragment.lines.append(new_line(a=vectors[i], b=vectors[(i + 1) % len(vectors)], mot=player.mot,
+                                       turning_angle=player.turning_angle, stroke_weight=2, rng=rng, pool=line_pool))
+    fragment.ticks = 0
+    return fragment
 
 
 # Diese Funktion konstruiert ein neues Fragment einer fliegenden Untertasse und gibt es zurück:
-def new_saucer_fragment() -> Fragment:
+def new_saucer_fragment(saucer: Saucer, rng: random.Random, pool: Pool[Fragment] | None = None,
+                        line_pool: Pool[Line] | None = None) -> Fragment:
     vectors = saucer.body.cartesian()
-    lines = [new_line(Vector(vectors[i].x, vectors[i].y), Vector(vectors[(i + 1) % len(vectors)].x, vectors[(i + 1) % len(vectors)].y), saucer.mot, 0, saucer.size.stroke_weight) for i in range(len(vectors))]
-    l1a = saucer.body.polar_coordinates[1].cartesian().add(saucer.body.center)
-    l1b = saucer.body.polar_coordinates[6].cartesian().add(saucer.body.center)
-    l2a = saucer.body.polar_coordinates[2].cartesian().add(saucer.body.center)
-    l2b = saucer.body.polar_coordinates[5].cartesian().add(saucer.body.center)
-    lines.append(new_line(Vector(l1a.x, l1a.y), Vector(l1b.x, l1b.y), saucer.mot, 0, saucer.size.stroke_weight))
-    lines.append(new_line(Vector(l2a.x, l2a.y), Vector(l2b.x, l2b.y), saucer.mot, 0, saucer.size.stroke_weight))
-    return Fragment(lines, 0)
+    fragment = empty_fragment() if pool is None else pool.acquire()
+    lines = fragment.lines
+    for i in range(len(vectors)):
+        lines.append(new_line(vectors[i], vectors[(i + 1) % len(vectors)], saucer.mot, 0, saucer.size.stroke_weight, rng,
+                              line_pool))
+    # die zwei Linien, die von links nach rechts gehen:
+    lines.append(new_line(vectors[1], vectors[6], saucer.mot, 0, saucer.size.stroke_weight, rng, line_pool))
+    lines.append(new_line(vectors[2], vectors[5], saucer.mot, 0, saucer.size.stroke_weight, rng, line_pool))
+    fragment.ticks = 0
+    return fragment
 
 
 # Diese Funktion konstruiert einen neuen Asteroiden und gibt ihn zurück:
-def new_asteroid(size: AsteroidSize, pos: Vector, mot_angle: Vector) -> Asteroid:
-    corners = random.randint(7, 11) # 7 bis 11 Ecken für den neuen Asteroiden
-    angle = random.random() * 2 * math.pi / corners # der Winkel, mit dem die Generierung der Polarkoordinaten beginnt
+def new_asteroid(size: AsteroidSize, pos: Vector, mot_angle: Vector, rng: random.Random) -> Asteroid:
+    corners = rng.randint(7, 11) # 7 bis 11 Ecken für den neuen Asteroiden
+    angle = rng.random() * 2 * math.pi / corners # der Winkel, mit dem die Generierung der Polarkoordinaten beginnt
     angle_play = 2 * math.pi / corners # der Spielraum für Winkel
     polar_coordinates = []
 
     # die Ecken konstruieren:
     for _ in range(corners):
-        theta = angle + angle_play * random.random()
-        radius = size.avg_radius * random.uniform(0.6, 1.4) # den durchschnittlichen Radius mit einer zufälligen Zahl in einer Spanne multiplizieren
+        theta = angle + angle_play * rng.random()
+        radius = size.avg_radius * rng.uniform(0.6, 1.4) # den durchschnittlichen Radius mit einer zufälligen Zahl in einer Spanne multiplizieren
         polar_coordinate = PolarCoordinate(theta, radius)
         polar_coordinates.append(polar_coordinate)
         angle += 2 * math.pi / corners # insgesamt ein voller Kreis
         
     body = Polygon(center=pos, polar_coordinates=tuple(polar_coordinates), stroke_weight=size.stroke_weight, visible=True)
-    speed = random.uniform(size.min_speed, size.max_speed)
+    speed = rng.uniform(size.min_speed, size.max_speed)
     mot = PolarCoordinate(mot_angle, speed).cartesian()
-    rot = size.min_speed * random.uniform(-0.01, 0.01)
+    rot = size.min_speed * rng.uniform(-0.01, 0.01)
 
     return Asteroid(size, body, mot_angle, mot, rot, 0)
 
 
-def new_asteroid_no_args() -> Asteroid:
-    size = randsize() # eine zufällige Größe bestimmen
-    spawn_angle = random.uniform(0.0, math.pi * 2) # Asteroiden erscheinen in einem Kreis um um das Fenter herum
+def new_asteroid_no_args(rng: random.Random) -> Asteroid:
+    size = randsize(rng) # eine zufällige Größe bestimmen
+    spawn_angle = rng.uniform(0.0, math.pi * 2) # Asteroiden erscheinen in einem Kreis um um das Fenter herum
     pos = PolarCoordinate(spawn_angle, ASTEROID_SPAWN_DISTANCE).cartesian().add(CENTER)
-    mot_angle = spawn_angle + math.pi + random.uniform(-math.pi * 0.375, math.pi * 0.375)
-    return new_asteroid(size, pos, mot_angle)
+    mot_angle = spawn_angle + math.pi + rng.uniform(-math.pi * 0.375, math.pi * 0.375)
+    return new_asteroid(size, pos, mot_angle, rng)
 
 
 # Diese Funktion zerteilt einen Asteroiden in zwei Stücke, wenn er groß genug ist; sonst gibt sie eine leere Liste zurück:
-def split_asteroid(asteroid: Asteroid) -> list[Asteroid]:
+def split_asteroid(asteroid: Asteroid, rng: random.Random) -> list[Asteroid]:
     if asteroid.size is ASTEROID_SIZES['large']:
         size = ASTEROID_SIZES['medium'] # wenn der Asteroid groß ist, sind die Stücke, in die er zerteilt wird, mittelgroß
     elif asteroid.size is ASTEROID_SIZES['medium']:
         size = ASTEROID_SIZES['small'] # wenn der Asteroid mittelgroß ist, sind die Stücke, in die er zerteilt wird, klein
     else: # wenn der Asteroid klein ist
         return []
-    mot_angle_1 = asteroid.mot_angle - random.random() * math.pi / 4 # ein ähnlicher Winkel mit etwas Variation
-    mot_angle_2 = asteroid.mot_angle + random.random() * math.pi / 4
-    return [new_asteroid(size, asteroid.body.center, mot_angle_1), new_asteroid(size, asteroid.body.center, mot_angle_2)]
+    mot_angle_1 = asteroid.mot_angle - rng.random() * math.pi / 4 # ein ähnlicher Winkel mit etwas Variation
+    mot_angle_2 = asteroid.mot_angle + rng.random() * math.pi / 4
+    return [new_asteroid(size, asteroid.body.center, mot_angle_1, rng), new_asteroid(size, asteroid.body.center, mot_angle_2, rng)]
 
 
 # Diese Funktion konstruiert einen neuen Spieler und gibt ihn zurück:
@@ -1564,33 +2251,33 @@ def new_player(start_invincible: bool) -> Player:
 
 
 # Diese Funktion konstruiert eine fliegende Untertasse und gibt sie zurück:
-def new_saucer() -> Saucer:
+def new_saucer(rng: random.Random) -> Saucer:
     # eine kleine fliegende Untertasse mit einer Wahrscheinlichkeit von 1/5; sonst eine große:
-    size = SAUCER_SIZES['large'] if random.random() > 0.2 else SAUCER_SIZES['small']
+    size = SAUCER_SIZES['large'] if rng.random() > 0.2 else SAUCER_SIZES['small']
     
-    side = random.choices(range(4), weights=SIDE_PROBABILITIES)[0] # die Seite, an der die fliegende Untertasse erscheint
+    side = rng.choices(range(4), weights=SIDE_PROBABILITIES)[0] # die Seite, an der die fliegende Untertasse erscheint
     
     match side:
         case 0: # obere Seite
             # eine zufällige Postion am oberen Rand:
-            pos = Vector(random.uniform(-size.radius, WIDTH + size.radius), -size.radius)
+            pos = Vector(rng.uniform(-size.radius, WIDTH + size.radius), -size.radius)
             # ein zufälliger Winkel, der im Durchschnitt gerade nach unten geht:
-            mot_angle = random.uniform(math.pi * 0.125, math.pi * 0.875)
+            mot_angle = rng.uniform(math.pi * 0.125, math.pi * 0.875)
         case 1: # rechte Seite
             # eine zufällige Position am rechten Rand:
-            pos = Vector(WIDTH + size.radius, random.uniform(-size.radius, HEIGHT + size.radius))
+            pos = Vector(WIDTH + size.radius, rng.uniform(-size.radius, HEIGHT + size.radius))
             # ein zufälliger Winkel, der im Durchschnitt gerade nach links geht:
-            mot_angle = random.uniform(math.pi * 0.625, math.pi * 1.375)
+            mot_angle = rng.uniform(math.pi * 0.625, math.pi * 1.375)
         case 2: # untere Seite
             # eine zufällige Position am unteren Rand:
-            pos = Vector(random.uniform(-size.radius, WIDTH + size.radius), HEIGHT + size.radius)
+            pos = Vector(rng.uniform(-size.radius, WIDTH + size.radius), HEIGHT + size.radius)
             # ein zufälliger Winkel, der im Durchschnitt gerade nach oben geht:
-            mot_angle = random.uniform(-math.pi * 0.875, -0.125)
+            mot_angle = rng.uniform(-math.pi * 0.875, -0.125)
         case 3: # linke Seite
             # eine zufällige Position am linken Rand:
-            pos = Vector(-size.radius, random.uniform(-size.radius, HEIGHT + size.radius))
+            pos = Vector(-size.radius, rng.uniform(-size.radius, HEIGHT + size.radius))
             # ein zufälliger Winkel, der im Durchschnitt gerade nach rechts geht:
-            mot_angle = random.uniform(-math.pi * 0.375, math.pi * 0.375)
+            mot_angle = rng.uniform(-math.pi * 0.375, math.pi * 0.375)
             
     # den Körper der fliegenden Untertasse mit all seinen Polarkoordinaten konstruieren:
     body = Polygon(center=pos, polar_coordinates=(
@@ -1605,52 +2292,111 @@ def new_saucer() -> Saucer:
     ), stroke_weight=size.stroke_weight, visible=True)
     
     # die restlichen Werte der fliegenden Untertasse:
-    speed = random.uniform(size.min_speed, size.max_speed)
-    steps = random.randint(SAUCER_MIN_STEPS, SAUCER_MAX_STEPS)
+    speed = rng.uniform(size.min_speed, size.max_speed)
+    steps = rng.randint(SAUCER_MIN_STEPS, SAUCER_MAX_STEPS)
     mot = PolarCoordinate(mot_angle, speed).cartesian() # die Bewegung der fliegenden Untertasse
     
     # die fliegende Untertasse konstruieren und zurückgeben:
     return Saucer(size, body, mot, speed, steps, 0, 0)    
 
 
-# Diese Funktion konstruiert eine Kugel und gibt sie zurück:
-def new_bullet(pos: Vector, angle: float) -> Bullet:
-    mot = PolarCoordinate(angle, BULLET_SPEED).cartesian() # die Bewegung der neuen Kugel
-    return Bullet(pos, mot) # die neue Kugel konstruieren und zurückgeben
-
-
-def new_saucer_bullet() -> SaucerBullet:
+# Diese Funktion gibt die erste Kugel zurück, die im letzten Tick ein Polygon getroffen hat, das sich dabei um „mot“ bewegt hat
+# (oder None). Kugeln, die in diesem Tick schon etwas getroffen haben, werden übersprungen. Die ersten Kugeln werden einzeln
+# geprüft, weil meistens schon eine davon trifft; hat keine davon getroffen, werden die übrigen alle auf einmal mit NumPy geprüft
+# (mit genau denselben Ergebnissen wie Bullet.hits()):
+def find_hit(bullets: list[Bullet], polygon: Polygon, mot: Vector) -> Bullet | None:
+    count = len(bullets)
+    if first_hit is not None and count > HIT_KERNEL_MIN_BULLETS:
+        count = HIT_KERNEL_MIN_BULLETS
+    for b in itertools.islice(bullets, count):
+        if not b.dead and b.hits(polygon, mot):
+            return b
+    if count == len(bullets):
+        return None
+    rest = bullets[count:]
+    index = first_hit(rest, polygon.points(), polygon.bounding_radius(), mot.x, mot.y)
+    return None if index < 0 else rest[index]
+
+
+# Diese Funktion konstruiert eine Kugel (oder nimmt sie aus einem Pool) und gibt sie zurück:
+def new_bullet(pos: Vector, angle: float, pool: Pool[Bullet] | None = None) -> Bullet:
+    bullet = empty_bullet() if pool is None else pool.acquire()
+    bullet.dead = False
+    bullet.pos.set(pos.x, pos.y) # eine Kopie der Position (sie ist oft eine Ecke des Raumschiffs)
+    bullet.mot.set(BULLET_SPEED * math.cos(angle), BULLET_SPEED * math.sin(angle)) # die Bewegung der neuen Kugel
+    return bullet
+
+
+# Diese Funktion konstruiert eine Kugel, die die fliegende Untertasse auf den Spieler (falls es ihn gibt) abschießt:
+def new_saucer_bullet(saucer: Saucer, player: Player | None, rng: random.Random,
+                      pool: Pool[SaucerBullet] | None = None) -> SaucerBullet:
     if player is None:
         # Wenn es keinen Spieler gibt, schießt die fliegende Untertasse in eine zufällige Richtung:
-        saucer_fire_angle = random.random() * 2 * math.pi
+        saucer_fire_angle = rng.random() * 2 * math.pi
     else:
         # Wenn es einen Spieler gibt, schießt die fliegende Untertasse auf ihn:
         saucer_fire_angle = math.atan2(player.body.center.y - saucer.body.center.y, player.body.center.x - saucer.body.center.x)
-        saucer_fire_angle += random.uniform(-saucer.size.aim / 2, saucer.size.aim / 2) # die Zielgenauigkeit reduzieren
+        saucer_fire_angle += rng.uniform(-saucer.size.aim / 2, saucer.size.aim / 2) # die Zielgenauigkeit reduzieren
     
+    bullet = empty_saucer_bullet() if pool is None else pool.acquire()
+    bullet.dead = False
     # Die Kugel erscheint mit einem Abstand vom Radius der fliegenden Untertasse von dieser entfernt:
-    saucer_bullet_pos = PolarCoordinate(saucer_fire_angle, saucer.size.radius).cartesian().add(saucer.body.center)
-    
-    saucer_bullet_mot = PolarCoordinate(saucer_fire_angle, BULLET_SPEED).cartesian() # die Bewegung der Kugel
-    
-    # die Kugel konstruieren und zurückgeben:
-    return SaucerBullet(saucer_bullet_pos, saucer_bullet_mot, saucer.size.bullet_lifetime, 0)
+    (cos, sin) = (math.cos(saucer_fire_angle), math.sin(saucer_fire_angle))
+    bullet.pos.set(saucer.size.radius * cos + saucer.body.center.x, saucer.size.radius * sin + saucer.body.center.y)
+    bullet.mot.set(BULLET_SPEED * cos, BULLET_SPEED * sin) # die Bewegung der Kugel
+    bullet.lifetime = saucer.size.bullet_lifetime
+    bullet.ticks = 0
+    return bullet
+
+
+# Diese Funktion konstruiert eine neue Explosion aus zwei Koordinaten (oder nimmt sie und ihre Partikel aus Pools) und gibt sie
+# zurück:
+def new_explosion(x: float, y: float, mot: Vector, rng: random.Random, pool: Pool[Explosion] | None = None,
+                  particle_pool: Pool[Particle] | None = None) -> Explosion:
+    explosion = empty_explosion() if pool is None else pool.acquire()
+    for _ in range(rng.randint(3, 5)): # 3 bis 5 Partikel
+        explosion.particles.append(new_particle(x, y, mot, rng, particle_pool))
+    return explosion
+
+
+# Diese Funktion konstruiert ein neues Partikel aus zwei Koordinaten (oder nimmt es aus einem Pool) und gibt es zurück:
+def new_particle(x: float, y: float, mot: Vector, rng: random.Random, pool: Pool[Particle] | None = None) -> Particle:
+    particle = empty_particle() if pool is None else pool.acquire()
+    particle.pos.set(x, y) # die Position des neuen Partikels
+    # die Bewegung des neuen Partikels:
+    theta = rng.random() * 2 * math.pi
+    speed = rng.uniform(0.3, 0.45)
+    particle.mot.set(speed * math.cos(theta) + mot.x, speed * math.sin(theta) + mot.y)
+    particle.ticks = 0 # Ein neues Partikel gibt es seit 0 Ticks
+    particle.lifetime = rng.randint(60, 90) # die Anzahl von Ticks, nach denen das Partikel verschwinden wird
+    return particle
 
 
-# Diese Funktion konstruiert eine neue Explosion aus zwei Koordinaten und gibt sie zurück:
-def new_explosion(x: float, y: float, mot: Vector) -> Explosion:
-    particles = [new_particle(x, y, mot) for _ in range(random.randint(3, 5))] # 3 bis 5 Partikel in einer Liste
-    return Explosion(particles) # die Explosion konstruieren und zurückgeben
+# Die folgenden Funktionen konstruieren leere Objekte, die danach von den new_...()-Funktionen befüllt werden (sie sind auch die
+# Fabriken der Pools):
 
+def empty_bullet() -> Bullet:
+    return Bullet(Vector(0.0, 0.0), Vector(0.0, 0.0))
+
+
+def empty_saucer_bullet() -> SaucerBullet:
+    return SaucerBullet(Vector(0.0, 0.0), Vector(0.0, 0.0), 0, 0)
+
+
+def empty_explosion() -> Explosion:
+    return Explosion([])
+
+
+def empty_particle() -> Particle:
+    return Particle(Vector(0.0, 0.0), Vector(0.0, 0.0), 0, 0)
 
-# Diese Funktion konstruiert ein neues Partikel aus zwei Koordinaten und gibt es zurück:
-def new_particle(x: float, y: float, mot: Vector) -> Particle:
-    pos = Vector(x, y) # die Position des neuen Partikels
-    # die Bewegung des neuen Partikels:
-    mot = PolarCoordinate(random.random() * 2 * math.pi, random.uniform(0.3, 0.45)).cartesian().add(mot)
-    ticks = 0 # Ein neues Partikel gibt es seit 0 Ticks
-    death_ticks = random.randint(60, 90) # die Anzahl von Ticks, nach denen das Partikel verschwinden wird
-    return Particle(pos, mot, ticks, death_ticks)
+
+def empty_fragment() -> Fragment:
+    return Fragment([], 0)
+
+
+def empty_line() -> Line:
+    return Line(Vector(0.0, 0.0), PolarCoordinate(0.0, 0.0), PolarCoordinate(0.0, 0.0), Vector(0.0, 0.0), 0.0, 0)
 
 
 # Diese Funktion spielt ein Knallgeräusch ab:
@@ -1681,13 +2427,16 @@ def handle_keydown_event(event: pygame.event.Event) -> None:
             down_arrow_or_s_pressed()
         case pygame.K_s: # wenn der Spieler die Taste S gedrückt hat
             down_arrow_or_s_pressed()
+        case pygame.K_F3: # wenn der Spieler die Taste F3 gedrückt hat
+            toggle_profiler()
+        case pygame.K_F4: # wenn der Spieler die Taste F4 gedrückt hat
+            export_profile()
 
 
 # Diese Funktion wird aufgerufen, wenn der Spieler die Leertaste drückt:
 def space_pressed() -> None:
-    global fire_bullet
-    if playing() and player is not None: # wenn der Spieler gerade spielt und es gerade einen Spieler gibt
-        fire_bullet = True
+    if playing() and world.player is not None: # wenn der Spieler gerade spielt und es gerade einen Spieler gibt
+        world.fire_bullet = True
 
 
 # Diese Funktion wird aufgerufen, wenn der Spieler die Entertaste drückt:
@@ -1698,14 +2447,13 @@ def return_pressed() -> None:
 
 # Diese Funktion wird aufgerufen, wenn der Spieler die Escapetaste drückt:
 def escape_pressed() -> None:
-    global score, add_points, opened_menu
     if playing(): # wenn der Spieler gerade im Spiel ist
-        if add_points > 0: # Wenn Punkte zu addieren sind, diese addieren und sie auf 0 setzen
-            score += add_points
-            add_points = 0
+        world.bank_points() # Wenn Punkte zu addieren sind, diese addieren und sie auf 0 setzen
+        if recording is not None:
+            recording.bank_points()
         
         # das Pausenmenü aktualisieren und anzeigen:
-        PAUSE_MENU.set_text('\n%d%s' % (score, ' (new high score)' if new_high_score else ''), update_buttons_y=True)
+        PAUSE_MENU.set_text('\n%d%s' % (world.score, ' (new high score)' if world.new_high_score else ''))
         open_menu(PAUSE_MENU)
         
         # alle Geräusche des Spielers und der fliegenden Untertasse stoppen:
@@ -1721,7 +2469,7 @@ def escape_pressed() -> None:
 # Diese Funktion wird aufgerufen, wenn der Spieler die Pfeiltaste nach oben oder die Taste W drückt:
 def up_arrow_or_w_pressed() -> None:
     if playing(): # wenn der Spieler sich im Spiel befindet
-        if player is not None: # wenn es einen Spieler (ein Raumschiff) gibt
+        if world.player is not None: # wenn es einen Spieler (ein Raumschiff) gibt
             sounds.THRUST.play(-1) # das Geräusch des Schubs in Dauerschleife abspielen
     else: # wenn ein Menü geöffnet ist
         opened_menu.select_button_above() # den Button über dem ausgewählten Button auswählen
@@ -1739,6 +2487,52 @@ def handle_keyup_event(event: pygame.event.Event) -> None:
         sounds.THRUST.stop() # das Geräusch des Schubs stoppen
 
 
+# Diese Funktion schaltet das Messen der Frames und das Overlay mit den Perzentilen ein oder aus:
+def toggle_profiler() -> None:
+    global profiler, profiler_surface
+    profiler = FrameProfiler() if profiler is None else None
+    profiler_surface = None
+    world.profiler = profiler
+
+
+# Diese Funktion exportiert die gemessenen Frames nach „profile.csv“ und „profile.json“ (wenn das Overlay eingeschaltet ist):
+def export_profile() -> None:
+    if profiler is not None:
+        profiler.export_csv('profile.csv')
+        profiler.export_json('profile.json')
+
+
+# Diese Funktion rendert das Overlay mit den Perzentilen der Phasen und gibt das bemalte Rechteck zurück. Die Statistik wird nur
+# zweimal pro Sekunde neu berechnet und gerendert, damit das Overlay selbst die Messung kaum verfälscht:
+def render_profiler_overlay(screen: pygame.Surface) -> pygame.Rect:
+    global profiler_surface, profiler_font
+    if profiler_surface is None or profiler.count % (FPS // 2) == 0:
+        if profiler_font is None:
+            profiler_font = pygame.font.SysFont('monospace', 12) # erst beim ersten Einschalten suchen, das dauert
+        lines = [profiler_font.render(l, True, Color.GREEN) for l in profiler.report_lines()]
+        profiler_surface = pygame.Surface((max(l.get_width() for l in lines) + 10, sum(l.get_height() for l in lines) + 10),
+                                          pygame.SRCALPHA)
+        profiler_surface.fill(Color.BLACK_ALPHA) # ein halbdurchsichtiger Hintergrund
+        y = 5
+        for l in lines:
+            profiler_surface.blit(l, (5, y))
+            y += l.get_height()
+    return screen.blit(profiler_surface, (WIDTH - profiler_surface.get_width() - 5, 5))
+
+
+# Diese Funktion liest die Eingabe des Spielers aus der Tastatur. Das Schießen wird nicht hier, sondern über das
+# Tastendruck-Event der Leertaste behandelt, damit pro Tastendruck nur eine Kugel abgeschossen wird; „fire“ gibt nur weiter, ob
+# seit dem letzten Tick geschossen wurde (damit es aufgezeichnet werden kann):
+def keyboard_input() -> PlayerInput:
+    pressed = pygame.key.get_pressed()
+    return PlayerInput(
+        thrust=pressed[pygame.K_w] or pressed[pygame.K_UP], # die Taste W oder die Pfeiltaste nach oben
+        left=pressed[pygame.K_a] or pressed[pygame.K_LEFT], # die Taste A oder die Pfeiltaste nach links
+        right=pressed[pygame.K_d] or pressed[pygame.K_RIGHT], # die Taste D oder die Pfeiltaste nach rechts
+        fire=world.fire_bullet # s. space_pressed()
+    )
+
+
 # Diese Funktion rendert die Oberfläche, auf der ein Raumschiff (repräsentiert ein Leben) angezeigt wird:
 def render_life_surface() -> None:
     global life_surface
@@ -1755,14 +2549,46 @@ def render_life_surface() -> None:
     ), stroke_weight=1, visible=True).render(life_surface)
 
 
-# Diese Funktion ermittelt die aktuelle Schwierigkeit und setzt sie:
-def get_and_set_difficulty() -> None:
-    global difficulty
-    for d in reversed(DIFFICULTIES): # die Schwierigkeiten rückwärts durchlaufen
-        # wenn mindestens so viele Ticks vergangen sind wie die Ticks, bei denen die Schwierigkeit beginnt:
-        if playing_ticks >= d.starts_at_ticks:
-            difficulty = d # die Schwierigkeit setzen
-            return # aus der Funktion springen, da die Schwierigkeit jetzt ermittelt wurde
+# Diese Funktion rendert Objekte mit einer Position „pos“ und einer Bewegung „mot“ (Kugeln oder Partikel) als weiße Kreise. Statt
+# pygame.draw.circle() für jedes Objekt aufzurufen, wird ein vorgerenderter Kreis mit einem einzigen Aufruf von
+# Surface.blits() an alle Positionen kopiert. Wie pygame.draw.circle() schneidet int() die Nachkommastellen ab, sodass die
+# Pixel genau dieselben sind:
+def render_dots(screen: pygame.Surface, objects: list, radius: int, alpha: float) -> None:
+    if len(objects) == 0:
+        return
+    dot = dot_surfaces.get(radius)
+    if dot is None:
+        dot = dot_surfaces[radius] = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+        pygame.draw.circle(dot, Color.WHITE, (radius, radius), radius)
+    screen.blits([(dot, (int(o.pos.x + o.mot.x * alpha) - radius, int(o.pos.y + o.mot.y * alpha) - radius)) for o in objects],
+                 False)
+
+
+# Diese Funktion rendert Asteroiden aus den Sprites eines SpriteCache mit einem einzigen Aufruf von blits(). Liegen die
+# Asteroiden in NumPy-Arrays, werden ihre Mitten und Drehungen mit einem einzigen tolist() aus den Arrays geholt:
+def render_sprites(screen: pygame.Surface, asteroids: list[Asteroid], cache: SpriteCache, alpha: float,
+                   arrays: AsteroidArrays | None) -> None:
+    poses = arrays.poses() if arrays is not None else None
+    sprites = []
+    for a in asteroids:
+        body = a.body
+        if not body.visible:
+            continue
+        if poses is not None:
+            (x, y, angle) = poses[body.row]
+        else:
+            (x, y) = body.center.tup
+            angle = body.polar_coordinates[0].theta # der Winkel der ersten Ecke gibt die Drehung an
+        (sprite, sx, sy) = cache.get(body.shape, angle, body.stroke_weight,
+                                     lambda: [(c.theta, c.radius) for c in body.polar_coordinates], screen)
+        sprites.append((sprite, (round(x + a.mot.x * alpha) - sx, round(y + a.mot.y * alpha) - sy)))
+    screen.blits(sprites, False)
+
+
+# Diese Funktion gibt Rechtecke zurück, die alle Linien eines Fragments enthalten:
+def fragment_rects(fragment: Fragment, alpha: float) -> list[pygame.Rect]:
+    return [circle_rect(l.center.x + l.mot.x * alpha, l.center.y + l.mot.y * alpha,
+                        max(l.center_to_a.radius, l.center_to_b.radius), l.stroke_weight) for l in fragment.lines]
 
 
 # Diese Funktion wandelt einen Vektor in eine Polarkoordinate um:
@@ -1773,8 +2599,8 @@ def to_polar(vector: Vector) -> PolarCoordinate:
 
 
 # Diese Funktion gibt eine zufällige Asteroidengröße zurück:
-def randsize() -> AsteroidSize:
-    return random.choice((ASTEROID_SIZES['small'], ASTEROID_SIZES['medium'], ASTEROID_SIZES['large']))
+def randsize(rng: random.Random) -> AsteroidSize:
+    return rng.choice((ASTEROID_SIZES['small'], ASTEROID_SIZES['medium'], ASTEROID_SIZES['large']))
     
 
 # Diese Funktion setzt den Text mit den Highscores zusammen und gibt ihn zurück:
@@ -1802,50 +2628,72 @@ def playing() -> bool:
     return opened_menu is None # Der Spieler befindet sich im Spiel, wenn kein Menü geöffnet ist
 
 
-# Diese Funktion lädt alle nötigen Spieldaten aus der Datei „data.json“:
+# Diese Funktion lädt alle nötigen Spieldaten aus der Datei „data.bin“. Gibt es diese Datei noch nicht, wird ein Spielstand
+# im alten JSON-Format aus „data.json“ geladen; beim nächsten Speichern wird er dann im Binärformat geschrieben:
 def load_game() -> None:
-    global game_over, saucer_on_screen, score, high_scores, new_high_score, lives, playing_ticks
+    global world, high_scores
+    world = GameWorld(on_game_over=show_game_over_menu) # eine leere Spielwelt, falls es keine Daten gibt
     try:
-        with open('data.json', 'r') as file:
-            data = json.load(file)
-    except (FileNotFoundError, json.decoder.JSONDecodeError):
+        with open(SAVE_FILE, 'rb') as file:
+            reader = SnapshotReader(file.read())
+        loaded = read_world(reader)
+        scores = reader.ints()
+        high_scores = [HighScore(scores[i], scores[i + 1]) for i in range(0, len(scores), 2)]
+    except FileNotFoundError:
+        try:
+            with open(LEGACY_SAVE_FILE, 'r') as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.decoder.JSONDecodeError):
+            return
+        high_scores = [HighScore(d['score'], d['timestamp']) for d in data['high_scores']]
+        loaded = load_world(data)
+    except SnapshotError:
         return
-    game_over = data['game_over']
-    load_player(data['player'])
-    load_fragment(data['fragment'])
-    load_asteroids(data['asteroids'])
-    load_saucer(data['saucer'])
-    saucer_on_screen = data['saucer_on_screen']
-    load_saucer_fragments(data['saucer_fragments'])
-    load_bullets(data['bullets'])
-    load_saucer_bullets(data['saucer_bullets'])
-    load_explosions(data['explosions'])
-    score = data['score']
-    high_scores = [HighScore(d['score'], d['timestamp']) for d in data['high_scores']]
-    new_high_score = data['new_high_score']
-    lives = data['lives']
-    playing_ticks = data['playing_ticks']
-
-
-# Diese Funktion lädt den Spieler aus dem Dictionary „data“, das 
-def load_player(data: dict[str, object] | None) -> None:
-    global player
-    if data is not None:
-        body = load_polygon(data['body'])
-        thrust = load_polygon(data['thrust'])
-        turning_angle = data['turning_angle']
-        mot = load_vector(data['motion'])
-        ticks = data['ticks']
-        player = Player(body, thrust, turning_angle, mot, ticks)
+    world = loaded
+    world.high_score = best_high_score()
+    world.on_game_over = show_game_over_menu
+
+
+# Diese Funktion lädt eine Spielwelt aus einem Dictionary, das aus „data.json“ stammt, und gibt sie zurück:
+def load_world(data: dict[str, object], asteroid_arrays: bool = False, seed: int | None = None) -> GameWorld:
+    world = GameWorld(asteroid_arrays=asteroid_arrays, seed=seed)
+    world.game_over = data['game_over']
+    world.player = load_player(data['player'])
+    world.fragment = load_fragment(data['fragment'])
+    world.add_asteroids(load_asteroids(data['asteroids']))
+    world.saucer = load_saucer(data['saucer'])
+    world.saucer_on_screen = data['saucer_on_screen']
+    world.saucer_fragments = load_saucer_fragments(data['saucer_fragments'])
+    world.bullets = load_bullets(data['bullets'])
+    world.saucer_bullets = load_saucer_bullets(data['saucer_bullets'])
+    world.explosions = load_explosions(data['explosions'])
+    world.score = data['score']
+    world.new_high_score = data['new_high_score']
+    world.lives = data['lives']
+    world.playing_ticks = data['playing_ticks']
+    world.get_and_set_difficulty() # die Schwierigkeit anhand der bereits gespielten Ticks einstellen
+    return world
+
+
+# Diese Funktion lädt den Spieler aus einem Dictionary, das aus „data.json“ stammt:
+def load_player(data: dict[str, object] | None) -> Player | None:
+    if data is None:
+        return None
+    body = load_polygon(data['body'])
+    thrust = load_polygon(data['thrust'])
+    turning_angle = data['turning_angle']
+    mot = load_vector(data['motion'])
+    ticks = data['ticks']
+    return Player(body, thrust, turning_angle, mot, ticks)
 
 
 # Diese Funktion lädt das Fragment aus einem Dictionary, das aus „data.json“ stammt:
-def load_fragment(data: dict[str, object] | None) -> None:
-    global fragment
-    if data is not None:
-        lines = [load_line(d) for d in data['lines']]
-        ticks = data['ticks']
-        fragment = Fragment(lines, ticks)
+def load_fragment(data: dict[str, object] | None) -> Fragment | None:
+    if data is None:
+        return None
+    lines = [load_line(d) for d in data['lines']]
+    ticks = data['ticks']
+    return Fragment(lines, ticks)
 
 
 # Diese Funktion lädt eine Linie aus einem Dictionary, das aus „data.json“ stammt, und gibt sie zurück:
@@ -1860,51 +2708,46 @@ def load_line(data: dict[str, object]) -> Line:
 
 
 # Diese Funktion lädt die Liste der Asteroiden aus einem Dictionary, das aus „data.json“ stammt:
-def load_asteroids(data: list[dict[str, object]]) -> None:
-    global asteroids
-    asteroids = [Asteroid(tuple(ASTEROID_SIZES.values())[d['size']], load_polygon(d['body']), d['motion_angle'],
-                          load_vector(d['motion']), d['rotation'], d['hit_by']) for d in data]
+def load_asteroids(data: list[dict[str, object]]) -> list[Asteroid]:
+    return [Asteroid(tuple(ASTEROID_SIZES.values())[d['size']], load_polygon(d['body']), d['motion_angle'],
+                     load_vector(d['motion']), d['rotation'], d['hit_by']) for d in data]
 
 
 # Diese Funktion lädt die fliegende Untertasse aus einem Dictionary, das aus „data.json“ stammt:
-def load_saucer(data: dict[str, object] | None) -> None:
-    global saucer
-    if data is not None:
-        size = tuple(SAUCER_SIZES.values())[data['size']] # die Größe ist im Dictionary als Index gespeichert
-        body = load_polygon(data['body'])
-        mot = load_vector(data['motion'])
-        speed = data['speed']
-        steps = data['steps']
-        ticks = data['ticks']
-        hit_by = data['hit_by']
-        saucer = Saucer(size, body, mot, speed, steps, ticks, hit_by)
+def load_saucer(data: dict[str, object] | None) -> Saucer | None:
+    if data is None:
+        return None
+    size = tuple(SAUCER_SIZES.values())[data['size']] # die Größe ist im Dictionary als Index gespeichert
+    body = load_polygon(data['body'])
+    mot = load_vector(data['motion'])
+    speed = data['speed']
+    steps = data['steps']
+    ticks = data['ticks']
+    hit_by = data['hit_by']
+    return Saucer(size, body, mot, speed, steps, ticks, hit_by)
 
 
 # Diese Funktion lädt die Liste der Fragmente fliegender Untertassen aus einem Dictionary, das aus „data.json“ stammt:
-def load_saucer_fragments(data: list[dict[str, object]]) -> None:
-    global saucer_fragments
-    saucer_fragments = [Fragment([load_line(l) for l in d['lines']], d['ticks']) for d in data]
+def load_saucer_fragments(data: list[dict[str, object]]) -> list[Fragment]:
+    return [Fragment([load_line(l) for l in d['lines']], d['ticks']) for d in data]
 
 
 # Diese Funktion lädt die Liste der Kugeln vom Spieler aus einem Dictionary, das aus „data.json“ stammt:
-def load_bullets(data: list[dict[str, object]]) -> None:
-    global bullets
-    bullets = [Bullet(load_vector(d['position']), load_vector(d['motion'])) for d in data]
+def load_bullets(data: list[dict[str, object]]) -> list[Bullet]:
+    return [Bullet(load_vector(d['position']), load_vector(d['motion'])) for d in data]
 
 
 # Diese Funktion lädt die Liste der Kugeln von fligenden Untertassen aus einem Dictionary, das aus „data.json“ stammt:
-def load_saucer_bullets(data: list[dict[str, object]]) -> None:
-    global saucer_bullets
+def load_saucer_bullets(data: list[dict[str, object]]) -> list[SaucerBullet]:
     # die Kugeln fliegender Untertassen aus den Daten laden:
-    saucer_bullets = [SaucerBullet(load_vector(d['position']), load_vector(d['motion']), d['lifetime'], d['ticks']) for d in data]
+    return [SaucerBullet(load_vector(d['position']), load_vector(d['motion']), d['lifetime'], d['ticks']) for d in data]
 
 
 # Diese Funktion lädt die Liste der Explosionen aus einem Dictionary, das aus „data.json“ stammt:
-def load_explosions(data: list[dict[str, object]]) -> None:
-    global explosions
+def load_explosions(data: list[dict[str, object]]) -> list[Explosion]:
     # die Explosionen aus den Daten und daraus alle Partikel laden:
-    explosions = [Explosion([Particle(load_vector(p['position']), load_vector(p['motion']), p['ticks'], p['lifetime'])
-                             for p in d['particles']]) for d in data]
+    return [Explosion([Particle(load_vector(p['position']), load_vector(p['motion']), p['ticks'], p['lifetime'])
+                       for p in d['particles']]) for d in data]
 
 
 # Diese Funktion lädt ein Polygon aus einem Dictionary, das aus „data.json“ stammt:
@@ -1926,27 +2769,221 @@ def load_polar(data: dict[str, float]) -> PolarCoordinate:
     return PolarCoordinate(data['theta'], data['radius'])
 
 
-# Diese Funktion speichert alle zu speichernden Daten in der Datei „data.json“:
+# Diese Funktion liest eine Spielwelt aus einem Spielstand im Binärformat und gibt sie zurück. Die Abschnitte werden in derselben
+# Reihenfolge gelesen, in der write_world() sie schreibt:
+def read_world(reader: SnapshotReader, asteroid_arrays: bool = False, seed: int | None = None) -> GameWorld:
+    world = GameWorld(asteroid_arrays=asteroid_arrays, seed=seed)
+    (game_over, saucer_on_screen, new_high_score, world.score, world.lives, world.playing_ticks) = reader.ints()
+    world.game_over = bool(game_over)
+    world.saucer_on_screen = bool(saucer_on_screen)
+    world.new_high_score = bool(new_high_score)
+
+    # der Spieler (keiner oder einer):
+    ints = reader.ints()
+    floats = reader.floats()
+    polygons = read_polygons(reader)
+    if len(ints) > 0:
+        world.player = Player(polygons[0], polygons[1], floats[0], Vector(floats[1], floats[2]), ints[0])
+
+    # die Fragmente:
+    fragments = read_fragments(reader)
+    world.fragment = fragments[0] if len(fragments) > 0 else None
+    world.saucer_fragments = read_fragments(reader)
+
+    # die Asteroiden:
+    ints = reader.ints()
+    floats = reader.floats()
+    polygons = read_polygons(reader)
+    sizes = tuple(ASTEROID_SIZES.values())
+    world.add_asteroids([Asteroid(sizes[ints[2 * i]], polygons[i], floats[4 * i], Vector(floats[4 * i + 1], floats[4 * i + 2]),
+                                  floats[4 * i + 3], ints[2 * i + 1]) for i in range(len(polygons))])
+
+    # die fliegende Untertasse (keine oder eine):
+    ints = reader.ints()
+    floats = reader.floats()
+    polygons = read_polygons(reader)
+    if len(polygons) > 0:
+        world.saucer = Saucer(tuple(SAUCER_SIZES.values())[ints[0]], polygons[0], Vector(floats[0], floats[1]), floats[2], ints[1],
+                              ints[2], ints[3])
+
+    # die Kugeln:
+    floats = reader.floats()
+    world.bullets = [Bullet(Vector(floats[i], floats[i + 1]), Vector(floats[i + 2], floats[i + 3]))
+                     for i in range(0, len(floats), 4)]
+    ints = reader.ints()
+    floats = reader.floats()
+    world.saucer_bullets = [SaucerBullet(Vector(floats[4 * i], floats[4 * i + 1]), Vector(floats[4 * i + 2], floats[4 * i + 3]),
+                                         ints[2 * i], ints[2 * i + 1]) for i in range(len(ints) // 2)]
+
+    # die Explosionen mit ihren Partikeln:
+    counts = reader.ints()
+    ints = reader.ints()
+    floats = reader.floats()
+    particles = [Particle(Vector(floats[4 * i], floats[4 * i + 1]), Vector(floats[4 * i + 2], floats[4 * i + 3]), ints[2 * i],
+                          ints[2 * i + 1]) for i in range(len(ints) // 2)]
+    start = 0
+    for count in counts:
+        world.explosions.append(Explosion(particles[start:start + count]))
+        start += count
+
+    world.get_and_set_difficulty() # die Schwierigkeit anhand der bereits gespielten Ticks einstellen
+    return world
+
+
+# Diese Funktion liest eine Liste von Polygonen aus einem Spielstand im Binärformat:
+def read_polygons(reader: SnapshotReader) -> list[Polygon]:
+    ints = reader.ints() # pro Polygon: Umrandung, Sichtbarkeit, Anzahl der Ecken
+    centers = reader.floats()
+    polars = reader.floats() # die Polarkoordinaten aller Polygone hintereinander
+    polygons = []
+    start = 0
+    for i in range(len(ints) // 3):
+        end = start + 2 * ints[3 * i + 2]
+        polar_coordinates = tuple([PolarCoordinate(polars[j], polars[j + 1]) for j in range(start, end, 2)])
+        polygons.append(Polygon(Vector(centers[2 * i], centers[2 * i + 1]), polar_coordinates, ints[3 * i], bool(ints[3 * i + 1])))
+        start = end
+    return polygons
+
+
+# Diese Funktion liest eine Liste von Fragmenten aus einem Spielstand im Binärformat:
+def read_fragments(reader: SnapshotReader) -> list[Fragment]:
+    ints = reader.ints() # pro Fragment: Ticks, Anzahl der Linien
+    stroke_weights = reader.ints() # pro Linie
+    floats = reader.floats() # pro Linie: Mitte, Polarkoordinaten zu A und B, Bewegung, Rotation
+    lines = [Line(Vector(floats[i], floats[i + 1]), PolarCoordinate(floats[i + 2], floats[i + 3]),
+                  PolarCoordinate(floats[i + 4], floats[i + 5]), Vector(floats[i + 6], floats[i + 7]), floats[i + 8], stroke_weight)
+             for (i, stroke_weight) in zip(range(0, len(floats), 9), stroke_weights)]
+    fragments = []
+    start = 0
+    for i in range(0, len(ints), 2):
+        fragments.append(Fragment(lines[start:start + ints[i + 1]], ints[i]))
+        start += ints[i + 1]
+    return fragments
+
+
+# Diese Funktion schreibt eine Spielwelt in einen Spielstand im Binärformat. Statt jeden Vektor und jede Polarkoordinate
+# einzeln zu verschachteln, werden die Werte aller Objekte einer Art in jeweils ein Array gepackt:
+def write_world(world: GameWorld, writer: SnapshotWriter) -> None:
+    # Punkte, die gerade noch zur Punktzahl hinzugezählt werden, gehören schon dazu:
+    writer.ints((world.game_over, world.saucer_on_screen, world.new_high_score, world.score + world.add_points, world.lives,
+                 world.playing_ticks))
+
+    # der Spieler:
+    player = world.player
+    if player is None:
+        writer.ints(())
+        writer.floats(())
+        write_polygons(writer, [])
+    else:
+        writer.ints((player.ticks,))
+        writer.floats((player.turning_angle, player.mot.x, player.mot.y))
+        write_polygons(writer, [player.body, player.thrust])
+
+    # die Fragmente:
+    write_fragments(writer, [] if world.fragment is None else [world.fragment])
+    write_fragments(writer, world.saucer_fragments)
+
+    # die Asteroiden:
+    ints = []
+    floats = []
+    for a in world.asteroids:
+        ints += (a.size.index, a.hit_by)
+        floats += (a.mot_angle, a.mot.x, a.mot.y, a.rot)
+    writer.ints(ints)
+    writer.floats(floats)
+    write_polygons(writer, [a.body for a in world.asteroids])
+
+    # die fliegende Untertasse:
+    saucer = world.saucer
+    if saucer is None:
+        writer.ints(())
+        writer.floats(())
+        write_polygons(writer, [])
+    else:
+        writer.ints((saucer.size.index, saucer.steps, saucer.ticks, saucer.hit_by))
+        writer.floats((saucer.mot.x, saucer.mot.y, saucer.speed))
+        write_polygons(writer, [saucer.body])
+
+    # die Kugeln:
+    floats = []
+    for b in world.bullets:
+        floats += (b.pos.x, b.pos.y, b.mot.x, b.mot.y)
+    writer.floats(floats)
+    ints = []
+    floats = []
+    for b in world.saucer_bullets:
+        ints += (b.lifetime, b.ticks)
+        floats += (b.pos.x, b.pos.y, b.mot.x, b.mot.y)
+    writer.ints(ints)
+    writer.floats(floats)
+
+    # die Explosionen mit ihren Partikeln:
+    ints = []
+    floats = []
+    for e in world.explosions:
+        for p in e.particles:
+            ints += (p.ticks, p.lifetime)
+            floats += (p.pos.x, p.pos.y, p.mot.x, p.mot.y)
+    writer.ints([len(e.particles) for e in world.explosions])
+    writer.ints(ints)
+    writer.floats(floats)
+
+
+# Diese Funktion schreibt eine Liste von Polygonen in einen Spielstand im Binärformat:
+def write_polygons(writer: SnapshotWriter, polygons: list[Polygon]) -> None:
+    ints = []
+    centers = []
+    polars = []
+    for p in polygons:
+        polar_coordinates = p.polar_coordinates
+        ints += (p.stroke_weight, p.visible, len(polar_coordinates))
+        centers += p.center.tup
+        for c in polar_coordinates:
+            polars += (c.theta, c.radius)
+    writer.ints(ints)
+    writer.floats(centers)
+    writer.floats(polars)
+
+
+# Diese Funktion schreibt eine Liste von Fragmenten in einen Spielstand im Binärformat:
+def write_fragments(writer: SnapshotWriter, fragments: list[Fragment]) -> None:
+    ints = []
+    stroke_weights = []
+    floats = []
+    for f in fragments:
+        ints += (f.ticks, len(f.lines))
+        for l in f.lines:
+            stroke_weights.append(l.stroke_weight)
+            floats += (l.center.x, l.center.y, l.center_to_a.theta, l.center_to_a.radius, l.center_to_b.theta,
+                       l.center_to_b.radius, l.mot.x, l.mot.y, l.rot)
+    writer.ints(ints)
+    writer.ints(stroke_weights)
+    writer.floats(floats)
+
+
+# Diese Funktion packt alle zu speichernden Daten in einen Spielstand im Arbeitsspeicher. Ein Spiel, das aus ist, wird nicht
+# gespeichert, sondern nur die Highscores:
+def snapshot_game() -> SnapshotWriter:
+    writer = SnapshotWriter()
+    write_world(GameWorld() if world.game_over else world, writer)
+    scores = []
+    for h in high_scores:
+        scores += (h.score, h.timestamp)
+    writer.ints(scores)
+    return writer
+
+
+# Diese Funktion speichert den Spielstand automatisch. Im Spielloop werden die Werte nur in Arrays gepackt; das Zusammensetzen
+# und das Schreiben auf die Platte übernimmt der Hintergrund-Thread, sodass kein Frame auf die Festplatte warten muss:
+def autosave() -> None:
+    global ticks_since_autosave
+    ticks_since_autosave = 0
+    autosaver.submit(snapshot_game().to_bytes)
+
+
+# Diese Funktion speichert alle zu speichernden Daten atomar im Binärformat in der Datei „data.bin“:
 def save_game() -> None:
-    data = {
-        'game_over': game_over,
-        'player': None if player is None else player.to_dict(),
-        'fragment': None if fragment is None else fragment.to_dict(),
-        'asteroids': [a.to_dict() for a in asteroids],
-        'saucer': None if saucer is None else saucer.to_dict(),
-        'saucer_on_screen': saucer_on_screen,
-        'saucer_fragments': [f.to_dict() for f in saucer_fragments],
-        'bullets': [b.to_dict() for b in bullets],
-        'saucer_bullets': [b.to_dict() for b in saucer_bullets],
-        'explosions': [e.to_dict() for e in explosions],
-        'score': score,
-        'high_scores': [h.to_dict() for h in high_scores],
-        'new_high_score': new_high_score,
-        'lives': lives,
-        'playing_ticks': playing_ticks
-    }
-    with open('data.json', 'w') as file:
-        json.dump(data, file, indent=4)
+    write_atomic(SAVE_FILE, snapshot_game().to_bytes())
 
 
 # Aufruf der main()-Funktion:
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import os
+import sys
+import threading
+
+from typing import Callable
+
+
+# Dieses Modul schreibt Spielstände absturzsicher und ohne den Spielloop aufzuhalten. Eine Datei wird nie direkt überschrieben:
+# Die Daten werden zuerst in eine temporäre Datei geschrieben und mit fsync auf die Platte gebracht, dann ersetzt os.replace()
+# die alte Datei in einem Schritt. Nach einem Absturz liegt deshalb immer entweder der alte oder der neue Spielstand vor, aber
+# nie eine halb geschriebene Datei.
+
+
+# Klassen
+
+# Diese Klasse schreibt Spielstände auf einem Hintergrund-Thread. Der Spielloop übergibt nur eine Funktion, die die fertigen
+# Bytes liefert; Zusammensetzen, Schreiben und fsync geschehen auf dem Thread. Kommt ein neuer Spielstand, bevor der vorige
+# geschrieben wurde, ersetzt er diesen (nur der neueste Spielstand ist interessant):
+class Autosaver:
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.pending: Callable[[], bytes] | None = None # der Spielstand, der als Nächstes geschrieben wird
+        self.busy = False # ob der Thread gerade schreibt
+        self.closed = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.__run, name='autosave', daemon=True)
+        self.thread.start()
+
+
+    # Diese Methode übergibt einen Spielstand, der auf dem Hintergrund-Thread geschrieben werden soll:
+    def submit(self, data: Callable[[], bytes]) -> None:
+        with self.condition:
+            if self.closed:
+                raise RuntimeError('autosaver is closed')
+            self.pending = data
+            self.condition.notify_all()
+
+
+    # Diese Methode wartet, bis alle übergebenen Spielstände geschrieben sind:
+    def flush(self) -> None:
+        with self.condition:
+            while self.pending is not None or self.busy:
+                self.condition.wait()
+
+
+    # Diese Methode schreibt noch ausstehende Spielstände und beendet den Thread:
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join()
+
+
+    # Diese Methode läuft auf dem Hintergrund-Thread:
+    def __run(self) -> None:
+        while True:
+            with self.condition:
+                while self.pending is None and not self.closed:
+                    self.condition.wait()
+                if self.pending is None:
+                    return # geschlossen und nichts mehr zu schreiben
+                data = self.pending
+                self.pending = None
+                self.busy = True
+            try:
+                write_atomic(self.path, data())
+            except Exception as e: # auch Fehler beim Zusammensetzen der Daten, sonst endet der Thread und flush() wartet ewig
+                print('autosave failed: %r' % e, file=sys.stderr) # ein fehlgeschlagenes Speichern soll das Spiel nicht beenden
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+
+# Funktionen
+
+# Diese Funktion schreibt Bytes atomar in eine Datei: zuerst in eine temporäre Datei daneben, die mit fsync auf die Platte
+# gebracht und dann über die alte Datei umbenannt wird:
+def write_atomic(path: str, data: bytes) -> None:
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+    # Damit auch die Umbenennung einen Absturz übersteht, wird das Verzeichnis synchronisiert (nur unter POSIX möglich):
+    if hasattr(os, 'O_DIRECTORY'):
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterator
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1') # die Begrüßung von Pygame würde die JSON-Zeilen stören
+
+# Eigene Imports
+
+import asteroids
+import headless
+
+from asteroids import GameWorld, PlayerInput
+
+
+# Dieses Modul simuliert viele Spiele ohne Fenster auf mehreren Prozessen gleichzeitig, z. B. um die Schwierigkeiten und die
+# Größen von Asteroiden und fliegenden Untertassen auszubalancieren. Jedes Spiel läuft in einer eigenen Spielwelt mit eigenem
+# Startwert und eigenem Bot, braucht also nichts von den anderen Spielen; die Prozesse schicken nur das kleine Ergebnis jedes
+# Spiels zurück. Dadurch wächst der Durchsatz mit der Anzahl der Kerne. Die Ergebnisse werden zurückgegeben, sobald ein Spiel
+# fertig ist (nicht in der Reihenfolge der Startwerte), damit lange Läufe schon unterwegs ausgewertet werden können.
+
+
+# Konstanten
+
+MAX_TICKS = 10 * 60 * asteroids.FPS # wie viele Ticks ein Spiel höchstens dauert (10 Minuten)
+MAX_PENDING_PER_WORKER = 4 # wie viele Spiele pro Prozess höchstens gleichzeitig in Auftrag sind
+
+# die Bots, die über die Kommandozeile ausgewählt werden können (Name -> Funktion, die aus dem Startwert ein Skript macht):
+BOTS: dict[str, Callable[[int], Callable[[int], PlayerInput]]] = {
+    'idle': lambda seed: headless.idle_script,
+    'spin-and-fire': lambda seed: headless.spin_and_fire_script,
+    'random': headless.RandomBot
+}
+
+
+# Klassen
+
+# Diese Datenklasse beschreibt ein zu simulierendes Spiel. Sie wird an die Prozesse geschickt und enthält deshalb nur Namen
+# und Zahlen:
+@dataclass
+class GameJob:
+
+    seed: int # der Startwert der Spielwelt (und des Bots)
+    bot: str # der Name des Bots (s. BOTS)
+    max_ticks: int = MAX_TICKS
+    asteroid_arrays: bool = False
+
+
+# Diese Datenklasse enthält das Ergebnis eines simulierten Spiels:
+@dataclass
+class GameResult:
+
+    seed: int
+    bot: str
+    score: int # der Punktestand am Ende des Spiels
+    survival_ticks: int # wie viele Ticks der Spieler gespielt hat
+    game_over: bool # ob der Spieler alle Leben verloren hat (sonst wurde MAX_TICKS erreicht)
+    asteroids_destroyed: int # wie viele Asteroiden zerstört wurden (egal wodurch)
+    peak_asteroids: int # die meisten Asteroiden gleichzeitig
+    peak_bullets: int # die meisten Kugeln des Spielers gleichzeitig
+    peak_saucer_bullets: int # die meisten Kugeln fliegender Untertassen gleichzeitig
+    peak_particles: int # die meisten Partikel gleichzeitig
+    seconds: float # wie lange die Simulation gedauert hat
+
+
+# Funktionen
+
+# Diese Funktion simuliert ein Spiel bis zum Spielende (oder bis „max_ticks“) und gibt sein Ergebnis zurück. Sie läuft in den
+# Prozessen des Pools:
+def run_game(job: GameJob) -> GameResult:
+    script = BOTS[job.bot](job.seed)
+    world = GameWorld(asteroid_arrays=job.asteroid_arrays, seed=job.seed)
+    world.new_game()
+    peak_asteroids = peak_bullets = peak_saucer_bullets = peak_particles = 0
+    start = time.perf_counter()
+    tick = 0
+    while tick < job.max_ticks and not world.game_over:
+        world.step(script(tick))
+        tick += 1
+        # die Höchststände nach jedem Tick aktualisieren:
+        peak_asteroids = max(peak_asteroids, len(world.asteroids))
+        peak_bullets = max(peak_bullets, len(world.bullets))
+        peak_saucer_bullets = max(peak_saucer_bullets, len(world.saucer_bullets))
+        peak_particles = max(peak_particles, sum(len(e.particles) for e in world.explosions))
+    return GameResult(job.seed, job.bot, world.score + world.add_points, world.playing_ticks, world.game_over,
+                      world.asteroids_destroyed, peak_asteroids, peak_bullets, peak_saucer_bullets, peak_particles,
+                      time.perf_counter() - start)
+
+
+# Diese Funktion simuliert alle Spiele auf „workers“ Prozessen und gibt die Ergebnisse zurück, sobald sie fertig sind. Es sind
+# nie mehr als MAX_PENDING_PER_WORKER Spiele pro Prozess in Auftrag, damit auch sehr viele Spiele kaum Speicher brauchen. Mit
+# einem Prozess wird ohne Pool im eigenen Prozess simuliert:
+def run_batch(jobs: Iterator[GameJob], workers: int) -> Iterator[GameResult]:
+    if workers <= 1:
+        headless.init()
+        for job in jobs:
+            yield run_game(job)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=headless.init) as executor:
+        pending = set()
+        for job in jobs:
+            if len(pending) >= workers * MAX_PENDING_PER_WORKER:
+                (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(run_game, job))
+        while len(pending) > 0:
+            (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+# Diese Funktion gibt eine Zusammenfassung der Ergebnisse als Textzeilen zurück:
+def summary_lines(results: list[GameResult], seconds: float) -> list[str]:
+    if len(results) == 0:
+        return ['no games']
+    scores = [r.score for r in results]
+    survival = [r.survival_ticks / asteroids.FPS for r in results]
+    return [
+        '%d games in %.2f s (%.1f games/s, %.0f ticks/s)' % (len(results), seconds, len(results) / seconds,
+                                                            sum(r.survival_ticks for r in results) / seconds),
+        'score: mean %.0f, median %.0f, min %d, max %d' % (statistics.mean(scores), statistics.median(scores), min(scores),
+                                                           max(scores)),
+        'survival: mean %.1f s, median %.1f s, max %.1f s' % (statistics.mean(survival), statistics.median(survival),
+                                                               max(survival)),
+        'asteroids destroyed: mean %.1f' % statistics.mean(r.asteroids_destroyed for r in results),
+        'peaks: asteroids %d, bullets %d, saucer bullets %d, particles %d' % (
+            max(r.peak_asteroids for r in results), max(r.peak_bullets for r in results),
+            max(r.peak_saucer_bullets for r in results), max(r.peak_particles for r in results))
+    ]
+
+
+# Die main()-Funktion
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Simulates many headless games of Asteroids in parallel.')
+    parser.add_argument('games', type=int, help='the number of games to simulate')
+    parser.add_argument('--bot', choices=BOTS.keys(), default='random', help='the scripted player')
+    parser.add_argument('--seed', type=int, default=0, help='the seed of the first game (the others count up from it)')
+    parser.add_argument('--max-ticks', type=int, default=MAX_TICKS, help='stop a game after this many ticks')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='the number of processes')
+    parser.add_argument('--asteroid-arrays', action='store_true', help='store asteroid kinematics in NumPy arrays')
+    parser.add_argument('--output', help='write one JSON line per game to this file instead of standard output')
+    args = parser.parse_args()
+
+    jobs = (GameJob(args.seed + i, args.bot, args.max_ticks, args.asteroid_arrays) for i in range(args.games))
+    output = sys.stdout if args.output is None else open(args.output, 'w')
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in run_batch(jobs, args.workers):
+            results.append(result)
+            output.write(json.dumps(asdict(result)) + '\n') # jedes Ergebnis sofort ausgeben
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print('\n'.join(summary_lines(results, time.perf_counter() - start)), file=sys.stderr)
+
+
+# Aufruf der main()-Funktion:
+if __name__ == '__main__':
+    main()
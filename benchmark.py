@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from datetime import datetime
+from typing import Callable
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy') # gerendert wird nur auf Oberflächen im Arbeitsspeicher
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+# Eigene Imports
+
+import asteroids
+import headless
+
+from asteroids import GameWorld, PlayerInput, Vector
+from collision import hash_positions
+from sprites import SpriteCache
+
+
+# Dieses Modul misst, wie lange die teuren Teile des Spiels in künstlichen Spielwelten verschiedener Größe brauchen: einen Tick
+# (GameWorld.step()), die einzelnen Kollisionsprüfungen, das Rendern auf eine Oberfläche im Arbeitsspeicher sowie das Speichern
+# und Laden. Die Spielwelten werden mit einem festen Startwert aus den üblichen new_...()-Funktionen gebaut, sodass jede Messung
+# bei jedem Aufruf dieselbe Spielwelt bekommt. Die Ergebnisse werden als JSON geschrieben (mit der Commit-ID und der Umgebung),
+# damit sie von Commit zu Commit verglichen werden können (s. --compare).
+
+
+# Konstanten
+
+SCALES = (10, 100, 1000, 10000) # die Anzahl der Asteroiden der Spielwelten
+RUNS = 5 # wie oft jede Messung wiederholt wird
+STEPS = 10 # wie viele Ticks pro Messung von GameWorld.step() berechnet werden
+THRESHOLD = 0.1 # ab welcher Verlangsamung (10 %) ein Vergleich als Verschlechterung gilt
+
+
+# Funktionen
+
+# Diese Funktion baut eine Spielwelt mit „scale“ Asteroiden und passend vielen Kugeln, Explosionen und Fragmenten:
+def build_world(scale: int, seed: int = 0, asteroid_arrays: bool = False, sprites: bool = False) -> GameWorld:
+    rng = random.Random(seed)
+    world = GameWorld(asteroid_arrays=asteroid_arrays, seed=seed)
+    if sprites:
+        world.sprite_cache = SpriteCache()
+    world.new_game()
+    world.add_asteroids([asteroids.new_asteroid(asteroids.randsize(rng), random_position(rng), rng.random() * 2 * math.pi, rng)
+                         for _ in range(scale - len(world.asteroids))])
+    world.bullets = [asteroids.new_bullet(random_position(rng), rng.random() * 2 * math.pi) for _ in range(max(1, scale // 4))]
+    world.explosions = [asteroids.new_explosion(rng.uniform(0, asteroids.WIDTH), rng.uniform(0, asteroids.HEIGHT),
+                                                Vector(0.0, 0.0), rng) for _ in range(max(1, scale // 10))]
+    world.saucer_fragments = [asteroids.new_saucer_fragment(asteroids.new_saucer(rng), rng) for _ in range(max(1, scale // 100))]
+    return world
+
+
+# Diese Funktion gibt eine zufällige Position im Fenster zurück:
+def random_position(rng: random.Random) -> Vector:
+    return Vector(rng.uniform(0, asteroids.WIDTH), rng.uniform(0, asteroids.HEIGHT))
+
+
+# Diese Funktion misst eine Funktion „runs“-mal und gibt die Dauern in Millisekunden zurück. „setup“ wird vor jeder Messung
+# aufgerufen (ohne mitgemessen zu werden) und gibt zurück, was der gemessenen Funktion übergeben wird:
+def measure(setup: Callable[[], object], function: Callable[[object], object], runs: int, calls: int = 1) -> list[float]:
+    durations = []
+    for _ in range(runs):
+        arg = setup()
+        start = time.perf_counter()
+        for _ in range(calls):
+            function(arg)
+        durations.append((time.perf_counter() - start) / calls * 1000)
+    return durations
+
+
+# Diese Funktion prüft alle Asteroiden gegen die Kugeln, wie in GameWorld.step() (auf einer Kopie der Kugelliste):
+def bullet_hits(world: GameWorld) -> None:
+    bullets = list(world.bullets)
+    grid = hash_positions(bullets)
+    for a in world.asteroids:
+        a.check_hit(bullets, 1, grid)
+
+
+# Diese Funktion prüft eine fliegende Untertasse gegen alle Asteroiden (ohne nach der ersten Kollision aufzuhören):
+def saucer_collisions(world: GameWorld) -> None:
+    for a in world.asteroids:
+        world.saucer.body.collides_with_polygon(a.body)
+
+
+# Diese Funktion führt alle Messungen für eine Größe aus und gibt ihre Ergebnisse zurück:
+def run_scale(scale: int, runs: int, steps: int, asteroid_arrays: bool, sprites: bool, directory: str) -> list[dict]:
+    def world() -> GameWorld:
+        return build_world(scale, asteroid_arrays=asteroid_arrays, sprites=sprites)
+
+    def saucer_world() -> GameWorld:
+        w = world()
+        w.saucer = asteroids.new_saucer(w.rng)
+        w.saucer.body.center = Vector(asteroids.WIDTH / 2, asteroids.HEIGHT / 2)
+        return w
+
+    screen = pygame.Surface(asteroids.SIZE)
+    shared = world() # eine Spielwelt für die Messungen, die sie nicht verändern
+    shared.render(screen) # einmal vorher rendern (z. B. für die Sprites und die vorgerenderten Kreise)
+    asteroids.world = shared
+    asteroids.high_scores = []
+    asteroids.SAVE_FILE = os.path.join(directory, 'data.bin')
+    asteroids.save_game()
+    calls = max(1, 1000 // scale) # Messungen, die die Spielwelt nicht verändern, in kleinen Welten öfter wiederholen
+
+    benchmarks = {
+        'update': measure(world, lambda w: [w.step(PlayerInput()) for _ in range(steps)], runs),
+        'hash bullets': measure(lambda: shared, lambda w: hash_positions(w.bullets), runs, calls),
+        'bullet hits': measure(world, bullet_hits, runs),
+        'player collision': measure(lambda: shared, lambda w: w.player_collides_with_asteroid(), runs, calls),
+        'saucer collisions': measure(saucer_world, saucer_collisions, runs),
+        'render': measure(lambda: shared, lambda w: w.render(screen), runs, calls),
+        'snapshot': measure(lambda: None, lambda _: asteroids.snapshot_game().to_bytes(), runs, calls),
+        'save_game': measure(lambda: None, lambda _: asteroids.save_game(), runs),
+        'load_game': measure(lambda: None, lambda _: asteroids.load_game(), runs)
+    }
+    results = []
+    for (name, durations) in benchmarks.items():
+        if name == 'update':
+            durations = [d / steps for d in durations] # pro Tick
+        results.append({
+            'benchmark': name,
+            'asteroids': scale,
+            'bullets': len(shared.bullets),
+            'particles': sum(len(e.particles) for e in shared.explosions),
+            'fragments': len(shared.saucer_fragments),
+            'runs': runs,
+            'min_ms': min(durations),
+            'median_ms': statistics.median(durations),
+            'mean_ms': statistics.mean(durations)
+        })
+    return results
+
+
+# Diese Funktion gibt die Commit-ID des Repositorys zurück (oder None, wenn sie sich nicht bestimmen lässt):
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+# Diese Funktion vergleicht Ergebnisse mit älteren Ergebnissen, gibt den Vergleich als Textzeilen zurück und dazu, ob etwas um
+# mehr als „threshold“ langsamer geworden ist (verglichen werden die Mediane):
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> tuple[list[str], bool]:
+    old = {(r['benchmark'], r['asteroids']): r['median_ms'] for r in baseline}
+    lines = ['%-18s %9s %12s %12s %8s' % ('benchmark', 'asteroids', 'before (ms)', 'after (ms)', 'change')]
+    regressed = False
+    for r in results:
+        before = old.get((r['benchmark'], r['asteroids']))
+        if before is None or before <= 0:
+            continue
+        change = r['median_ms'] / before - 1
+        flag = ''
+        if change > threshold:
+            flag = '  slower'
+            regressed = True
+        lines.append('%-18s %9d %12.3f %12.3f %+7.1f%%%s' % (r['benchmark'], r['asteroids'], before, r['median_ms'],
+                                                            change * 100, flag))
+    return (lines, regressed)
+
+
+# Die main()-Funktion
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Times the update, collision, render and save/load hot paths of Asteroids.')
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES, help='the numbers of asteroids to benchmark')
+    parser.add_argument('--runs', type=int, default=RUNS, help='how often each benchmark is repeated')
+    parser.add_argument('--steps', type=int, default=STEPS, help='ticks per run of the update benchmark')
+    parser.add_argument('--asteroid-arrays', action='store_true', help='store asteroid kinematics in NumPy arrays')
+    parser.add_argument('--sprites', action='store_true', help='render asteroids from cached sprites')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='compare the medians with the results in this JSON file')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='slowdown that counts as a regression')
+    args = parser.parse_args()
+
+    headless.init()
+    pygame.init()
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in args.scales:
+            for r in run_scale(scale, args.runs, args.steps, args.asteroid_arrays, args.sprites, directory):
+                results.append(r)
+                print('%-18s %6d asteroids: median %9.3f ms, min %9.3f ms' % (r['benchmark'], r['asteroids'], r['median_ms'],
+                                                                            r['min_ms']), file=sys.stderr)
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'asteroid_arrays': args.asteroid_arrays,
+            'sprites': args.sprites,
+            'runs': args.runs,
+            'steps': args.steps
+        },
+        'results': results
+    }
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare is not None:
+        with open(args.compare, 'r') as file:
+            (lines, regressed) = compare(results, json.load(file)['results'], args.threshold)
+        print('\n'.join(lines), file=sys.stderr)
+        if regressed:
+            sys.exit(1)
+
+
+# Aufruf der main()-Funktion:
+if __name__ == '__main__':
+    main()
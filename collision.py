@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import math
+
+
+# Dieses Modul enthält Hilfsmittel für die Kollisionserkennung. Es kennt die Klassen des Spiels nicht, sondern arbeitet nur mit
+# Koordinaten und beliebigen Objekten, damit es von asteroids.py importiert werden kann.
+
+
+# Konstanten
+
+CELL_SIZE = 64 # die Kantenlänge einer Zelle des Rasters in Pixeln (etwa der Durchmesser eines mittelgroßen Asteroiden)
+
+
+# Klassen
+
+# Diese Klasse ist ein räumlicher Hash: ein gleichmäßiges Raster, in dessen Zellen Punkte (z. B. die Positionen von Kugeln)
+# einsortiert werden. Eine Abfrage mit einem Kreis liefert nur die Objekte aus den Zellen, die der Kreis überlappt, sodass nur
+# diese noch exakt geprüft werden müssen:
+class SpatialHash:
+
+    def __init__(self, cell_size: float = CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[tuple[int, float, float, object]]] = {} # Zelle -> (Index, x, y, Objekt)
+        self.keys: dict[int, tuple[int, int]] = {} # id(Objekt) -> Zelle, damit Objekte wieder entfernt werden können
+        self.count = 0 # wie viele Objekte bisher eingefügt wurden (bestimmt die Reihenfolge der Ergebnisse)
+        self.reach = 0.0 # wie weit sich die Objekte pro Tick höchstens bewegen (s. hash_positions())
+
+
+    # Diese Methode fügt ein Objekt an einer Position ein:
+    def insert(self, obj: object, x: float, y: float) -> None:
+        key = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        cell = self.cells.get(key)
+        if cell is None:
+            cell = self.cells[key] = []
+        cell.append((self.count, x, y, obj))
+        self.keys[id(obj)] = key
+        self.count += 1
+
+
+    # Diese Methode entfernt ein Objekt wieder:
+    def remove(self, obj: object) -> None:
+        key = self.keys.pop(id(obj), None)
+        if key is not None:
+            cell = self.cells[key]
+            for (i, entry) in enumerate(cell):
+                if entry[3] is obj:
+                    del cell[i]
+                    return
+
+
+    # Diese Methode gibt alle Objekte zurück, deren Position im Kreis um (x, y) mit dem Radius „radius“ liegt, und zwar in der
+    # Reihenfolge, in der sie eingefügt wurden:
+    def query(self, x: float, y: float, radius: float) -> list[object]:
+        if len(self.keys) == 0:
+            return [] # der Hash ist leer
+        size = self.cell_size
+        r2 = radius * radius
+        found = []
+        for cx in range(math.floor((x - radius) / size), math.floor((x + radius) / size) + 1):
+            for cy in range(math.floor((y - radius) / size), math.floor((y + radius) / size) + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    for entry in cell:
+                        dx = entry[1] - x
+                        dy = entry[2] - y
+                        if dx * dx + dy * dy <= r2: # die günstige Kreisprüfung vor der exakten Prüfung
+                            found.append(entry)
+        if len(found) > 1:
+            found.sort(key=lambda e: e[0])
+        return [e[3] for e in found]
+
+
+# Funktionen
+
+# Diese Funktion zerlegt ein Polygon, das von seiner Mitte aus sternförmig ist (wie alle Polygone in diesem Spiel), in konvexe
+# Teile. „points“ sind die Ecken und danach als letzter Punkt die Mitte. Jedes Teil ist ein Tupel aus Indizes in „points“.
+# Weil sich die Form beim Bewegen und Drehen nicht verändert, muss die Zerlegung pro Polygon nur einmal berechnet werden:
+def convex_decomposition(points: list[tuple[float, float]]) -> tuple[tuple[int, ...], ...]:
+    n = len(points) - 1 # die Anzahl der Ecken (ohne die Mitte)
+    center = n
+    orientation = 1 if signed_area(points[:n]) >= 0 else -1 # der Umlaufsinn des Polygons
+    if is_convex([points[i] for i in range(n)], orientation):
+        return (tuple(range(n)),) # ein konvexes Polygon muss nicht zerlegt werden
+    # Die Dreiecke (Mitte, Ecke i, Ecke i + 1) bilden zusammen das Polygon. Benachbarte Dreiecke werden zusammengefasst,
+    # solange das Ergebnis konvex bleibt:
+    pieces = []
+    i = 0
+    while i < n:
+        piece = [center, i, (i + 1) % n]
+        j = i + 1
+        while j < n and is_convex([points[k] for k in piece + [(j + 1) % n]], orientation):
+            piece.append((j + 1) % n)
+            j += 1
+        pieces.append(tuple(piece))
+        i = j
+    return tuple(pieces)
+
+
+# Diese Funktion gibt den Radius des größten Kreises um die Mitte zurück, der ganz im (sternförmigen) Polygon liegt, also den
+# kleinsten Abstand der Mitte zu einer Kante. „points“ sind wieder die Ecken und danach die Mitte:
+def inner_radius(points: list[tuple[float, float]]) -> float:
+    n = len(points) - 1
+    (cx, cy) = points[n]
+    radius = math.inf
+    for i in range(n):
+        (x1, y1) = points[i]
+        (x2, y2) = points[(i + 1) % n]
+        dx = x2 - x1
+        dy = y2 - y1
+        # der Punkt der Kante, der der Mitte am nächsten ist:
+        t = max(0.0, min(1.0, ((cx - x1) * dx + (cy - y1) * dy) / (dx * dx + dy * dy)))
+        radius = min(radius, math.hypot(x1 + t * dx - cx, y1 + t * dy - cy))
+    return radius
+
+
+# Diese Funktion gibt zurück, ob einer der Punkte in einem Kreis liegt:
+def any_point_in_circle(points: list[tuple[float, float]], cx: float, cy: float, radius: float) -> bool:
+    r2 = radius * radius
+    for (x, y) in points:
+        dx = x - cx
+        dy = y - cy
+        if dx * dx + dy * dy < r2:
+            return True
+    return False
+
+
+# Diese Funktion gibt den doppelten vorzeichenbehafteten Flächeninhalt eines Polygons zurück (das Vorzeichen ist der Umlaufsinn):
+def signed_area(points: list[tuple[float, float]]) -> float:
+    area = 0.0
+    for i in range(len(points)):
+        (x1, y1) = points[i]
+        (x2, y2) = points[(i + 1) % len(points)]
+        area += x1 * y2 - x2 * y1
+    return area
+
+
+# Diese Funktion gibt zurück, ob ein Polygon mit dem übergebenen Umlaufsinn konvex ist:
+def is_convex(points: list[tuple[float, float]], orientation: int) -> bool:
+    n = len(points)
+    for i in range(n):
+        (x1, y1) = points[i]
+        (x2, y2) = points[(i + 1) % n]
+        (x3, y3) = points[(i + 2) % n]
+        if ((x2 - x1) * (y3 - y2) - (y2 - y1) * (x3 - x2)) * orientation < 0:
+            return False
+    return True
+
+
+# Diese Funktion gibt das achsenparallele Begrenzungsrechteck von Punkten als (min_x, min_y, max_x, max_y) zurück:
+def bounds(points: list[tuple[float, float]]) -> tuple[float, float, float, float]:
+    (min_x, min_y) = (max_x, max_y) = points[0]
+    for (x, y) in points:
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+    return (min_x, min_y, max_x, max_y)
+
+
+# Diese Funktion gibt zurück, ob sich zwei Begrenzungsrechtecke überschneiden:
+def bounds_overlap(a: tuple[float, float, float, float], b: tuple[float, float, float, float]) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+# Diese Funktion prüft mit dem Trennachsensatz (SAT), ob sich zwei konvexe Polygone überschneiden. Gibt es eine Kantennormale,
+# auf der sich die Projektionen beider Polygone nicht überlappen, sind sie getrennt:
+def convex_polygons_intersect(a: list[tuple[float, float]], b: list[tuple[float, float]]) -> bool:
+    for points in (a, b):
+        n = len(points)
+        for i in range(n):
+            (x1, y1) = points[i]
+            (x2, y2) = points[(i + 1) % n]
+            nx = y1 - y2 # die Normale der Kante
+            ny = x2 - x1
+            # beide Polygone auf die Normale projizieren und die Intervalle vergleichen:
+            a_min = a_max = a[0][0] * nx + a[0][1] * ny
+            for (x, y) in a:
+                p = x * nx + y * ny
+                if p < a_min:
+                    a_min = p
+                elif p > a_max:
+                    a_max = p
+            b_min = b_max = b[0][0] * nx + b[0][1] * ny
+            for (x, y) in b:
+                p = x * nx + y * ny
+                if p < b_min:
+                    b_min = p
+                elif p > b_max:
+                    b_max = p
+            if a_max < b_min or b_max < a_min:
+                return False
+    return True
+
+
+# Diese Funktion prüft exakt, ob sich zwei Polygone überschneiden, auch wenn keine Ecke des einen im anderen liegt. „a_pieces“
+# und „b_pieces“ sind die zwischengespeicherten konvexen Zerlegungen (s. convex_decomposition()). Zuerst werden nur die Teile
+# ausgewählt, deren Begrenzungsrechteck das andere Polygon überhaupt berührt; z. B. bleiben beim kleinen Raumschiff gegen einen
+# großen Asteroiden meist nur ein oder zwei Teile übrig:
+def polygons_intersect(a_points: list[tuple[float, float]], a_pieces: tuple[tuple[int, ...], ...],
+                       b_points: list[tuple[float, float]], b_pieces: tuple[tuple[int, ...], ...]) -> bool:
+    a_bounds = bounds(a_points)
+    b_bounds = bounds(b_points)
+    if not bounds_overlap(a_bounds, b_bounds):
+        return False
+    a_candidates = overlapping_pieces(a_points, a_pieces, b_bounds)
+    if len(a_candidates) == 0:
+        return False
+    b_candidates = overlapping_pieces(b_points, b_pieces, a_bounds)
+    for (a_piece, a_piece_bounds) in a_candidates:
+        for (b_piece, b_piece_bounds) in b_candidates:
+            if bounds_overlap(a_piece_bounds, b_piece_bounds) and convex_polygons_intersect(a_piece, b_piece):
+                return True
+    return False
+
+
+# Diese Funktion gibt die konvexen Teile (als Punkte mit ihrem Begrenzungsrechteck) zurück, die ein Begrenzungsrechteck berühren:
+def overlapping_pieces(points: list[tuple[float, float]], pieces: tuple[tuple[int, ...], ...],
+                       other: tuple[float, float, float, float]) -> list[tuple[list[tuple[float, float]], tuple]]:
+    if len(pieces) == 1:
+        return [(points[:-1], bounds(points))] # ein konvexes Polygon besteht nur aus seinen Ecken
+    candidates = []
+    for piece in pieces:
+        piece_points = [points[i] for i in piece]
+        piece_bounds = bounds(piece_points)
+        if bounds_overlap(piece_bounds, other):
+            candidates.append((piece_points, piece_bounds))
+    return candidates
+
+
+# Diese Funktion gibt das Quadrat des Abstands des Punktes (px, py) von der Strecke von (x0, y0) nach (x1, y1) zurück:
+def segment_distance_squared(px: float, py: float, x0: float, y0: float, x1: float, y1: float) -> float:
+    dx = x1 - x0
+    dy = y1 - y0
+    length_squared = dx * dx + dy * dy
+    # der Punkt der Strecke, der (px, py) am nächsten ist:
+    t = 0.0 if length_squared == 0 else max(0.0, min(1.0, ((px - x0) * dx + (py - y0) * dy) / length_squared))
+    ex = x0 + t * dx - px
+    ey = y0 + t * dy - py
+    return ex * ex + ey * ey
+
+
+# Diese Funktion gibt zurück, ob der Punkt (x, y) im Polygon liegt (Polygon.segment_in() prüft damit den Endpunkt einer Kugel).
+# „points“ sind die Ecken und danach die Mitte:
+def point_in_polygon(points: list[tuple[float, float]], x: float, y: float) -> bool:
+    n = len(points) - 1
+    inside = False
+    (x1, y1) = points[n - 1]
+    for i in range(n):
+        (x2, y2) = points[i]
+        if ((y1 > y) != (y2 > y)) and (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1):
+            inside = not inside
+        (x1, y1) = (x2, y2)
+    return inside
+
+
+# Diese Funktion gibt zurück, ob die Strecke von (x0, y0) nach (x1, y1) eine Kante des Polygons schneidet oder berührt.
+# „points“ sind die Ecken und danach die Mitte:
+def segment_crosses_polygon(points: list[tuple[float, float]], x0: float, y0: float, x1: float, y1: float) -> bool:
+    dx = x1 - x0
+    dy = y1 - y0
+    if dx == 0 and dy == 0:
+        return False # eine Strecke ohne Länge schneidet keine Kante
+    n = len(points) - 1
+    (ax, ay) = points[n - 1]
+    sa = dx * (ay - y0) - dy * (ax - x0) # auf welcher Seite der Strecke die Ecke A liegt (Vorzeichen)
+    for i in range(n):
+        (bx, by) = points[i]
+        sb = dx * (by - y0) - dy * (bx - x0)
+        if (sa <= 0 <= sb) or (sb <= 0 <= sa): # die Kante von A nach B reicht über die Gerade der Strecke
+            ex = bx - ax
+            ey = by - ay
+            # auf welchen Seiten der Kante die Endpunkte der Strecke liegen:
+            s0 = ex * (y0 - ay) - ey * (x0 - ax)
+            s1 = ex * (y1 - ay) - ey * (x1 - ax)
+            if (s0 <= 0 <= s1) or (s1 <= 0 <= s0):
+                if sa != 0 or sb != 0:
+                    return True
+                # Die Kante liegt auf der Geraden der Strecke; sie schneiden sich, wenn sich ihre Abschnitte überlappen:
+                length_squared = dx * dx + dy * dy
+                ta = ((ax - x0) * dx + (ay - y0) * dy) / length_squared
+                tb = ((bx - x0) * dx + (by - y0) * dy) / length_squared
+                if max(ta, tb) >= 0 and min(ta, tb) <= 1:
+                    return True
+        (ax, ay, sa) = (bx, by, sb)
+    return False
+
+
+# Diese Funktion baut einen räumlichen Hash aus Objekten, die eine Position „pos“ und eine Bewegung pro Tick „mot“ (jeweils mit
+# den Koordinaten x und y) haben:
+def hash_positions(objects: list, cell_size: float = CELL_SIZE) -> SpatialHash:
+    grid = SpatialHash(cell_size)
+    reach = 0.0
+    for obj in objects:
+        grid.insert(obj, obj.pos.x, obj.pos.y)
+        mot = obj.mot
+        step = mot.x * mot.x + mot.y * mot.y
+        if step > reach:
+            reach = step
+    grid.reach = math.sqrt(reach)
+    return grid
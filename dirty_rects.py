@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import math
+import pygame
+
+
+# Dieses Modul merkt sich, welche Rechtecke des Fensters in einem Frame bemalt wurden, damit nicht jedes Mal das ganze Fenster
+# gelöscht und mit pygame.display.update() übertragen werden muss. Am Anfang eines Frames werden nur die Rechtecke des letzten
+# Frames schwarz gefüllt, danach wird wie gewohnt alles gezeichnet, und übertragen werden nur die Rechtecke des letzten und des
+# aktuellen Frames (die alten, damit verschwundene Objekte auch im Fenster gelöscht werden). Decken die Rechtecke zusammen mehr
+# als MAX_COVERAGE des Fensters ab (z. B. in einem dichten Asteroidenfeld), wird doch das ganze Fenster übertragen, weil viele
+# kleine Rechtecke dann teurer sind als ein großes.
+
+
+# Konstanten
+
+MAX_COVERAGE = 0.5 # ab welchem Anteil der Fensterfläche das ganze Fenster übertragen wird
+
+
+# Klassen
+
+# Diese Klasse sammelt die Rechtecke, die in einem Frame bemalt werden:
+class DirtyRects:
+
+    def __init__(self, size: tuple[int, int], max_coverage: float = MAX_COVERAGE) -> None:
+        self.bounds = pygame.Rect((0, 0), size) # das ganze Fenster
+        self.max_area = max_coverage * self.bounds.width * self.bounds.height
+        self.previous: list[pygame.Rect] | None = None # die Rechtecke des letzten Frames (None, wenn unbekannt)
+        self.current: list[pygame.Rect] = [] # die Rechtecke des aktuellen Frames
+        self.tracking = False # ob im aktuellen Frame Rechtecke gesammelt werden
+
+
+    # Diese Methode beginnt einen Frame, in dem Rechtecke gesammelt werden: Die Rechtecke des letzten Frames werden mit der
+    # Hintergrundfarbe gefüllt. Sind sie unbekannt (z. B. nach einem Menü), wird das ganze Fenster gefüllt:
+    def begin(self, screen: pygame.Surface, color: tuple[int, int, int]) -> None:
+        if self.previous is None:
+            screen.fill(color)
+        else:
+            for r in self.previous:
+                screen.fill(color, r)
+        self.current = []
+        self.tracking = True
+
+
+    # Diese Methode fügt ein bemaltes Rechteck hinzu:
+    def add(self, rect: pygame.Rect) -> None:
+        self.current.append(rect)
+
+
+    # Diese Methode fügt mehrere bemalte Rechtecke hinzu:
+    def extend(self, rects: list[pygame.Rect]) -> None:
+        self.current += rects
+
+
+    # Diese Methode beendet den Frame und gibt die Rechtecke zurück, die an pygame.display.update() übergeben werden. None
+    # bedeutet, dass das ganze Fenster übertragen werden muss (weil begin() nicht aufgerufen wurde, die Rechtecke des letzten
+    # Frames unbekannt sind oder zu viel Fläche abdecken):
+    def end(self) -> list[pygame.Rect] | None:
+        if not self.tracking:
+            self.previous = None # Wer im nächsten Frame Rechtecke sammelt, muss das ganze Fenster löschen
+            self.current = []
+            return None
+        # nur die Teile innerhalb des Fensters behalten (Objekte am Rand ragen oft hinaus):
+        rects = [c for c in (r.clip(self.bounds) for r in self.current) if c.width > 0 and c.height > 0]
+        update = None if self.previous is None else self.previous + rects
+        self.previous = rects
+        self.current = []
+        self.tracking = False
+        if update is not None and sum(r.width * r.height for r in update) > self.max_area:
+            return None
+        return update
+
+
+# Funktionen
+
+# Diese Funktion beendet den Frame und überträgt die bemalten Rechtecke ins Fenster, oder das ganze Fenster, wenn end() None
+# zurückgibt (pygame.display.update(None) würde gar nichts übertragen, nur ohne Argument wird das ganze Fenster übertragen):
+def present(dirty_rects: DirtyRects) -> None:
+    rects = dirty_rects.end()
+    if rects is None:
+        pygame.display.update()
+    else:
+        pygame.display.update(rects)
+
+
+# Diese Funktion gibt das Rechteck zurück, das einen Kreis (oder alles, was in ihm liegt) mit einer Umrandung der Dicke
+# „stroke_weight“ sicher enthält:
+def circle_rect(x: float, y: float, radius: float, stroke_weight: int = 0) -> pygame.Rect:
+    r = radius + stroke_weight + 1 # ein Pixel Spielraum für das Runden beim Zeichnen
+    left = math.floor(x - r)
+    top = math.floor(y - r)
+    return pygame.Rect(left, top, math.ceil(x + r) - left + 1, math.ceil(y + r) - top + 1)
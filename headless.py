@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import argparse
+import random
+import time
+
+from dataclasses import dataclass
+from typing import Callable
+
+# Eigene Imports
+
+import asteroids
+import sounds
+
+from asteroids import GameWorld, PlayerInput
+from profiler import FrameProfiler
+from recording import Recording, save_recording
+
+
+# Dieses Modul lässt das Spiel ohne Fenster, ohne Tastatur und ohne Geräusche laufen. Die Ticks werden so schnell berechnet,
+# wie die CPU es erlaubt (ohne clock.tick(FPS)), und die Eingabe des Spielers wird von einem Skript vorgegeben.
+
+
+# Klassen
+
+# Diese Datenklasse enthält das Ergebnis einer Headless-Simulation:
+@dataclass
+class SimulationResult:
+
+    ticks: int # die Anzahl der simulierten Ticks
+    seconds: float # die Zeit, die die Simulation gedauert hat
+    score: int # der Punktestand am Ende der Simulation
+    playing_ticks: int # wie viele Ticks der Spieler überlebt hat
+    game_over: bool # ob das Spiel am Ende aus ist
+
+    # Diese Methode gibt zurück, wie viele Ticks pro Sekunde simuliert wurden:
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.seconds if self.seconds > 0 else float('inf')
+
+
+# Funktionen
+
+# Diese Funktion initialisiert das Spiel, ohne ein Fenster zu öffnen, den Soundmixer zu starten, Schriftarten oder
+# den Spielstand zu laden:
+def init() -> None:
+    sounds.init_silent() # alle Geräusche stumm schalten
+    asteroids.init_constants()
+
+
+# Diese Funktion simuliert ein neues Spiel in einer eigenen Spielwelt für eine Anzahl von Ticks. „script“ gibt für jeden Tick
+# die Eingabe des Spielers zurück. Mit „asteroid_arrays“ werden die Asteroiden in NumPy-Arrays gespeichert. Mit einem Startwert
+# („seed“) verläuft die Simulation bei jedem Aufruf genau gleich. Mit einem „profiler“ wird jeder Tick als ein Frame gemessen.
+# In „recording“ wird die Eingabe jedes Ticks aufgezeichnet (s. recording.py):
+def simulate(ticks: int, script: Callable[[int], PlayerInput], stop_on_game_over: bool = False,
+             asteroid_arrays: bool = False, seed: int | None = None, profiler: FrameProfiler | None = None,
+             recording: Recording | None = None) -> SimulationResult:
+    world = GameWorld(asteroid_arrays=asteroid_arrays, seed=seed)
+    world.profiler = profiler
+    world.new_game()
+    start = time.perf_counter()
+    tick = 0
+    while tick < ticks:
+        if profiler is not None:
+            profiler.begin_frame()
+        player_input = script(tick)
+        if recording is not None:
+            recording.append(player_input.to_mask())
+        world.step(player_input)
+        if profiler is not None:
+            profiler.end_frame()
+        tick += 1
+        if stop_on_game_over and world.game_over:
+            break
+    seconds = time.perf_counter() - start
+    return SimulationResult(tick, seconds, world.score + world.add_points, world.playing_ticks, world.game_over)
+
+
+# Dieses Skript gibt keine Eingabe:
+def idle_script(tick: int) -> PlayerInput:
+    return PlayerInput()
+
+
+# Dieses Skript dreht das Raumschiff dauerhaft nach links und schießt sechsmal pro Sekunde:
+def spin_and_fire_script(tick: int) -> PlayerInput:
+    return PlayerInput(left=True, fire=tick % (asteroids.FPS // 6) == 0)
+
+
+# Dieses Skript steuert wie ein zufällig spielender Spieler: Alle paar Ticks drückt es andere Tasten, und es schießt im Schnitt
+# sechsmal pro Sekunde. Weil es sich merkt, wann es die Tasten wechselt, muss es Tick für Tick aufgerufen werden. Mit demselben
+# Startwert steuert es jedes Mal genau gleich:
+class RandomBot:
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.rng = random.Random(seed)
+        self.keys = PlayerInput() # die Tasten, die gerade gedrückt sind
+        self.next_change = 0 # in welchem Tick die Tasten wieder wechseln
+
+
+    def __call__(self, tick: int) -> PlayerInput:
+        if tick >= self.next_change:
+            self.keys = PlayerInput(thrust=self.rng.random() < 0.3, left=self.rng.random() < 0.35,
+                                    right=self.rng.random() < 0.35)
+            self.next_change = tick + self.rng.randint(asteroids.FPS // 6, asteroids.FPS)
+        return PlayerInput(self.keys.thrust, self.keys.left, self.keys.right, fire=self.rng.random() < 0.1)
+
+
+# die Skripte, die über die Kommandozeile ausgewählt werden können:
+SCRIPTS = {
+    'idle': idle_script,
+    'spin-and-fire': spin_and_fire_script
+}
+
+
+# Die main()-Funktion
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Runs Asteroids without a display and reports the simulation speed.')
+    parser.add_argument('ticks', type=int, help='the number of ticks to simulate')
+    parser.add_argument('--script', choices=SCRIPTS.keys(), default='spin-and-fire', help='the scripted player input')
+    parser.add_argument('--stop-on-game-over', action='store_true', help='stop as soon as the player has lost all lives')
+    parser.add_argument('--asteroid-arrays', action='store_true', help='store asteroid kinematics in NumPy arrays')
+    parser.add_argument('--seed', type=int, help='the seed of the world\'s random number generator (for reproducible runs)')
+    parser.add_argument('--profile', action='store_true', help='time each phase of a tick and print percentiles')
+    parser.add_argument('--trace', help='also export the per-tick phase timings to this .csv or .json file')
+    parser.add_argument('--record', help='record the input of every tick to this file (for replay.py)')
+    args = parser.parse_args()
+
+    init()
+    profiler = FrameProfiler(window=args.ticks) if args.profile or args.trace else None
+    seed = args.seed
+    recording = None
+    if args.record is not None:
+        if seed is None:
+            seed = random.randrange(2 ** 63) # eine Aufzeichnung braucht einen Startwert
+        recording = Recording(seed, asteroid_arrays=args.asteroid_arrays)
+    result = simulate(args.ticks, SCRIPTS[args.script], args.stop_on_game_over, args.asteroid_arrays,
+                      seed, profiler, recording)
+    print('%d ticks in %.3f s (%.0f ticks/s), score %d, survived %d ticks%s' % (
+        result.ticks, result.seconds, result.ticks_per_second(), result.score, result.playing_ticks,
+        ', game over' if result.game_over else ''))
+    if profiler is not None:
+        print('\n'.join(profiler.report_lines()))
+        if args.trace is not None:
+            if args.trace.endswith('.json'):
+                profiler.export_json(args.trace)
+            else:
+                profiler.export_csv(args.trace)
+    if recording is not None:
+        save_recording(args.record, recording)
+
+
+# Aufruf der main()-Funktion:
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import numpy as np
+
+
+# Dieses Modul prüft viele Kugeln auf einmal gegen ein Polygon. Statt für jede Kugel einzeln in Python über alle Kanten zu
+# laufen (s. Polygon.segment_in()), werden die Strecken aller Kugeln als Arrays gegen alle Kanten des Polygons in einem
+# vektorisierten Durchgang geprüft. Die Rechnung ist Schritt für Schritt dieselbe wie in collision.py (dieselben Operationen in
+# derselben Reihenfolge), sodass beide Wege genau dieselben Treffer liefern.
+
+
+# Funktionen
+
+# Diese Funktion gibt zurück, welche der Strecken von (x0, y0) nach (x1, y1) das Polygon berühren (als Array von Wahrheitswerten).
+# „points“ sind die Ecken und danach die Mitte des Polygons, „radius“ ist der Radius seines umschließenden Kreises:
+def segments_in_polygon(points: list[tuple[float, float]], radius: float, x0: np.ndarray, y0: np.ndarray, x1: np.ndarray,
+                        y1: np.ndarray) -> np.ndarray:
+    corners = np.array(points)
+    (cx, cy) = corners[-1]
+    corners = corners[:-1]
+    dx = x1 - x0
+    dy = y1 - y0
+    length_squared = dx * dx + dy * dy
+    moving = (dx != 0) | (dy != 0) # Strecken ohne Länge schneiden keine Kante
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # die Strecken, die den umschließenden Kreis verfehlen (s. collision.segment_distance_squared()):
+        t = np.where(length_squared != 0, np.minimum(1.0, np.maximum(0.0, ((cx - x0) * dx + (cy - y0) * dy) / length_squared)), 0.0)
+        ex = x0 + t * dx - cx
+        ey = y0 + t * dy - cy
+        hits = ex * ex + ey * ey <= radius * radius
+        near = np.flatnonzero(hits) # nur diese Strecken müssen exakt geprüft werden
+        if len(near) == 0:
+            return hits
+
+        # Zeilen sind Strecken, Spalten sind Kanten von A (der vorherigen Ecke) nach B:
+        (bx, by) = (corners[:, 0], corners[:, 1])
+        (ax, ay) = (np.roll(bx, 1), np.roll(by, 1))
+        (x0, y0, x1, y1) = (x0[near, None], y0[near, None], x1[near, None], y1[near, None])
+        (dx, dy, length_squared, moving) = (dx[near], dy[near], length_squared[near], moving[near])
+
+        # Liegt der Endpunkt im Polygon? (s. collision.point_in_polygon())
+        crossings = ((ay > y1) != (by > y1)) & (x1 < (bx - ax) * (y1 - ay) / (by - ay) + ax)
+        inside = (np.count_nonzero(crossings, axis=1) % 2) == 1
+
+        # Schneidet die Strecke eine Kante? (s. collision.segment_crosses_polygon())
+        (dx, dy) = (dx[:, None], dy[:, None])
+        sides = dx * (by - y0) - dy * (bx - x0) # auf welcher Seite der Strecke jede Ecke liegt
+        sb = sides
+        sa = np.roll(sides, 1, axis=1)
+        (ex, ey) = (bx - ax, by - ay)
+        s0 = ex * (y0 - ay) - ey * (x0 - ax)
+        s1 = ex * (y1 - ay) - ey * (x1 - ax)
+        straddles = (((sa <= 0) & (0 <= sb)) | ((sb <= 0) & (0 <= sa))) & (((s0 <= 0) & (0 <= s1)) | ((s1 <= 0) & (0 <= s0)))
+        # Kanten, die auf der Geraden der Strecke liegen, schneiden sie nur, wenn sich ihre Abschnitte überlappen:
+        collinear = (sa == 0) & (sb == 0)
+        if collinear.any():
+            ta = ((ax - x0) * dx + (ay - y0) * dy) / length_squared[:, None]
+            tb = ((bx - x0) * dx + (by - y0) * dy) / length_squared[:, None]
+            straddles &= ~collinear | ((np.maximum(ta, tb) >= 0) & (np.minimum(ta, tb) <= 1))
+        crosses = moving & straddles.any(axis=1)
+    hits[near] = inside | crosses
+    return hits
+
+
+# Diese Funktion gibt den Index der ersten Kugel zurück, die im letzten Tick ein Polygon getroffen hat, das sich dabei um
+# (mx, my) bewegt hat (wie Bullet.hits(), aber für alle Kugeln auf einmal), oder -1, wenn keine getroffen hat. Kugeln, die in
+# diesem Tick schon etwas getroffen haben („dead“), werden übersprungen:
+def first_hit(bullets: list, points: list[tuple[float, float]], radius: float, mx: float, my: float) -> int:
+    coords = np.array([(b.pos.x, b.pos.y, b.mot.x, b.mot.y, b.dead) for b in bullets])
+    (x1, y1) = (coords[:, 0], coords[:, 1])
+    hits = segments_in_polygon(points, radius, x1 - coords[:, 2] + mx, y1 - coords[:, 3] + my, x1, y1)
+    hits &= coords[:, 4] == 0
+    index = int(np.argmax(hits))
+    return index if hits[index] else -1
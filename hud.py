@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import pygame
+
+from collections import OrderedDict
+
+
+# Dieses Modul rendert die Anzeige während eines Spiels (die Punktzahl, die hinzukommenden Punkte, den Highscore und die Leben).
+# Texte werden nur neu gerastert, wenn sich einer der angezeigten Werte ändert; sonst werden jeden Frame dieselben Oberflächen
+# geblittet. Gerasterte Texte liegen in einem kleinen Cache (dieselben Texte kommen oft wieder, z. B. „+20“).
+#
+# Optional werden lange Zahlen nicht mit FreeType gerastert, sondern aus vorgerenderten Ziffern zusammengesetzt (einem
+# Glyphenatlas), weil sich eine große Punktzahl fast nie wiederholt und der Cache ihr deshalb nichts nützt. Mit pygame 2 ist das
+# Rastern einer Zahl mit FreeType (etwa 5 bis 8 µs) allerdings billiger als das einzelne Blitten ihrer Ziffern, deshalb ist der
+# Atlas standardmäßig ausgeschaltet (s. ATLAS_MIN_LENGTH).
+
+
+# Konstanten
+
+GLYPHS = '0123456789+' # die Zeichen im Glyphenatlas
+ATLAS_MIN_LENGTH: int | None = None # ab wie vielen Zeichen eine Zahl aus dem Glyphenatlas zusammengesetzt wird (None: nie)
+MAX_TEXTS = 64 # wie viele gerasterte Texte der Cache höchstens behält
+
+SCORE_POS = (15, 15) # wo die Punktzahl angezeigt wird
+HIGH_SCORE_POS = (15, 58) # wo der Highscore angezeigt wird
+LIVES_POS = (15, 90) # wo das erste Leben angezeigt wird
+LIFE_SPACING = 22 # der Abstand zwischen zwei Leben
+
+
+# Klassen
+
+# Diese Klasse speichert gerasterte Texte (Schriftart, Text, Farbe -> Oberfläche) in einem LRU-Cache:
+class TextCache:
+
+    def __init__(self, max_texts: int = MAX_TEXTS) -> None:
+        self.max_texts = max_texts
+        self.surfaces: OrderedDict[tuple[pygame.font.Font, str, tuple[int, int, int]], pygame.Surface] = OrderedDict()
+
+
+    # Diese Methode gibt einen gerasterten Text zurück und rastert ihn nur, wenn er noch nicht im Cache ist:
+    def render(self, font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = font.render(text, True, color)
+            if len(self.surfaces) > self.max_texts:
+                self.surfaces.popitem(last=False) # den am längsten nicht benutzten Text entfernen
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+
+# Diese Klasse enthält die vorgerenderten Zeichen einer Schriftart in einer Farbe. Ein Text wird zusammengesetzt, indem jedes
+# Zeichen um die Vorschubbreite (advance) des vorigen Zeichens versetzt geblittet wird, so wie FreeType es auch tut. Das Ergebnis
+# ist pixelgleich mit font.render():
+class GlyphAtlas:
+
+    def __init__(self, font: pygame.font.Font, color: tuple[int, int, int], chars: str = GLYPHS) -> None:
+        self.glyphs = {c: font.render(c, True, color) for c in chars}
+        self.advances = {c: m[4] for (c, m) in zip(chars, font.metrics(chars))}
+        # Ragt ein Zeichen links über seine Position hinaus (z. B. die „3“), rendert FreeType es allein um diese Pixel nach
+        # rechts versetzt; beim Blitten wird das wieder abgezogen:
+        self.bearings = {c: min(0, m[0]) for (c, m) in zip(chars, font.metrics(chars))}
+
+
+    # Diese Methode gibt zurück, ob ein Text nur aus Zeichen des Atlas besteht:
+    def supports(self, text: str) -> bool:
+        return all(c in self.glyphs for c in text)
+
+
+    # Diese Methode gibt die Oberflächen und Positionen der Zeichen eines Texts zurück (für Surface.blits()) und dazu seine Breite:
+    def layout(self, text: str, x: int, y: int) -> tuple[list[tuple[pygame.Surface, tuple[int, int]]], int]:
+        items = []
+        start = x
+        end = x
+        x -= self.bearings[text[0]] # Ragt das erste Zeichen links hinaus, verschiebt FreeType den ganzen Text
+        for c in text:
+            glyph = self.glyphs[c]
+            items.append((glyph, (x + self.bearings[c], y)))
+            end = max(end, x + self.bearings[c] + glyph.get_width())
+            x += self.advances[c]
+        return (items, end - start)
+
+
+# Diese Klasse rendert die Anzeige während eines Spiels:
+class Hud:
+
+    def __init__(self, score_font: pygame.font.Font, high_score_font: pygame.font.Font, life_surface: pygame.Surface,
+                 white: tuple[int, int, int], green: tuple[int, int, int], orange: tuple[int, int, int],
+                 atlas_min_length: int | None = ATLAS_MIN_LENGTH) -> None:
+        self.score_font = score_font
+        self.high_score_font = high_score_font
+        self.life_surface = life_surface
+        (self.white, self.green, self.orange) = (white, green, orange)
+        self.texts = TextCache()
+        self.atlas_min_length = atlas_min_length
+        self.atlases: dict[tuple[pygame.font.Font, tuple[int, int, int]], GlyphAtlas] = {} # werden bei Bedarf angelegt
+        self.values: tuple | None = None # die Werte, die gerade angezeigt werden
+        self.items: list[tuple[pygame.Surface, tuple[int, int]]] = [] # die Oberflächen und Positionen für Surface.blits()
+
+
+    # Diese Methode rendert die Anzeige und gibt die bemalten Rechtecke zurück. Nur wenn sich einer der Werte seit dem letzten
+    # Aufruf geändert hat, werden die Oberflächen neu zusammengestellt:
+    def render(self, screen: pygame.Surface, score: int, add_points: int, high_score: int, new_high_score: bool,
+               lives: int) -> list[pygame.Rect]:
+        values = (score, add_points, high_score, new_high_score, lives)
+        if values != self.values:
+            self.values = values
+            self.items = self.__layout(score, add_points, high_score, new_high_score, lives)
+        return screen.blits(self.items)
+
+
+    # Diese Methode stellt die Oberflächen und Positionen der ganzen Anzeige zusammen:
+    def __layout(self, score: int, add_points: int, high_score: int, new_high_score: bool,
+                 lives: int) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        items = []
+        (x, y) = SCORE_POS
+        width = self.__text(items, self.score_font, str(score), self.white, x, y) # die Punktzahl
+        if add_points > 0:
+            # die Punkte, die zur Punktzahl hinzukommen, in Grün direkt dahinter:
+            self.__text(items, self.score_font, '+%d' % add_points, self.green, x + width, y)
+        (x, y) = HIGH_SCORE_POS
+        if new_high_score:
+            self.__text(items, self.high_score_font, str(score + add_points), self.orange, x, y) # ein neuer Highscore in Orange
+        else:
+            self.__text(items, self.high_score_font, str(high_score), self.white, x, y)
+        (x, y) = LIVES_POS
+        for i in range(lives):
+            items.append((self.life_surface, (x + i * LIFE_SPACING, y))) # für jedes Leben ein Raumschiff
+        return items
+
+
+    # Diese Methode fügt einen Text an der Stelle (x, y) hinzu und gibt seine Breite zurück. Lange Zahlen werden (wenn der Atlas
+    # eingeschaltet ist) aus dem Glyphenatlas zusammengesetzt, alles andere wird mit FreeType gerastert oder aus dem Cache genommen:
+    def __text(self, items: list, font: pygame.font.Font, text: str, color: tuple[int, int, int], x: int, y: int) -> int:
+        if self.atlas_min_length is not None and len(text) >= self.atlas_min_length:
+            atlas = self.atlases.get((font, color))
+            if atlas is None:
+                atlas = self.atlases[(font, color)] = GlyphAtlas(font, color)
+            if atlas.supports(text):
+                (glyphs, width) = atlas.layout(text, x, y)
+                items += glyphs
+                return width
+        surface = self.texts.render(font, text, color)
+        items.append((surface, (x, y)))
+        return surface.get_width()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+from typing import Callable, Generic, TypeVar
+
+
+# Dieses Modul hält kurzlebige Objekte (z. B. Kugeln und Partikel) in Pools vor, damit sie nicht jeden Tick neu konstruiert und
+# vom Garbage Collector wieder eingesammelt werden müssen. Ein Objekt, das aus seiner Liste entfernt wird, kommt in die
+# Freiliste seines Pools; das nächste neue Objekt dieser Art wird aus der Freiliste genommen und nur neu befüllt. Im laufenden
+# Spiel werden dadurch fast keine neuen Objekte mehr angelegt, und der Garbage Collector läuft entsprechend seltener.
+#
+# Ein Objekt darf erst an seinen Pool zurückgegeben werden, wenn nichts anderes mehr darauf verweist, weil es beim nächsten
+# acquire() mit neuen Werten überschrieben wird.
+
+
+# Konstanten
+
+MAX_FREE = 1024 # wie viele freie Objekte ein Pool höchstens behält (der Rest wird normal freigegeben)
+
+
+# Variablen
+
+T = TypeVar('T')
+
+
+# Klassen
+
+# Diese Klasse ist ein Pool mit einer Freiliste für Objekte einer Art:
+class Pool(Generic[T]):
+
+    def __init__(self, factory: Callable[[], T], max_free: int = MAX_FREE) -> None:
+        self.factory = factory # konstruiert ein neues (leeres) Objekt, wenn die Freiliste leer ist
+        self.max_free = max_free
+        self.free: list[T] = [] # die Freiliste
+        self.created = 0 # wie viele Objekte der Pool bisher konstruiert hat
+        self.reused = 0 # wie oft ein Objekt aus der Freiliste wiederverwendet wurde
+
+
+    # Diese Methode gibt ein Objekt aus der Freiliste zurück oder konstruiert ein neues. Der Aufrufer muss alle Werte neu setzen:
+    def acquire(self) -> T:
+        if len(self.free) > 0:
+            self.reused += 1
+            return self.free.pop()
+        self.created += 1
+        return self.factory()
+
+
+    # Diese Methode gibt ein Objekt an den Pool zurück:
+    def release(self, obj: T) -> None:
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+
+    # Diese Methode gibt mehrere Objekte an den Pool zurück:
+    def release_all(self, objs: list[T]) -> None:
+        room = self.max_free - len(self.free)
+        if room > 0:
+            self.free += objs[:room] if len(objs) > room else objs
+
+
+# Funktionen
+
+# Diese Funktion entfernt alle Objekte aus einer Liste, für die „remove“ wahr ist, übergibt sie „release“ (falls angegeben) und
+# gibt zurück, wie viele entfernt wurden. Anders als eine List Comprehension wird dabei keine neue Liste angelegt: Die übrigen
+# Objekte werden in derselben Liste nach vorne geschoben, ihre Reihenfolge bleibt erhalten (von ihr hängt ab, welche Kugel zuerst
+# trifft, also auch der Ablauf aufgezeichneter Spiele):
+def compact(items: list[T], remove: Callable[[T], bool], release: Callable[[T], None] | None = None) -> int:
+    kept = 0
+    for obj in items:
+        if remove(obj):
+            if release is not None:
+                release(obj)
+        else:
+            items[kept] = obj # überschreibt nur Stellen, über die die Schleife schon hinweg ist
+            kept += 1
+    removed = len(items) - kept
+    del items[kept:]
+    return removed
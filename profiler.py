@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import csv
+import json
+import math
+import time
+
+from collections import deque
+
+
+# Dieses Modul misst, wie lange die einzelnen Phasen eines Frames dauern (z. B. die Kollisionen der Asteroiden mit Kugeln oder
+# das Rendern der Asteroiden). Die Zeit zwischen zwei Aufrufen von lap() wird der jeweiligen Phase zugeschrieben, sodass pro
+# Phase nur ein einziger Aufruf von time.perf_counter() nötig ist. Die letzten Frames werden in einem rollenden Fenster
+# aufbewahrt, aus dem Perzentile berechnet und als CSV- oder JSON-Datei exportiert werden können.
+
+
+# Konstanten
+
+PERCENTILES = (50, 95, 99) # die Perzentile, die berichtet werden
+FRAME = 'frame' # der Name der Phase, die den ganzen Frame umfasst
+
+
+# Klassen
+
+# Diese Klasse misst die Dauer der Phasen von Frames:
+class FrameProfiler:
+
+    def __init__(self, window: int = 600) -> None:
+        self.frames: deque[dict[str, float]] = deque(maxlen=window) # die Dauern (in Sekunden) der letzten Frames pro Phase
+        self.phases: list[str] = [] # alle bisher gemessenen Phasen in der Reihenfolge ihres ersten Auftretens
+        self.current: dict[str, float] = {} # die Dauern des laufenden Frames
+        self.count = 0 # die Anzahl aller bisher gemessenen Frames (auch derer, die nicht mehr im Fenster sind)
+        self.start = self.last = time.perf_counter()
+
+
+    # Diese Methode beginnt einen neuen Frame:
+    def begin_frame(self) -> None:
+        self.current = {}
+        self.start = self.last = time.perf_counter()
+
+
+    # Diese Methode schreibt die Zeit seit dem letzten Aufruf (oder dem Beginn des Frames) der übergebenen Phase zu. Kommt eine
+    # Phase in einem Frame mehrmals vor, werden ihre Dauern addiert:
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        current = self.current
+        if phase in current:
+            current[phase] += now - self.last
+        else:
+            current[phase] = now - self.last
+            if phase not in self.phases:
+                self.phases.append(phase)
+        self.last = now
+
+
+    # Diese Methode beendet den laufenden Frame und speichert seine Dauern im rollenden Fenster:
+    def end_frame(self) -> None:
+        self.current[FRAME] = time.perf_counter() - self.start
+        self.frames.append(self.current)
+        self.count += 1
+
+
+    # Diese Methode gibt ein Perzentil (0 bis 100) der Dauer einer Phase in Millisekunden zurück. Frames, in denen die Phase
+    # nicht vorkam, zählen mit 0 ms:
+    def percentile(self, phase: str, p: float) -> float:
+        values = sorted(f.get(phase, 0.0) for f in self.frames)
+        return nearest_rank(values, p) * 1000 if len(values) > 0 else 0.0
+
+
+    # Diese Methode gibt für jede Phase die Perzentile und das Maximum in Millisekunden zurück:
+    def stats(self) -> dict[str, dict[str, float]]:
+        stats = {}
+        for phase in self.phases + [FRAME]:
+            values = sorted(f.get(phase, 0.0) for f in self.frames)
+            if len(values) == 0:
+                continue
+            entry = {}
+            for p in PERCENTILES:
+                entry['p%d' % p] = nearest_rank(values, p) * 1000
+            entry['max'] = values[-1] * 1000
+            stats[phase] = entry
+        return stats
+
+
+    # Diese Methode gibt die Statistik als Textzeilen zurück (z. B. für das Overlay oder die Konsole):
+    def report_lines(self) -> list[str]:
+        lines = ['%-18s %7s %7s %7s %7s' % (('phase (ms)',) + tuple('p%d' % p for p in PERCENTILES) + ('max',))]
+        for (phase, entry) in self.stats().items():
+            lines.append('%-18s %7.2f %7.2f %7.2f %7.2f' % ((phase,) + tuple(entry['p%d' % p] for p in PERCENTILES) +
+                                                           (entry['max'],)))
+        return lines
+
+
+    # Diese Methode exportiert die Frames im rollenden Fenster als CSV-Datei (eine Zeile pro Frame, eine Spalte pro Phase, in ms):
+    def export_csv(self, path: str) -> None:
+        columns = self.phases + [FRAME]
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            for f in self.frames:
+                writer.writerow(['%.4f' % (f.get(phase, 0.0) * 1000) for phase in columns])
+
+
+    # Diese Methode exportiert die Statistik und die Frames im rollenden Fenster als JSON-Datei (in ms):
+    def export_json(self, path: str) -> None:
+        data = {
+            'stats': self.stats(),
+            'frames': [{phase: duration * 1000 for (phase, duration) in f.items()} for f in self.frames]
+        }
+        with open(path, 'w') as file:
+            json.dump(data, file, indent=4)
+
+
+# Funktionen
+
+# Diese Funktion gibt ein Perzentil (0 bis 100) einer aufsteigend sortierten, nicht leeren Liste nach dem Nearest-Rank-Verfahren
+# zurück:
+def nearest_rank(values: list[float], p: float) -> float:
+    return values[min(len(values) - 1, max(0, math.ceil(p / 100 * len(values)) - 1))]
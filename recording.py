@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import struct
+
+# Eigene Imports
+
+from autosave import write_atomic
+
+
+# Dieses Modul speichert die Eingabe eines Spiels Tick für Tick, damit es später genau gleich nachgespielt werden kann (s.
+# replay.py). Weil alle zufälligen Entscheidungen einer Spielwelt mit ihrem eigenen Zufallsgenerator getroffen werden, genügen
+# dafür der Startwert („seed“) und die Eingabe jedes Ticks. Die Eingabe eines Ticks ist ein Byte, in dem jede Taste ein Bit hat.
+#
+# Eine Datei besteht aus einem Kopf (Kennung, Version, Optionen der Spielwelt, Startwert, Highscore und Anzahl der Ticks) und
+# danach aus lauflängenkodierten Eingaben: Jedes Paar aus zwei Bytes steht für eine Eingabe und wie viele Ticks hintereinander
+# (1 bis 255) sie gleich geblieben ist. Da sich die Eingabe meist nur alle paar Ticks ändert, belegt eine Minute Spiel so nur
+# wenige hundert Bytes.
+
+
+# Konstanten
+
+MAGIC = b'ASTR' # die Kennung am Anfang jeder Datei
+VERSION = 2 # die Version des Formats (2: Kugeln treffen entlang ihres ganzen Wegs, ältere Aufzeichnungen verlaufen anders)
+HEADER = struct.Struct('<4sHBqqQ') # Kennung, Version, Optionen, Startwert, Highscore, Anzahl der Ticks
+MAX_RUN = 255 # wie viele Ticks ein Paar höchstens zusammenfasst
+
+# die Bits der Eingabe eines Ticks:
+THRUST_BIT = 1
+LEFT_BIT = 2
+RIGHT_BIT = 4
+FIRE_BIT = 8
+BANK_POINTS_BIT = 16 # vor diesem Tick wurden die hinzukommenden Punkte zur Punktzahl addiert (beim Öffnen des Pausenmenüs)
+
+ASTEROID_ARRAYS_OPTION = 1 # die Spielwelt speichert die Asteroiden in NumPy-Arrays
+
+
+# Klassen
+
+# Dieser Fehler wird ausgelöst, wenn eine Datei keine gültige Aufzeichnung ist:
+class RecordingError(ValueError):
+    pass
+
+
+# Diese Klasse enthält die Aufzeichnung eines Spiels: den Startwert der Spielwelt und die Eingabe jedes Ticks:
+class Recording:
+
+    def __init__(self, seed: int, high_score: int = 0, asteroid_arrays: bool = False, masks: bytearray | None = None) -> None:
+        self.seed = seed # der Startwert des Zufallsgenerators der Spielwelt
+        self.high_score = high_score # der Highscore, der zu Beginn des Spiels zu schlagen war
+        self.asteroid_arrays = asteroid_arrays # ob die Spielwelt die Asteroiden in NumPy-Arrays gespeichert hat
+        self.masks = bytearray() if masks is None else masks # die Eingaben (ein Byte pro Tick)
+        self.bank_pending = False # ob die Punkte seit dem letzten Tick zur Punktzahl addiert wurden
+
+
+    # Diese Methode gibt die Anzahl der aufgezeichneten Ticks zurück:
+    def __len__(self) -> int:
+        return len(self.masks)
+
+
+    # Diese Methode zeichnet die Eingabe eines Ticks auf:
+    def append(self, mask: int) -> None:
+        if self.bank_pending:
+            mask |= BANK_POINTS_BIT
+            self.bank_pending = False
+        self.masks.append(mask)
+
+
+    # Diese Methode merkt sich, dass die hinzukommenden Punkte zur Punktzahl addiert wurden. Das wird mit dem nächsten Tick
+    # aufgezeichnet, weil zwischen zwei Ticks sonst nichts mit der Spielwelt geschieht:
+    def bank_points(self) -> None:
+        self.bank_pending = True
+
+
+    # Diese Methode gibt die Aufzeichnung als Bytes zurück:
+    def to_bytes(self) -> bytes:
+        options = ASTEROID_ARRAYS_OPTION if self.asteroid_arrays else 0
+        parts = [HEADER.pack(MAGIC, VERSION, options, self.seed, self.high_score, len(self.masks))]
+        runs = bytearray()
+        masks = self.masks
+        i = 0
+        while i < len(masks):
+            mask = masks[i]
+            start = i
+            while i < len(masks) and masks[i] == mask and i - start < MAX_RUN:
+                i += 1
+            runs.append(mask)
+            runs.append(i - start)
+        parts.append(bytes(runs))
+        return b''.join(parts)
+
+
+    # Diese Methode liest eine Aufzeichnung aus Bytes:
+    @staticmethod
+    def from_bytes(data: bytes) -> Recording:
+        if len(data) < HEADER.size:
+            raise RecordingError('file is too short')
+        (magic, version, options, seed, high_score, ticks) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise RecordingError('not a recording')
+        if version != VERSION:
+            raise RecordingError('unsupported recording version %d' % version)
+        runs = data[HEADER.size:]
+        if len(runs) % 2 != 0:
+            raise RecordingError('truncated recording')
+        masks = bytearray()
+        for i in range(0, len(runs), 2):
+            masks += bytes((runs[i],)) * runs[i + 1]
+        if len(masks) != ticks:
+            raise RecordingError('expected %d ticks, found %d' % (ticks, len(masks)))
+        return Recording(seed, high_score, bool(options & ASTEROID_ARRAYS_OPTION), masks)
+
+
+# Funktionen
+
+# Diese Funktion speichert eine Aufzeichnung in einer Datei (atomar, s. autosave.write_atomic()):
+def save_recording(path: str, recording: Recording) -> None:
+    write_atomic(path, recording.to_bytes())
+
+
+# Diese Funktion lädt eine Aufzeichnung aus einer Datei:
+def load_recording(path: str) -> Recording:
+    with open(path, 'rb') as file:
+        return Recording.from_bytes(file.read())
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import argparse
+import pygame
+
+from typing import Callable
+
+# Eigene Imports
+
+import asteroids
+import headless
+import sounds
+
+from asteroids import GameWorld, HighScore, PlayerInput
+from dirty_rects import present
+from headless import SimulationResult
+from profiler import FrameProfiler
+from recording import Recording, load_recording
+from sprites import SpriteCache
+
+
+# Dieses Modul spielt eine Aufzeichnung (s. recording.py) nach. Ohne Fenster werden die Ticks so schnell berechnet, wie die CPU
+# es erlaubt (z. B. um einen gemeldeten langsamen Frame mit dem Profiler nachzustellen), mit Fenster wird das Spiel in einer
+# beliebigen Geschwindigkeit angezeigt. Weil die Spielwelt mit demselben Startwert und derselben Eingabe genau gleich verläuft,
+# entspricht jeder Tick dem aufgezeichneten Spiel. Nachgespielte Spiele sind stumm.
+
+
+# Funktionen
+
+# Diese Funktion gibt ein Skript zurück, das für jeden Tick die aufgezeichnete Eingabe liefert (s. headless.simulate()):
+def recorded_script(recording: Recording) -> Callable[[int], PlayerInput]:
+    inputs = [PlayerInput.from_mask(mask) for mask in recording.masks]
+    return lambda tick: inputs[tick]
+
+
+# Diese Funktion spielt eine Aufzeichnung ohne Fenster nach:
+def replay_headless(recording: Recording, profiler: FrameProfiler | None = None) -> SimulationResult:
+    headless.init()
+    return headless.simulate(len(recording), recorded_script(recording), asteroid_arrays=recording.asteroid_arrays,
+                             seed=recording.seed, profiler=profiler)
+
+
+# Diese Funktion spielt eine Aufzeichnung in einem Fenster nach. „speed“ gibt an, wie viele Ticks pro Frame berechnet werden
+# (z. B. 0.25 für Zeitlupe oder 8 für achtfache Geschwindigkeit). Mit Escape oder dem Schließen des Fensters wird abgebrochen:
+def replay_window(recording: Recording, speed: float = 1.0) -> None:
+    pygame.init()
+    pygame.font.init()
+    sounds.init_silent()
+    asteroids.init_constants()
+    asteroids.init_fonts()
+    asteroids.init_hud()
+    screen = pygame.display.set_mode(asteroids.SIZE)
+    pygame.display.set_caption('Asteroids (Replay)')
+
+    world = GameWorld(high_score=recording.high_score, asteroid_arrays=recording.asteroid_arrays, seed=recording.seed)
+    if asteroids.ASTEROID_SPRITES:
+        world.sprite_cache = SpriteCache(asteroids.SPRITE_CACHE_BYTES, asteroids.SPRITE_ROTATION_STEPS)
+    world.new_game()
+    # die Spielwelt so einsetzen, als würde sie gerade gespielt (ohne geöffnetes Menü):
+    asteroids.world = world
+    asteroids.opened_menu = None
+    asteroids.high_scores = [HighScore(recording.high_score, 0)] if recording.high_score > 0 else []
+
+    script = recorded_script(recording)
+    clock = pygame.time.Clock()
+    tick = 0
+    pending = 0.0 # wie viele Ticks noch berechnet werden müssen
+    running = True
+    while running and tick < len(recording):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+        pending += speed
+        while pending >= 1 and tick < len(recording):
+            world.step(script(tick))
+            tick += 1
+            pending -= 1
+        asteroids.render(screen)
+        present(asteroids.dirty_rects)
+        clock.tick(asteroids.FPS)
+    pygame.quit()
+
+
+# Die main()-Funktion
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Replays a recorded game of Asteroids.')
+    parser.add_argument('file', nargs='?', default=asteroids.REPLAY_FILE, help='the recording (default: %(default)s)')
+    parser.add_argument('--speed', type=float, default=1.0, help='ticks per frame when replaying in a window')
+    parser.add_argument('--headless', action='store_true', help='replay without a window as fast as possible')
+    parser.add_argument('--profile', action='store_true', help='time each phase of a tick and print percentiles (headless)')
+    parser.add_argument('--trace', help='also export the per-tick phase timings to this .csv or .json file (headless)')
+    args = parser.parse_args()
+    if args.speed <= 0:
+        parser.error('--speed must be positive')
+
+    recording = load_recording(args.file)
+    if not args.headless:
+        replay_window(recording, args.speed)
+        return
+    profiler = FrameProfiler(window=len(recording)) if args.profile or args.trace else None
+    result = replay_headless(recording, profiler)
+    print('%d ticks in %.3f s (%.0f ticks/s), score %d, survived %d ticks%s' % (
+        result.ticks, result.seconds, result.ticks_per_second(), result.score, result.playing_ticks,
+        ', game over' if result.game_over else ''))
+    if profiler is not None:
+        print('\n'.join(profiler.report_lines()))
+        if args.trace is not None:
+            if args.trace.endswith('.json'):
+                profiler.export_json(args.trace)
+            else:
+                profiler.export_csv(args.trace)
+
+
+# Aufruf der main()-Funktion:
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import struct
+import sys
+
+from array import array
+
+
+# Dieses Modul liest und schreibt Spielstände in einem kompakten Binärformat. Eine Datei besteht aus einem kleinen Kopf (Kennung
+# und Version) und danach aus Abschnitten. Jeder Abschnitt ist ein Array aus 64-Bit-Gleitkommazahlen oder 64-Bit-Ganzzahlen,
+# dem seine Länge vorangestellt ist. Die Arrays werden mit array.tobytes() und array.frombytes() am Stück geschrieben und
+# gelesen; welche Abschnitte in welcher Reihenfolge vorkommen, legt asteroids.py fest.
+
+
+# Konstanten
+
+MAGIC = b'ASTS' # die Kennung am Anfang jeder Datei
+VERSION = 1 # die Version des Formats (wird erhöht, wenn sich die Abschnitte ändern)
+HEADER = struct.Struct('<4sH') # Kennung und Version
+LENGTH = struct.Struct('<Q') # die Länge eines Abschnitts
+SWAP = sys.byteorder == 'big' # Die Arrays werden immer im Little-Endian-Format gespeichert
+
+
+# Klassen
+
+# Dieser Fehler wird ausgelöst, wenn eine Datei kein gültiger Spielstand ist:
+class SnapshotError(ValueError):
+    pass
+
+
+# Diese Klasse setzt einen Spielstand aus Abschnitten zusammen:
+class SnapshotWriter:
+
+    def __init__(self) -> None:
+        self.parts = [HEADER.pack(MAGIC, VERSION)]
+
+
+    # Diese Methode hängt einen Abschnitt aus Gleitkommazahlen an:
+    def floats(self, values) -> None:
+        self.__append(array('d', values))
+
+
+    # Diese Methode hängt einen Abschnitt aus Ganzzahlen an:
+    def ints(self, values) -> None:
+        self.__append(array('q', values))
+
+
+    # Diese Methode gibt den ganzen Spielstand als Bytes zurück:
+    def to_bytes(self) -> bytes:
+        return b''.join(self.parts)
+
+
+    def __append(self, a: array) -> None:
+        if SWAP:
+            a.byteswap()
+        self.parts.append(LENGTH.pack(len(a)))
+        self.parts.append(a.tobytes())
+
+
+# Diese Klasse liest die Abschnitte eines Spielstands in derselben Reihenfolge, in der sie geschrieben wurden:
+class SnapshotReader:
+
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        if len(data) < HEADER.size:
+            raise SnapshotError('file is too short')
+        (magic, version) = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise SnapshotError('not a save file')
+        if version != VERSION:
+            raise SnapshotError('unsupported save file version %d' % version)
+        self.offset = HEADER.size
+
+
+    # Diese Methode liest den nächsten Abschnitt als Gleitkommazahlen:
+    def floats(self) -> array:
+        return self.__read('d')
+
+
+    # Diese Methode liest den nächsten Abschnitt als Ganzzahlen:
+    def ints(self) -> array:
+        return self.__read('q')
+
+
+    def __read(self, typecode: str) -> array:
+        if self.offset + LENGTH.size > len(self.data):
+            raise SnapshotError('file is truncated')
+        (length,) = LENGTH.unpack_from(self.data, self.offset)
+        self.offset += LENGTH.size
+        a = array(typecode)
+        end = self.offset + length * a.itemsize
+        if end > len(self.data):
+            raise SnapshotError('file is truncated')
+        a.frombytes(self.data[self.offset:end])
+        if SWAP:
+            a.byteswap()
+        self.offset = end
+        return a
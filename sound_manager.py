@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import os
+import pygame
+
+from pygame.mixer import Channel, Sound
+
+# Eigene Imports
+
+from autosave import write_atomic
+
+
+# Dieses Modul verwaltet die Kanäle des Soundmixers. Jede Kategorie von Geräuschen (z. B. Effekte, Dauerschleifen, Menüs)
+# bekommt eigene, reservierte Kanäle, damit viele Explosionen nicht den Schub oder den Beat verdrängen. Jedes Geräusch darf
+# höchstens „max_voices“ Kanäle gleichzeitig belegen; darüber hinaus wird seine älteste Stimme neu gestartet. Wird dasselbe
+# Geräusch in einem Tick mehrmals ausgelöst (z. B. wenn viele kleine Asteroiden gleichzeitig gesprengt werden), wird es nur
+# einmal abgespielt. Ein ManagedSound hat dieselben Methoden play() und stop() wie pygame.mixer.Sound, sodass das Spiel nichts
+# davon merkt.
+#
+# Außerdem werden die dekodierten PCM-Daten jeder Datei im Format des Soundmixers zwischengespeichert (s. load_cached()), damit
+# sie beim nächsten Start nicht wieder dekodiert werden müssen.
+
+
+# Klassen
+
+# Diese Klasse ist eine Kategorie von Geräuschen mit ihren reservierten Kanälen:
+class SoundCategory:
+
+    def __init__(self, name: str, channels: list[Channel]) -> None:
+        self.name = name
+        self.channels = channels # die Kanäle, zuletzt gestartete hinten
+        self.stolen = 0 # wie oft ein noch spielender Kanal für ein neues Geräusch genommen wurde
+
+
+    # Diese Methode gibt einen freien Kanal zurück oder, wenn alle belegt sind, den am längsten belegten:
+    def channel(self) -> Channel:
+        channels = self.channels
+        for (i, c) in enumerate(channels):
+            if not c.get_busy():
+                break
+        else:
+            i = 0
+            self.stolen += 1
+        c = channels.pop(i)
+        channels.append(c)
+        return c
+
+
+# Diese Klasse ist ein Geräusch, das über einen SoundManager abgespielt wird:
+class ManagedSound:
+
+    def __init__(self, manager: SoundManager, sound: Sound, category: SoundCategory, max_voices: int) -> None:
+        self.manager = manager
+        self.sound = sound
+        self.category = category
+        self.max_voices = max_voices # wie viele Kanäle dieses Geräusch höchstens gleichzeitig belegt
+        self.voices: list[Channel] = [] # die Kanäle, auf denen dieses Geräusch zuletzt gestartet wurde (älteste vorne)
+        self.last_tick = -1 # in welchem Tick dieses Geräusch zuletzt gestartet wurde
+
+
+    # Diese Methode spielt das Geräusch ab („loops“ wie bei pygame.mixer.Sound.play(), -1 für eine Dauerschleife):
+    def play(self, loops: int = 0) -> None:
+        manager = self.manager
+        if self.last_tick == manager.tick:
+            manager.coalesced += 1 # in diesem Tick schon gestartet
+            return
+        self.last_tick = manager.tick
+        sound = self.sound
+        voices = self.voices
+        # die Kanäle entfernen, auf denen dieses Geräusch nicht mehr spielt:
+        if len(voices) > 0:
+            voices[:] = [c for c in voices if c.get_sound() is sound]
+        if len(voices) >= self.max_voices:
+            channel = voices.pop(0) # die älteste Stimme neu starten
+            manager.limited += 1
+        else:
+            channel = self.category.channel()
+        channel.play(sound, loops)
+        voices.append(channel)
+        manager.played += 1
+
+
+    # Diese Methode beendet das Geräusch auf allen Kanälen:
+    def stop(self) -> None:
+        self.sound.stop()
+        self.voices.clear()
+        self.last_tick = -1 # nach dem Beenden darf es im selben Tick wieder gestartet werden
+
+
+# Diese Klasse verteilt die Kanäle des Soundmixers auf die Kategorien und zählt die Ticks, in denen Geräusche zusammengefasst
+# werden. Sie darf erst konstruiert werden, wenn der Soundmixer initialisiert ist:
+class SoundManager:
+
+    def __init__(self, categories: dict[str, int]) -> None:
+        count = sum(categories.values())
+        pygame.mixer.set_num_channels(count)
+        pygame.mixer.set_reserved(count) # alle Kanäle reservieren, damit pygame keinen davon selbst vergibt
+        self.categories: dict[str, SoundCategory] = {}
+        first = 0
+        for (name, channels) in categories.items():
+            self.categories[name] = SoundCategory(name, [Channel(i) for i in range(first, first + channels)])
+            first += channels
+        self.tick = 0 # der aktuelle Tick (s. next_tick())
+        self.played = 0 # wie oft ein Geräusch gestartet wurde
+        self.coalesced = 0 # wie oft ein Geräusch nicht gestartet wurde, weil es im selben Tick schon gestartet wurde
+        self.limited = 0 # wie oft die älteste Stimme eines Geräuschs neu gestartet wurde
+
+
+    # Diese Methode gibt ein Geräusch zurück, das in der Kategorie „category“ mit höchstens „max_voices“ Stimmen abgespielt wird:
+    def add(self, sound: Sound, category: str, max_voices: int = 1) -> ManagedSound:
+        return ManagedSound(self, sound, self.categories[category], max_voices)
+
+
+    # Diese Methode beginnt einen neuen Tick, muss also einmal pro Tick aufgerufen werden:
+    def next_tick(self) -> None:
+        self.tick += 1
+
+
+    # Diese Methode gibt zurück, wie oft in allen Kategorien ein noch spielender Kanal genommen wurde:
+    def stolen(self) -> int:
+        return sum(c.stolen for c in self.categories.values())
+
+
+# Funktionen
+
+# Diese Funktion lädt eine Sounddatei. Liegen im Ordner „cache_dir“ schon ihre PCM-Daten im aktuellen Format des Soundmixers
+# (und sind sie nicht älter als die Datei), werden diese genommen, sonst wird die Datei dekodiert und ihre PCM-Daten werden
+# dort gespeichert:
+def load_cached(path: str, cache_dir: str | None) -> Sound:
+    if cache_dir is None:
+        return Sound(path)
+    (frequency, size, channels) = pygame.mixer.get_init()
+    cache = os.path.join(cache_dir, '%s.%d.%d.%d.pcm' % (os.path.basename(path), frequency, size, channels))
+    try:
+        if os.path.getmtime(cache) >= os.path.getmtime(path):
+            with open(cache, 'rb') as file:
+                return Sound(buffer=file.read())
+    except OSError:
+        pass # noch nicht zwischengespeichert
+    sound = Sound(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        write_atomic(cache, sound.get_raw())
+    except OSError:
+        pass # Ohne Zwischenspeicher wird die Datei beim nächsten Start wieder dekodiert
+    return sound
@@ -1,34 +1,118 @@
-from pygame.mixer import Sound
+from __future__ import annotations
 
+import pygame
+import threading
+import time
 
-FIRE: Sound # das Geräusch, das abgespielt wird, wenn der Spieler eine Kugel schießt
-THRUST: Sound # das Geräusch des Schubs des Spielers
-BANGSMALL: Sound # das Geräusch, das abgespielt wird, wenn ein kleiner Asteroid gesprengt wird
-BANGMEDIUM: Sound
-BANGLARGE: Sound
-SAUCERSMALL: Sound
-SAUCERBIG: Sound
-BEAT1: Sound
-BEAT2: Sound
-MENU_SELECT: Sound
-MENU_ACTION: Sound
+from sound_manager import ManagedSound, SoundManager, load_cached
 
 
+# Die Geräusche werden auf einem Hintergrund-Thread geladen (s. init()), damit das erste Bild nicht auf das Öffnen des
+# Soundmixers und das Dekodieren der Dateien warten muss. Bis sie geladen sind, fehlen die Variablen unten in diesem Modul; wird
+# eine davon vorher gelesen, wartet __getattr__() auf den Thread. Danach sind es normale Variablen, die beim Zugriff nichts kosten.
+# Abgespielt werden die Geräusche über einen SoundManager (s. sound_manager.py), der die Kanäle verteilt.
+
+FIRE: ManagedSound # das Geräusch, das abgespielt wird, wenn der Spieler eine Kugel schießt
+THRUST: ManagedSound # das Geräusch des Schubs des Spielers
+BANGSMALL: ManagedSound # das Geräusch, das abgespielt wird, wenn ein kleiner Asteroid gesprengt wird
+BANGMEDIUM: ManagedSound
+BANGLARGE: ManagedSound
+SAUCERSMALL: ManagedSound
+SAUCERBIG: ManagedSound
+BEAT1: ManagedSound
+BEAT2: ManagedSound
+MENU_SELECT: ManagedSound
+MENU_ACTION: ManagedSound
+
+# die Kategorien der Geräusche und wie viele Kanäle jede bekommt:
+CHANNELS = {
+    'effects': 8, # Schüsse und Explosionen
+    'loops': 3, # die Geräusche in Dauerschleife (Schub und fliegende Untertassen)
+    'beat': 1,
+    'menu': 2
+}
+
+# die Geräusche (Name der Variablen -> Datei im Ordner „sound“, Kategorie, wie viele Stimmen höchstens gleichzeitig spielen):
+FILES = {
+    'FIRE': ('fire.wav', 'effects', 3),
+    'THRUST': ('thrust.wav', 'loops', 1),
+    'BANGSMALL': ('bangsmall.wav', 'effects', 3),
+    'BANGMEDIUM': ('bangmedium.wav', 'effects', 2),
+    'BANGLARGE': ('banglarge.wav', 'effects', 2),
+    'SAUCERSMALL': ('saucersmall.wav', 'loops', 1),
+    'SAUCERBIG': ('saucerbig.wav', 'loops', 1),
+    'BEAT1': ('beat1.wav', 'beat', 1),
+    'BEAT2': ('beat2.wav', 'beat', 1),
+    'MENU_SELECT': ('menu_select.mp3', 'menu', 1),
+    'MENU_ACTION': ('menu_action.mp3', 'menu', 1)
+}
+
+PCM_CACHE = 'sound/cache' # der Ordner, in dem die dekodierten PCM-Daten zwischengespeichert werden (None für keinen)
+
+loader: threading.Thread | None = None # der Thread, der den Soundmixer öffnet und die Geräusche lädt
+load_seconds: float | None = None # wie lange der Thread dafür gebraucht hat (None, solange er noch läuft)
+manager: SoundManager | None = None # verteilt die Kanäle (None ohne Soundmixer)
+
+
+# Öffnet den Soundmixer und lädt die Geräusche auf einem Hintergrund-Thread:
 def init():
+    global loader
+    loader = threading.Thread(target=load_all, name='sound loader', daemon=True)
+    loader.start()
+
+
+# Läuft auf dem Hintergrund-Thread. Ohne Soundgerät (oder wenn eine Datei fehlt) wird stumm weitergespielt:
+def load_all():
+    global load_seconds, manager
+    start = time.perf_counter()
+    try:
+        pygame.mixer.init()
+        new_manager = SoundManager(CHANNELS)
+        loaded = {name: new_manager.add(load_sound(filename), category, max_voices)
+                  for (name, (filename, category, max_voices)) in FILES.items()}
+    except (pygame.error, OSError):
+        init_silent()
+    else:
+        globals().update(loaded) # alle Geräusche auf einmal zuweisen
+        manager = new_manager
+    load_seconds = time.perf_counter() - start
+
+
+# Beginnt einen neuen Tick: Geräusche, die im selben Tick mehrmals ausgelöst werden, werden nur einmal abgespielt:
+def next_tick():
+    if manager is not None:
+        manager.next_tick()
+
+
+# Wartet, bis der Hintergrund-Thread fertig ist (z. B. bevor der Soundmixer beendet wird):
+def wait():
+    if loader is not None:
+        loader.join()
+
+
+# Wird nur für Variablen aufgerufen, die es (noch) nicht gibt, also nur für Geräusche, die noch geladen werden:
+def __getattr__(name):
+    if name in FILES and loader is not None:
+        wait()
+        return globals()[name]
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
+# Ohne Soundmixer (z. B. in der Headless-Simulation) werden alle Geräusche durch stumme Geräusche ersetzt:
+def init_silent():
     global FIRE, THRUST, BANGSMALL, BANGMEDIUM, BANGLARGE, SAUCERSMALL, SAUCERBIG, BEAT1, BEAT2, MENU_SELECT, MENU_ACTION
-    FIRE = load_sound('fire.wav')
-    THRUST = load_sound('thrust.wav')
-    BANGSMALL = load_sound('bangsmall.wav')
-    BANGMEDIUM = load_sound('bangmedium.wav')
-    BANGLARGE = load_sound('banglarge.wav')
-    SAUCERSMALL = load_sound('saucersmall.wav')
-    SAUCERBIG = load_sound('saucerbig.wav')
-    BEAT1 = load_sound('beat1.wav')
-    BEAT2 = load_sound('beat2.wav')
-    MENU_SELECT = load_sound('menu_select.mp3')
-    MENU_ACTION = load_sound('menu_action.mp3')
+    FIRE = THRUST = BANGSMALL = BANGMEDIUM = BANGLARGE = SAUCERSMALL = SAUCERBIG = BEAT1 = BEAT2 = MENU_SELECT = MENU_ACTION = SilentSound()
+
+
+# Ein Geräusch, das nichts abspielt:
+class SilentSound:
+
+    def play(self, loops=0):
+        pass
+
+    def stop(self):
+        pass
 
 
 def load_sound(filename):
-    with open('sound/' + filename) as f:
-        return Sound(f)
\ No newline at end of file
+    return load_cached('sound/' + filename, PCM_CACHE)
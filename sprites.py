@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import math
+import pygame
+
+from collections import OrderedDict
+from typing import Callable
+
+
+# Dieses Modul rastert Umrisse, deren Form sich nie verändert (z. B. die von Asteroiden), einmal in Oberflächen (Sprites) und
+# blittet danach nur noch diese. Die Drehung wird dafür in ROTATION_STEPS Stufen quantisiert; für jede Form und jede Stufe, die
+# tatsächlich vorkommt, gibt es ein Sprite. Die Sprites liegen in einem LRU-Cache, dessen Speicher nach oben begrenzt ist: Ist
+# er voll, fliegen die am längsten nicht mehr benutzten Sprites (meist die von Asteroiden, die es nicht mehr gibt) heraus.
+#
+# Die Sprites haben das Pixelformat des Bildschirms und Schwarz als RLE-kodierte Colorkey-Farbe. Beim Blitten werden dadurch
+# nur die Pixel des Umrisses kopiert, was deutlich schneller ist als das Zeichnen mit pygame.draw.lines(). Ein neues Sprite zu
+# rastern kostet dagegen ein Vielfaches davon; der Cache lohnt sich also nur, wenn sich die Drehung langsam genug ändert, dass
+# ein Sprite über mehrere Frames wiederverwendet wird (s. ROTATION_STEPS).
+
+
+# Konstanten
+
+# in wie viele Stufen eine volle Drehung unterteilt wird. Mehr Stufen drehen flüssiger, aber jedes Sprite wird seltener
+# wiederverwendet (ein großer Asteroid braucht bei 32 Stufen im Schnitt etwa eine halbe Sekunde für eine Stufe; bei 64 Stufen
+# werden schon so viele Sprites neu gerastert, dass das Zeichnen kaum schneller ist als mit pygame.draw.lines()):
+ROTATION_STEPS = 32
+MAX_BYTES = 32 * 1024 * 1024 # wie viel Speicher die Sprites höchstens belegen dürfen (32 MiB)
+COLORKEY = (0, 0, 0) # die Farbe, die beim Blitten durchsichtig ist
+
+
+# Klassen
+
+# Diese Klasse speichert gerasterte Umrisse in quantisierten Drehungen in einem LRU-Cache mit begrenztem Speicher:
+class SpriteCache:
+
+    def __init__(self, max_bytes: int = MAX_BYTES, rotation_steps: int = ROTATION_STEPS) -> None:
+        self.max_bytes = max_bytes
+        self.rotation_steps = rotation_steps
+        self.step_angle = 2 * math.pi / rotation_steps # der Winkel einer Stufe
+        # die Sprites ((Form, Stufe) -> (Oberfläche, x und y der Mitte im Sprite)), das zuletzt benutzte hinten:
+        self.sprites: OrderedDict[tuple[int, int], tuple[pygame.Surface, int, int]] = OrderedDict()
+        self.bytes = 0 # der Speicher, den die Sprites gerade belegen (ohne RLE-Kompression gerechnet, also eine obere Grenze)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    # Diese Methode gibt das Sprite einer Form in der Stufe zurück, die dem Winkel „angle“ am nächsten liegt, und dazu die Position
+    # der Mitte des Umrisses im Sprite. „angle“ ist der Winkel der ersten Ecke. „corners“ liefert die Polarkoordinaten (Winkel,
+    # Radius) der Ecken und wird nur aufgerufen, wenn das Sprite noch gerastert werden muss. „screen“ gibt das Pixelformat vor:
+    def get(self, shape: int, angle: float, stroke_weight: int, corners: Callable[[], list[tuple[float, float]]],
+            screen: pygame.Surface) -> tuple[pygame.Surface, int, int]:
+        key = (shape, round(angle / self.step_angle) % self.rotation_steps)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return sprite
+        self.misses += 1
+        sprite = rasterize(corners(), key[1] * self.step_angle, stroke_weight, screen)
+        self.sprites[key] = sprite
+        self.bytes += surface_bytes(sprite[0])
+        while self.bytes > self.max_bytes and len(self.sprites) > 1:
+            (_, (surface, _, _)) = self.sprites.popitem(last=False) # das am längsten nicht benutzte Sprite entfernen
+            self.bytes -= surface_bytes(surface)
+            self.evictions += 1
+        return sprite
+
+
+    # Diese Methode entfernt alle Sprites:
+    def clear(self) -> None:
+        self.sprites.clear()
+        self.bytes = 0
+
+
+# Funktionen
+
+# Diese Funktion rastert einen Umriss so, dass seine erste Ecke im Winkel „angle“ liegt, und gibt das Sprite und die Position der
+# Mitte im Sprite zurück. Das Sprite ist nur so groß wie das Rechteck um den gedrehten Umriss (samt seiner Dicke), damit das
+# Anlegen und das RLE-Kodieren beim ersten Blitten möglichst wenige Pixel betreffen:
+def rasterize(corners: list[tuple[float, float]], angle: float, stroke_weight: int,
+              screen: pygame.Surface) -> tuple[pygame.Surface, int, int]:
+    rotation = angle - corners[0][0] # um diesen Winkel wird jede Ecke gedreht
+    points = [(r * math.cos(t + rotation), r * math.sin(t + rotation)) for (t, r) in corners]
+    # die Mitte so in das Sprite legen, dass links und oben Platz für die Dicke des Umrisses bleibt:
+    x = stroke_weight + 1 - math.floor(min(p[0] for p in points))
+    y = stroke_weight + 1 - math.floor(min(p[1] for p in points))
+    width = x + math.ceil(max(p[0] for p in points)) + stroke_weight + 2
+    height = y + math.ceil(max(p[1] for p in points)) + stroke_weight + 2
+    surface = pygame.Surface((width, height), 0, screen) # eine neue Oberfläche ist schwarz
+    pygame.draw.lines(surface, (255, 255, 255), True, [(px + x, py + y) for (px, py) in points], stroke_weight)
+    surface.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return (surface, x, y)
+
+
+# Diese Funktion gibt zurück, wie viele Bytes die Pixel einer Oberfläche unkomprimiert belegen:
+def surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+# Fremde Imports
+
+import time
+
+
+# Dieses Modul misst die Phasen des Programmstarts von main() bis zum ersten angezeigten Bild (z. B. das Laden der
+# Schriftarten, des Spielstands und der Menüs), damit die Zeit bis zum ersten Bild von Version zu Version verfolgt werden kann.
+# Was auf Hintergrund-Threads geladen wird (wie die Geräusche, s. sounds.py), gehört nicht dazu.
+
+
+# Klassen
+
+# Diese Klasse misst die Dauer der Phasen des Programmstarts:
+class StartupTimer:
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter() # wann der Programmstart begonnen hat
+        self.last = self.start # wann die letzte Phase beendet wurde
+        self.phases: list[tuple[str, float]] = [] # die gemessenen Phasen (Name, Dauer in Sekunden)
+
+
+    # Diese Methode beendet die aktuelle Phase und speichert ihre Dauer unter „name“:
+    def lap(self, name: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+
+    # Diese Methode gibt zurück, wie viele Sekunden vom Start bis zum Ende der letzten Phase vergangen sind:
+    def elapsed(self) -> float:
+        return self.last - self.start
+
+
+    # Diese Methode gibt die Dauern aller Phasen und die Gesamtdauer als Textzeilen zurück:
+    def report_lines(self) -> list[str]:
+        lines = ['%-16s %8.2f ms' % (name, seconds * 1000) for (name, seconds) in self.phases]
+        lines.append('%-16s %8.2f ms' % ('total', self.elapsed() * 1000))
+        return lines